@@ -0,0 +1,39 @@
+"""
+Wall time of ``GridPresentation.add_slides`` for a chart deck with an increasing number of worker processes.
+The speedup is bounded by the number of cores and by merging the rendered slides, which happens in this process.
+
+    PYTHONPATH=. python benchmarks/bench_add_slides.py [n_slides] [workers ...]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, LineChart, ColumnChart
+
+if __name__ == '__main__':  # pragma: no cover
+    n_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    worker_counts = [int(_) for _ in sys.argv[2:]] or [1, 2, 4, 8, 16]
+
+    rng = np.random.default_rng(0)
+    dfs = [(pd.DataFrame(rng.random((24, 2)), columns=['a', 'b']),
+            pd.DataFrame(rng.random((6, 3)), columns=['a', 'b', 'c'])) for _ in range(n_slides)]
+
+    print(f'cores: {os.cpu_count()}')
+    print(f'{"workers":>8} {"seconds":>10} {"speedup":>10}')
+    baseline = None
+    for workers in worker_counts:
+        # built components hold python-pptx objects, so every run gets new designs
+        designs = [Row(12,
+                       Column(4, Text(text=f'slide {i}')),
+                       Column(4, LineChart(df=line_df, title='line')),
+                       Column(4, ColumnChart(df=bar_df, title='bar')))
+                   for i, (line_df, bar_df) in enumerate(dfs)]
+        start = time.perf_counter()
+        GridPresentation().add_slides(designs, workers=workers)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f'{workers:>8} {seconds:>10.1f} {baseline / seconds:>10.2f}')
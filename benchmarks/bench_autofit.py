@@ -0,0 +1,35 @@
+"""
+Auto-fit table rendering time: a Table at a fixed font size, versus ``autofit=True`` with a cold font cache (font
+files indexed and parsed, every cell text measured) and with a warm one (widths memoized by an earlier render).
+
+    PYTHONPATH=. python benchmarks/bench_autofit.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.components import Table
+from grid_pptx.fonts import fonts
+
+
+def render(df: pd.DataFrame, autofit: bool) -> float:
+    p = GridPresentation()
+    start = time.perf_counter()
+    p.add_slide(design=Row(12, Table(df=df, autofit=autofit, minimize_height=True)))
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':  # pragma: no cover
+    words = np.array(['lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit'])
+    print(f'{"rows x cols":>12} {"fixed s":>9} {"cold s":>9} {"warm s":>9}')
+    for n_rows, n_cols in [(20, 5), (200, 10), (1000, 10)]:
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.choice(words, (n_rows, n_cols))).astype(object)
+        df.iloc[:, 0] = [' '.join(rng.choice(words, 6)) for _ in range(n_rows)]  # one column that wraps
+        fixed = render(df, False)
+        fonts.clear()
+        cold = render(df, True)
+        warm = render(df, True)
+        print(f'{f"{n_rows} x {n_cols}":>12} {fixed:>9.3f} {cold:>9.3f} {warm:>9.3f}')
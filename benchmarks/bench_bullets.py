@@ -0,0 +1,55 @@
+"""
+Bulleted list throughput (paragraphs per second): adding each paragraph through python-pptx (level, run, font and
+bullet set one call at a time), versus ``Bullets`` writing all of them in one XML pass.
+
+    PYTHONPATH=. python benchmarks/bench_bullets.py
+"""
+import time
+
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches, Pt
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.components import Bullets
+from grid_pptx.components.text import bullet_chars, outline
+
+
+def per_paragraph(items: list) -> float:
+    p = GridPresentation()
+    start = time.perf_counter()
+    slide = p.prs.slides.add_slide(p.prs.slide_layouts[6])
+    tf = slide.shapes.add_shape(MSO_AUTO_SHAPE_TYPE.RECTANGLE, 0, 0, Inches(10), Inches(7)).text_frame
+    paragraphs = outline(items)
+    for i, (level, text) in enumerate(paragraphs):
+        paragraph = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        paragraph.level = level
+        pPr = paragraph._p.get_or_add_pPr()
+        pPr.set('marL', str((level + 1) * Inches(0.25)))
+        pPr.set('indent', str(-Inches(0.25)))
+        pPr.append(parse_xml(f'<a:buFont {nsdecls("a")} typeface="Arial"/>'))
+        pPr.append(parse_xml(f'<a:buChar {nsdecls("a")} char="{bullet_chars[level % len(bullet_chars)]}"/>'))
+        run = paragraph.add_run()
+        run.text = text
+        run.font.size = Pt(16)
+        run.font.bold = False
+        run.font.color.rgb = RGBColor(0, 0, 0)
+    return len(paragraphs) / (time.perf_counter() - start)
+
+
+def bulk(items: list) -> float:
+    p = GridPresentation()
+    start = time.perf_counter()
+    p.add_slide(design=Row(12, Bullets(items=items)))
+    return len(outline(items)) / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print(f'{"paragraphs":>10} {"per-paragraph/s":>16} {"bulk/s":>10} {"speedup x":>10}')
+    for n in [12, 100, 1000]:
+        items = [[f'point {i}', [f'detail {i}.{j}' for j in range(3)]] for i in range(n // 4)]
+        items = [_ for pair in items for _ in pair]
+        per_paragraph_rate, bulk_rate = per_paragraph(items), bulk(items)
+        print(f'{n:>10} {per_paragraph_rate:>16,.0f} {bulk_rate:>10,.0f} {bulk_rate / per_paragraph_rate:>10.1f}')
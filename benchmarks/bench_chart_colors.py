@@ -0,0 +1,51 @@
+"""
+Colored bar chart throughput (points per second): rendering a BarChart and then colouring each point through
+python-pptx's ``point.format.fill``, versus rendering it with a ``colormap``.
+
+    PYTHONPATH=. python benchmarks/bench_chart_colors.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pptx.dml.color import RGBColor
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.components import BarChart, ConditionalFill
+from grid_pptx.components.conditional import rgb
+
+
+def per_point(df: pd.DataFrame) -> float:
+    p = GridPresentation(workbook='none')
+    start = time.perf_counter()
+    c = BarChart(df=df, title='chart')
+    p.add_slide(design=Row(12, c))
+
+    low, high = np.array(rgb('#F8696B')), np.array(rgb('#63BE7B'))
+    vmin, vmax = df.min().min(), df.max().max()
+    for series, column in zip(c.chart.plots[0].series, df.columns):
+        for point, value in zip(series.points, df[column].tolist()):
+            weight = (value - vmin) / (vmax - vmin)
+            point.format.fill.solid()
+            color = np.rint(low * (1 - weight) + high * weight).astype(int).tolist()
+            point.format.fill.fore_color.rgb = RGBColor(*color)
+    return df.size / (time.perf_counter() - start)
+
+
+def bulk(df: pd.DataFrame) -> float:
+    p = GridPresentation(workbook='none')
+    start = time.perf_counter()
+    fill = ConditionalFill(colors=('#F8696B', '#63BE7B'))
+    p.add_slide(design=Row(12, BarChart(df=df, title='chart', colormap=fill)))
+    return df.size / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print(f'{"points x series":>16} {"per-point pts/s":>16} {"bulk pts/s":>12} {"speedup x":>10}')
+    for n_points, n_series in [(20, 2), (200, 3), (1000, 3), (5000, 2)]:
+        df = pd.DataFrame(np.random.default_rng(0).random((n_points, n_series)).round(2))
+        df.columns = [f's{_}' for _ in df.columns]
+        per_point_rate, bulk_rate = per_point(df), bulk(df)
+        print(f'{f"{n_points} x {n_series}":>16} {per_point_rate:>16,.0f} {bulk_rate:>12,.0f} '
+              f'{bulk_rate / per_point_rate:>10.0f}')
@@ -0,0 +1,37 @@
+"""
+Build many charts in a row and report peak RSS and per-chart build time, so that growth caused by chart data
+leaking between charts shows up as a slope instead of a flat line.
+
+    PYTHONPATH=. python benchmarks/bench_chart_data.py [n_charts]
+"""
+import sys
+import time
+import resource
+
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.components import LineChart
+
+
+def rss_mb() -> float:
+    # ru_maxrss is reported in KB on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+if __name__ == '__main__':  # pragma: no cover
+    n_charts = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    checkpoints = {1, 10, 100, 1000, 2500, 5000, 7500, 10000, n_charts}
+
+    df = pd.DataFrame({'a': range(12), 'b': range(12, 0, -1), 'c': range(12)})
+
+    # one chart per deck keeps package bookkeeping out of the measurement
+    print(f'{"chart":>8} {"ms/chart":>10} {"rss MB":>10}')
+    for i in range(1, n_charts + 1):
+        start = time.perf_counter()
+        p = GridPresentation()
+        p.add_slide(design=Row(12, LineChart(df=df, title='chart')))
+        elapsed = time.perf_counter() - start
+
+        if i in checkpoints:
+            print(f'{i:>8} {elapsed * 1000:>10.2f} {rss_mb():>10.1f}')
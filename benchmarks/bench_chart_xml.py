@@ -0,0 +1,36 @@
+"""
+Compare chart XML throughput (points per second) of python-pptx's CategoryChartData with ArrayCategoryChartData.
+The python-pptx path is quadratic in the number of points, so it is skipped above ``PPTX_MAX_POINTS``.
+
+    PYTHONPATH=. python benchmarks/bench_chart_xml.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+
+from grid_pptx.components.chartdata import ArrayCategoryChartData
+
+PPTX_MAX_POINTS = 20000
+
+
+def points_per_second(cls, df: pd.DataFrame) -> float:
+    start = time.perf_counter()
+    chart_data = cls()
+    chart_data.categories = df.index
+    for column in df.columns:
+        chart_data.add_series(column, df[column])
+    chart_data.xml_bytes(XL_CHART_TYPE.LINE)
+    return df.size / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print(f'{"points":>10} {"python-pptx pts/s":>20} {"array pts/s":>15}')
+    for n_points in [1000, 5000, 20000, 50000, 200000]:
+        df = pd.DataFrame({'a': np.random.rand(n_points), 'b': np.random.rand(n_points)})
+        pptx_rate = points_per_second(CategoryChartData, df) if n_points <= PPTX_MAX_POINTS else float('nan')
+        array_rate = points_per_second(ArrayCategoryChartData, df)
+        print(f'{df.size:>10} {pptx_rate:>20,.0f} {array_rate:>15,.0f}')
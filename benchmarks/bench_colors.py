@@ -0,0 +1,28 @@
+"""
+Time to resolve colors: parsing each color every time it is used versus the cached ``parse_color``.
+
+    PYTHONPATH=. python benchmarks/bench_colors.py [n_lookups]
+"""
+import sys
+import time
+
+from grid_pptx.colors import _parse_color, css4_colors, parse_color
+
+if __name__ == '__main__':  # pragma: no cover
+    n_lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    values = (list(css4_colors) + list(css4_colors.values()) + ['accent 1', 'text1', (70, 130, 180)]) * 4
+    values = (values * (n_lookups // len(values) + 1))[:n_lookups]
+
+    start = time.perf_counter()
+    for value in values:
+        _parse_color.__wrapped__(value)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for value in values:
+        parse_color(value)
+    cached = time.perf_counter() - start
+
+    print(f'{"lookups":>10} {"uncached/s":>12} {"cached/s":>12} {"speedup":>8}')
+    print(f'{n_lookups:>10} {n_lookups / uncached:>12,.0f} {n_lookups / cached:>12,.0f} {uncached / cached:>8.1f}')
+    print(_parse_color.cache_info())
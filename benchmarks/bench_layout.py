@@ -0,0 +1,44 @@
+"""
+Time spent laying out a design (no python-pptx calls), looking the layout up in the cache, and rendering its
+panels onto a slide.
+
+    PYTHONPATH=. python benchmarks/bench_layout.py [n_leaves]
+"""
+import sys
+import time
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text
+from grid_pptx.design import layouts
+
+
+def grid(n_leaves: int) -> Row:
+    """ A column of rows of 4 text panels each """
+    n_rows = max(n_leaves // 4, 1)
+    return Row(12, Column(12, *[Row(1, *[Column(3, Text(text=f'{i}.{j}')) for j in range(4)])
+                                for i in range(n_rows)]))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    n_leaves = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    p = GridPresentation()
+    design = grid(n_leaves)
+
+    layout_s = cached_s = float('inf')
+    for _ in range(5):  # best of 5, as garbage collection of the many component objects adds noise
+        layouts.clear()
+        start = time.perf_counter()
+        table = design.layout(p.prs.slide_width, p.prs.slide_height)
+        layout_s = min(layout_s, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        design.layout(p.prs.slide_width, p.prs.slide_height)
+        cached_s = min(cached_s, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    p.add_slide(design=design)
+    build_s = time.perf_counter() - start
+
+    print(f'{"leaves":>8} {"layout ms":>10} {"cached ms":>10} {"build ms":>10}')
+    print(f'{len(table):>8} {layout_s * 1000:>10.2f} {cached_s * 1000:>10.2f} {build_s * 1000:>10.2f}')
@@ -0,0 +1,52 @@
+"""
+Layout and build time for very wide and very deep designs: a grid of ~10k nodes and a chain of Rows and Columns
+nested 500 deep (more than Python's default recursion limit allows for a recursive traversal).
+
+    PYTHONPATH=. python benchmarks/bench_layout_stress.py [n_nodes] [depth]
+"""
+import sys
+import time
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text
+from grid_pptx.design import layouts
+
+
+def wide(n_nodes: int) -> Row:
+    """ A column of rows of 4 text panels each; every row adds 5 Row/Column nodes """
+    return Row(12, Column(12, *[Row(1, *[Column(3, Text(text=f'{i}.{j}')) for j in range(4)])
+                                for i in range(max(n_nodes // 5, 1))]))
+
+
+def deep(depth: int) -> Row:
+    """ Rows and Columns nested *depth* levels, each Row holding a text panel next to the next level """
+    design = Row(12, Text(text='leaf'))
+    for i in range(depth // 2):
+        design = Row(12, Column(6, Text(text=str(i))), Column(6, design))
+    return design
+
+
+def run(name: str, design: Row) -> None:
+    p = GridPresentation()
+
+    layout_s = float('inf')
+    for _ in range(3):
+        layouts.clear()
+        start = time.perf_counter()
+        table = design.layout(p.prs.slide_width, p.prs.slide_height)
+        layout_s = min(layout_s, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    p.add_slide(design=design)
+    build_s = time.perf_counter() - start
+
+    print(f'{name:>10} {len(table):>8} {table["depth"].max():>6} {layout_s * 1000:>10.1f} {build_s:>10.2f}')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print(f'{"design":>10} {"leaves":>8} {"depth":>6} {"layout ms":>10} {"build s":>10}')
+    run('wide', wide(n_nodes))
+    run('deep', deep(depth))
@@ -0,0 +1,52 @@
+"""
+Throughput (values per second) of formatting table columns as currency, percentages and thousands: a row-wise
+Python loop with f-strings versus ``format_column``.
+
+    PYTHONPATH=. python benchmarks/bench_number_format.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx.components import ColumnFormat
+from grid_pptx.components.numberformat import format_column
+
+formats = {
+    'revenue': ColumnFormat(precision=2, thousands=True, prefix='$', negative_parentheses=True),
+    'share': ColumnFormat(precision=1, percent=True, na_rep='-'),
+    'units': ColumnFormat(thousands=True),
+}
+
+
+def python_row(row) -> list:
+    revenue = f'${abs(row.revenue):,.2f}'
+    return [
+        f'({revenue})' if row.revenue < 0 else revenue,
+        '-' if np.isnan(row.share) else f'{row.share:.1%}',
+        f'{row.units:,.0f}',
+    ]
+
+
+def values_per_second(df: pd.DataFrame) -> tuple:
+    start = time.perf_counter()
+    [python_row(_) for _ in df.itertuples()]
+    row_wise = df.size / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    [format_column(df[column], fmt) for column, fmt in formats.items()]
+    column_wise = df.size / (time.perf_counter() - start)
+    return row_wise, column_wise
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print(f'{"values":>10} {"row-wise values/s":>20} {"column-wise values/s":>22} {"speedup x":>10}')
+    for n_rows in [1000, 10000, 100000, 1000000]:
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            'revenue': rng.normal(0, 1e6, n_rows),
+            'share': np.where(rng.random(n_rows) < 0.05, np.nan, rng.random(n_rows)),
+            'units': rng.integers(0, 10 ** 7, n_rows),
+        })
+        row_wise, column_wise = values_per_second(df)
+        print(f'{df.size:>10} {row_wise:>20,.0f} {column_wise:>22,.0f} {column_wise / row_wise:>10.1f}')
@@ -0,0 +1,44 @@
+"""
+Save wall time against file size for each zip compression mode, on a chart-heavy deck built once.
+
+    PYTHONPATH=. python benchmarks/bench_save.py [n_slides]
+"""
+import io
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, LineChart
+
+modes = {
+    'python-pptx': None,
+    'stored': dict(compression='stored'),
+    'deflate-1': dict(compresslevel=1),
+    'deflate-6': dict(compresslevel=6),
+    'deflate-9': dict(compresslevel=9),
+    'deflate-6 x4': dict(compresslevel=6, workers=4),
+    'deflate-1 x4': dict(compresslevel=1, workers=4),
+}
+
+if __name__ == '__main__':  # pragma: no cover
+    n_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    rng = np.random.default_rng(0)
+    p = GridPresentation()
+    for i in range(n_slides):
+        df = pd.DataFrame(rng.random((200, 3)), columns=['a', 'b', 'c'])
+        p.add_slide(design=Row(12, Column(4, Text(text=str(i))), Column(8, LineChart(df=df, title='chart'))))
+
+    print(f'{"mode":>14} {"save s":>10} {"size MB":>10}')
+    for mode, options in modes.items():
+        start = time.perf_counter()
+        if options is None:
+            out = io.BytesIO()
+            p.prs.save(out)
+            size = len(out.getvalue())
+        else:
+            size = len(p.save_bytes(**options))
+        print(f'{mode:>14} {time.perf_counter() - start:>10.2f} {size / 2 ** 20:>10.2f}')
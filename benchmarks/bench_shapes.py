@@ -0,0 +1,30 @@
+"""
+Slide build time for a heatmap-like grid of Text panels, from 100 to 10,000 shapes on one slide. With shape ids
+allocated in O(1) the time per shape stays flat.
+
+    PYTHONPATH=. python benchmarks/bench_shapes.py [n_shapes ...]
+"""
+import sys
+import time
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text
+
+
+def heatmap(n_shapes: int) -> Row:
+    """ A column of rows of 10 text cells """
+    return Row(12, Column(12, *[Row(1, *[Column(1, Text(text=str(i * 10 + j))) for j in range(10)])
+                                for i in range(max(n_shapes // 10, 1))]))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sizes = [int(_) for _ in sys.argv[1:]] or [100, 300, 1000, 3000, 10000]
+
+    print(f'{"shapes":>8} {"build s":>10} {"us/shape":>10}')
+    for n_shapes in sizes:
+        design = heatmap(n_shapes)
+        p = GridPresentation()
+        start = time.perf_counter()
+        p.add_slide(design=design)
+        seconds = time.perf_counter() - start
+        print(f'{n_shapes:>8} {seconds:>10.2f} {seconds / n_shapes * 1e6:>10.0f}')
@@ -0,0 +1,31 @@
+"""
+Time per slide while appending up to 20k text+chart slides to one deck. With partnames, slide ids and rIds taken
+from counters the time per slide stays flat as the deck grows.
+
+    PYTHONPATH=. python benchmarks/bench_slides.py [n_slides]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, LineChart
+
+if __name__ == '__main__':  # pragma: no cover
+    n_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    checkpoints = [_ for _ in [100, 1000, 2000, 5000, 10000, 20000] if _ < n_slides] + [n_slides]
+
+    df = pd.DataFrame({'a': range(12), 'b': range(12, 0, -1)})
+    design = Row(12, Column(4, Text(text='text')), Column(8, LineChart(df=df, title='chart')))
+    p = GridPresentation(workbook='none')
+
+    print(f'{"slides":>8} {"total s":>10} {"ms/slide":>10}')
+    start = last = time.perf_counter()
+    done = 0
+    for checkpoint in checkpoints:
+        for _ in range(checkpoint - done):
+            p.add_slide(design=design)
+        now = time.perf_counter()
+        print(f'{checkpoint:>8} {now - start:>10.1f} {(now - last) / (checkpoint - done) * 1000:>10.2f}')
+        done, last = checkpoint, now
@@ -0,0 +1,48 @@
+"""
+Peak memory of building and saving decks of 1k, 5k and 10k text+chart slides, with and without streaming.
+Each run happens in a fresh process so its peak RSS is not hidden by earlier runs.
+
+    PYTHONPATH=. python benchmarks/bench_streaming.py [n_slides ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import resource
+import multiprocessing
+
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, LineChart
+
+
+def run(n_slides: int, stream: bool, results: multiprocessing.Queue) -> None:
+    df = pd.DataFrame({'a': range(24), 'b': range(24, 0, -1)})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'deck.pptx')
+
+        start = time.perf_counter()
+        p = GridPresentation(stream=out if stream else None)
+        for i in range(n_slides):
+            p.add_slide(design=Row(12, Column(4, Text(text=str(i))), Column(8, LineChart(df=df, title='chart'))))
+        p.save(out)
+
+        rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        results.put((time.perf_counter() - start, rss_mb, os.path.getsize(out) / 2 ** 20))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sizes = [int(_) for _ in sys.argv[1:]] or [1000, 5000, 10000]
+
+    print(f'{"slides":>8} {"mode":>10} {"seconds":>10} {"peak MB":>10} {"file MB":>10}')
+    for n_slides in sizes:
+        for stream in [False, True]:
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(target=run, args=(n_slides, stream, results))
+            process.start()
+            seconds, rss_mb, file_mb = results.get()
+            process.join()
+            mode = 'stream' if stream else 'in-memory'
+            print(f'{n_slides:>8} {mode:>10} {seconds:>10.1f} {rss_mb:>10.1f} {file_mb:>10.1f}')
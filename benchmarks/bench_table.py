@@ -0,0 +1,58 @@
+"""
+Table population throughput (cells per second): filling each cell through python-pptx, as ``Table`` did with
+``df.iterrows()``, versus writing all rows as one XML string. The per-cell path is skipped above
+``PER_CELL_MAX_CELLS``.
+
+    PYTHONPATH=. python benchmarks/bench_table.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pptx.util import Inches, Pt
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.components import Table
+
+# filling cells through python-pptx gets slower as the table grows, so larger tables are only timed in bulk
+PER_CELL_MAX_CELLS = 20000
+
+
+def per_cell(df: pd.DataFrame, fontsize: int = 14) -> float:
+    prs = GridPresentation().prs
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+
+    start = time.perf_counter()
+    table = slide.shapes.add_table(len(df.index) + 1, len(df.columns), 0, 0, Inches(10), Inches(0.5)).table
+    for i, val in enumerate(df.columns):
+        table.cell(0, i).text = df.columns[i]
+    for row_count, (index, row) in enumerate(df.iterrows(), start=1):
+        for j, value in enumerate(row):
+            table.cell(row_count, j).text = str(value)
+            try:
+                table.cell(row_count, j).text_frame.paragraphs[0].runs[0].font.size = Pt(fontsize)
+            except IndexError:
+                pass
+    return df.size / (time.perf_counter() - start)
+
+
+def bulk(df: pd.DataFrame) -> float:
+    p = GridPresentation()
+    start = time.perf_counter()
+    p.add_slide(design=Row(12, Table(df=df)))
+    return df.size / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print(f'{"rows x cols":>12} {"per-cell cells/s":>18} {"bulk cells/s":>15} {"speedup x":>10}')
+    for n_rows, n_cols in [(20, 5), (200, 20), (1000, 20), (5000, 20), (20000, 20)]:
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.random((n_rows, n_cols)), columns=[f'col {_}' for _ in range(n_cols)])
+        df[df.columns[0]] = [f'label {_}' for _ in range(n_rows)]
+        df[df.columns[1]] = rng.integers(0, 1000, n_rows)
+        df.iloc[::7, 0] = ''
+        per_cell_rate = per_cell(df) if df.size <= PER_CELL_MAX_CELLS else float('nan')
+        bulk_rate = bulk(df)
+        size = f'{n_rows} x {n_cols}'
+        print(f'{size:>12} {per_cell_rate:>18,.0f} {bulk_rate:>15,.0f} {bulk_rate / per_cell_rate:>10.0f}')
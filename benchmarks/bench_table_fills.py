@@ -0,0 +1,49 @@
+"""
+Heatmap table throughput (cells per second): rendering a Table and then colouring each cell through python-pptx's
+``cell.fill``, versus rendering it with ``conditional_fill``.
+
+    PYTHONPATH=. python benchmarks/bench_table_fills.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from pptx.dml.color import RGBColor
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.components import Table, ConditionalFill
+from grid_pptx.components.conditional import rgb
+
+
+def per_cell(df: pd.DataFrame) -> float:
+    p = GridPresentation()
+    start = time.perf_counter()
+    gridslide = p.add_slide(design=Row(12, Table(df=df)))
+    table = [_ for _ in gridslide.slide.shapes if _.has_table][0].table
+
+    low, high = np.array(rgb('#F8696B')), np.array(rgb('#63BE7B'))
+    vmin, vmax = df.min().min(), df.max().max()
+    for i, row in enumerate(df.itertuples(index=False), start=1):
+        for j, value in enumerate(row):
+            weight = (value - vmin) / (vmax - vmin)
+            cell = table.cell(i, j)
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = RGBColor(*np.rint(low * (1 - weight) + high * weight).astype(int).tolist())
+    return df.size / (time.perf_counter() - start)
+
+
+def bulk(df: pd.DataFrame) -> float:
+    p = GridPresentation()
+    start = time.perf_counter()
+    p.add_slide(design=Row(12, Table(df=df, conditional_fill=ConditionalFill(colors=('#F8696B', '#63BE7B')))))
+    return df.size / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print(f'{"rows x cols":>12} {"per-cell cells/s":>18} {"bulk cells/s":>15} {"speedup x":>10}')
+    for n_rows, n_cols in [(20, 5), (200, 20), (1000, 20)]:
+        df = pd.DataFrame(np.random.default_rng(0).random((n_rows, n_cols)).round(2))
+        per_cell_rate, bulk_rate = per_cell(df), bulk(df)
+        size = f'{n_rows} x {n_cols}'
+        print(f'{size:>12} {per_cell_rate:>18,.0f} {bulk_rate:>15,.0f} {bulk_rate / per_cell_rate:>10.0f}')
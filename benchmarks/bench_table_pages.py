@@ -0,0 +1,49 @@
+"""
+Time and peak memory of a paginated table of 10k, 50k and 200k rows streamed into continuation slides. Each run
+happens in a fresh process so its peak RSS is not hidden by earlier runs.
+
+    PYTHONPATH=. python benchmarks/bench_table_pages.py [n_rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import resource
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.components import Table
+
+
+def run(n_rows: int, results: multiprocessing.Queue) -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((n_rows, 8)), columns=[f'col {_}' for _ in range(8)])
+    baseline_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'deck.pptx')
+
+        start = time.perf_counter()
+        p = GridPresentation(stream=out)
+        first = p.add_slide(design=Row(12, Table(df=df, fontsize=10, paginate=True)), title='export')
+        p.save()
+
+        rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        results.put((time.perf_counter() - start, 1 + len(first.continuations), rss_mb - baseline_mb,
+                     os.path.getsize(out) / 2 ** 20))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sizes = [int(_) for _ in sys.argv[1:]] or [10000, 50000, 200000]
+
+    print(f'{"rows":>8} {"slides":>8} {"seconds":>10} {"peak MB over df":>16} {"file MB":>10}')
+    for n_rows in sizes:
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(target=run, args=(n_rows, results))
+        process.start()
+        seconds, n_slides, rss_mb, file_mb = results.get()
+        process.join()
+        print(f'{n_rows:>8} {n_slides:>8} {seconds:>10.1f} {rss_mb:>16.1f} {file_mb:>10.1f}')
@@ -0,0 +1,34 @@
+"""
+Time to open a template for a new deck: parsing it with ``pptx.Presentation`` versus cloning the cached parse.
+Pass the path of a large template (e.g. a corporate template with theme media) to see the effect at scale.
+
+    PYTHONPATH=. python benchmarks/bench_template.py [template.pptx] [n_decks]
+"""
+import os
+import sys
+import time
+
+from pptx import Presentation
+
+from grid_pptx.template import TemplateCache
+
+if __name__ == '__main__':  # pragma: no cover
+    template = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), '..', 'examples',
+                                                                  'greenblue.pptx')
+    n_decks = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    start = time.perf_counter()
+    for _ in range(n_decks):
+        Presentation(template)
+    parsed = (time.perf_counter() - start) / n_decks
+
+    cache = TemplateCache()
+    cache.presentation(template)
+    start = time.perf_counter()
+    for _ in range(n_decks):
+        cache.presentation(template)
+    cloned = (time.perf_counter() - start) / n_decks
+
+    print(f'template: {template} ({os.path.getsize(template) / 2 ** 20:.1f} MB)')
+    print(f'{"parse ms/deck":>15} {"clone ms/deck":>15} {"saved ms/deck":>15}')
+    print(f'{parsed * 1000:>15.2f} {cloned * 1000:>15.2f} {(parsed - cloned) * 1000:>15.2f}')
@@ -0,0 +1,54 @@
+"""
+Cost of tracing: time per ``span`` while tracing is off and on, and the time to render a deck of chart and table
+slides without tracing, with it, and with it exporting to JSON lines and Chrome trace files.
+
+    PYTHONPATH=. python benchmarks/bench_tracing.py
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row, tracing
+from grid_pptx.components import ColumnChart, Table, Text
+
+
+def per_span(n: int = 200_000) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        with tracing.span('phase'):
+            pass
+    return (time.perf_counter() - start) / n
+
+
+def deck(df: pd.DataFrame, n_slides: int = 20) -> float:
+    start = time.perf_counter()
+    p = GridPresentation()
+    for i in range(n_slides):
+        design = Row(12, Row(6, ColumnChart(df=df, title=f'chart {i}')), Row(6, Table(df=df.head(10))),
+                     Row(12, Text(text=f'slide {i}')))
+        p.add_slide(design=design, title=f'slide {i}')
+    p.save_bytes()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':  # pragma: no cover
+    df = pd.DataFrame(np.random.default_rng(0).random((50, 4)).round(3), columns=list('abcd'))
+    off = per_span()
+    with tracing.trace():
+        on = per_span()
+    print(f'span: {off * 1e9:,.0f} ns off, {on * 1e9:,.0f} ns on')
+
+    deck(df)  # warm up the template and layout caches
+    untraced = deck(df)
+    with tracing.trace() as tracer:
+        traced = deck(df)
+    with tempfile.TemporaryDirectory() as tmp:
+        with tracing.trace(tracing.JsonLinesExporter(os.path.join(tmp, 'deck.jsonl')),
+                           tracing.ChromeExporter(os.path.join(tmp, 'deck.json'))):
+            exported = deck(df)
+    print(f'deck ({len(tracer.spans)} spans): {untraced:.3f} s off, {traced:.3f} s on, {exported:.3f} s exported')
+    for name, seconds in sorted(tracer.totals().items(), key=lambda _: -_[1]):
+        print(f'{name:>16} {seconds:>8.3f} s')
@@ -0,0 +1,37 @@
+"""
+Build time and file size of a chart-heavy deck under each chart workbook policy ('embed', 'none', 'dedupe').
+Half of the charts reuse one of a handful of DataFrames so that 'dedupe' has something to share.
+
+    PYTHONPATH=. python benchmarks/bench_workbook.py [n_charts]
+"""
+import io
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import ColumnChart
+
+if __name__ == '__main__':  # pragma: no cover
+    n_charts = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    rng = np.random.default_rng(0)
+    shared = [pd.DataFrame(rng.random((24, 3)), columns=['a', 'b', 'c']) for _ in range(5)]
+    dfs = [shared[i % 5] if i % 2 else pd.DataFrame(rng.random((24, 3)), columns=['a', 'b', 'c'])
+           for i in range(n_charts)]
+
+    print(f'{"policy":>8} {"build s":>10} {"save s":>10} {"size MB":>10}')
+    for policy in ['embed', 'none', 'dedupe']:
+        start = time.perf_counter()
+        p = GridPresentation(workbook=policy)
+        for i in range(0, n_charts, 4):
+            p.add_slide(design=Row(12, *[Column(3, ColumnChart(df=df, title='chart')) for df in dfs[i:i + 4]]))
+        built = time.perf_counter()
+
+        out = io.BytesIO()
+        p.save(out)
+        saved = time.perf_counter()
+
+        print(f'{policy:>8} {built - start:>10.2f} {saved - built:>10.2f} {len(out.getvalue()) / 2 ** 20:>10.2f}')
@@ -1,4 +1,36 @@
-from .slide import GridSlide
-from .presentation import GridPresentation
-from .design import Row, Column
+"""
+Submodules are imported when one of their names is first used (PEP 562), so ``import grid_pptx`` does not pay for
+python-pptx, NumPy or pandas until they are needed.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import importlib
+
 from .colors import colors
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .slide import GridSlide
+    from .presentation import GridPresentation
+    from .design import Row, Column
+
+# public name -> submodule defining it
+_submodules = {
+    'GridSlide': 'slide',
+    'GridPresentation': 'presentation',
+    'Row': 'design',
+    'Column': 'design',
+}
+
+__all__ = [*_submodules, 'colors']
+
+
+def __getattr__(name: str):
+    if name not in _submodules:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{_submodules[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *__all__})
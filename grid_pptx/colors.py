@@ -1,11 +1,286 @@
 """
-A module level docstring
+Color names, hex strings, RGB tuples and theme colors.
+
+The names and values are the CSS Color Module Level 4 keywords (the same set as matplotlib's ``CSS4_COLORS``), kept
+here as a static table so that neither matplotlib nor python-pptx is imported with this module. ``colors`` is a
+read-only mapping that creates the ``RGBColor`` of a name the first time it is looked up.
+
+``parse_color`` resolves any color a component accepts into a ``Color``, which sets itself on a python-pptx
+``ColorFormat`` (e.g. ``shape.fill.fore_color``). Results are kept in a bounded LRU cache, and components resolve
+their colors when they are created, so rendering the same colors on thousands of shapes does not parse them again.
 """
+from __future__ import annotations
+from typing import Union
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+import numbers
+import re
+
+css4_colors = {
+    'aliceblue': '#F0F8FF',
+    'antiquewhite': '#FAEBD7',
+    'aqua': '#00FFFF',
+    'aquamarine': '#7FFFD4',
+    'azure': '#F0FFFF',
+    'beige': '#F5F5DC',
+    'bisque': '#FFE4C4',
+    'black': '#000000',
+    'blanchedalmond': '#FFEBCD',
+    'blue': '#0000FF',
+    'blueviolet': '#8A2BE2',
+    'brown': '#A52A2A',
+    'burlywood': '#DEB887',
+    'cadetblue': '#5F9EA0',
+    'chartreuse': '#7FFF00',
+    'chocolate': '#D2691E',
+    'coral': '#FF7F50',
+    'cornflowerblue': '#6495ED',
+    'cornsilk': '#FFF8DC',
+    'crimson': '#DC143C',
+    'cyan': '#00FFFF',
+    'darkblue': '#00008B',
+    'darkcyan': '#008B8B',
+    'darkgoldenrod': '#B8860B',
+    'darkgray': '#A9A9A9',
+    'darkgreen': '#006400',
+    'darkgrey': '#A9A9A9',
+    'darkkhaki': '#BDB76B',
+    'darkmagenta': '#8B008B',
+    'darkolivegreen': '#556B2F',
+    'darkorange': '#FF8C00',
+    'darkorchid': '#9932CC',
+    'darkred': '#8B0000',
+    'darksalmon': '#E9967A',
+    'darkseagreen': '#8FBC8F',
+    'darkslateblue': '#483D8B',
+    'darkslategray': '#2F4F4F',
+    'darkslategrey': '#2F4F4F',
+    'darkturquoise': '#00CED1',
+    'darkviolet': '#9400D3',
+    'deeppink': '#FF1493',
+    'deepskyblue': '#00BFFF',
+    'dimgray': '#696969',
+    'dimgrey': '#696969',
+    'dodgerblue': '#1E90FF',
+    'firebrick': '#B22222',
+    'floralwhite': '#FFFAF0',
+    'forestgreen': '#228B22',
+    'fuchsia': '#FF00FF',
+    'gainsboro': '#DCDCDC',
+    'ghostwhite': '#F8F8FF',
+    'gold': '#FFD700',
+    'goldenrod': '#DAA520',
+    'gray': '#808080',
+    'green': '#008000',
+    'greenyellow': '#ADFF2F',
+    'grey': '#808080',
+    'honeydew': '#F0FFF0',
+    'hotpink': '#FF69B4',
+    'indianred': '#CD5C5C',
+    'indigo': '#4B0082',
+    'ivory': '#FFFFF0',
+    'khaki': '#F0E68C',
+    'lavender': '#E6E6FA',
+    'lavenderblush': '#FFF0F5',
+    'lawngreen': '#7CFC00',
+    'lemonchiffon': '#FFFACD',
+    'lightblue': '#ADD8E6',
+    'lightcoral': '#F08080',
+    'lightcyan': '#E0FFFF',
+    'lightgoldenrodyellow': '#FAFAD2',
+    'lightgray': '#D3D3D3',
+    'lightgreen': '#90EE90',
+    'lightgrey': '#D3D3D3',
+    'lightpink': '#FFB6C1',
+    'lightsalmon': '#FFA07A',
+    'lightseagreen': '#20B2AA',
+    'lightskyblue': '#87CEFA',
+    'lightslategray': '#778899',
+    'lightslategrey': '#778899',
+    'lightsteelblue': '#B0C4DE',
+    'lightyellow': '#FFFFE0',
+    'lime': '#00FF00',
+    'limegreen': '#32CD32',
+    'linen': '#FAF0E6',
+    'magenta': '#FF00FF',
+    'maroon': '#800000',
+    'mediumaquamarine': '#66CDAA',
+    'mediumblue': '#0000CD',
+    'mediumorchid': '#BA55D3',
+    'mediumpurple': '#9370DB',
+    'mediumseagreen': '#3CB371',
+    'mediumslateblue': '#7B68EE',
+    'mediumspringgreen': '#00FA9A',
+    'mediumturquoise': '#48D1CC',
+    'mediumvioletred': '#C71585',
+    'midnightblue': '#191970',
+    'mintcream': '#F5FFFA',
+    'mistyrose': '#FFE4E1',
+    'moccasin': '#FFE4B5',
+    'navajowhite': '#FFDEAD',
+    'navy': '#000080',
+    'oldlace': '#FDF5E6',
+    'olive': '#808000',
+    'olivedrab': '#6B8E23',
+    'orange': '#FFA500',
+    'orangered': '#FF4500',
+    'orchid': '#DA70D6',
+    'palegoldenrod': '#EEE8AA',
+    'palegreen': '#98FB98',
+    'paleturquoise': '#AFEEEE',
+    'palevioletred': '#DB7093',
+    'papayawhip': '#FFEFD5',
+    'peachpuff': '#FFDAB9',
+    'peru': '#CD853F',
+    'pink': '#FFC0CB',
+    'plum': '#DDA0DD',
+    'powderblue': '#B0E0E6',
+    'purple': '#800080',
+    'rebeccapurple': '#663399',
+    'red': '#FF0000',
+    'rosybrown': '#BC8F8F',
+    'royalblue': '#4169E1',
+    'saddlebrown': '#8B4513',
+    'salmon': '#FA8072',
+    'sandybrown': '#F4A460',
+    'seagreen': '#2E8B57',
+    'seashell': '#FFF5EE',
+    'sienna': '#A0522D',
+    'silver': '#C0C0C0',
+    'skyblue': '#87CEEB',
+    'slateblue': '#6A5ACD',
+    'slategray': '#708090',
+    'slategrey': '#708090',
+    'snow': '#FFFAFA',
+    'springgreen': '#00FF7F',
+    'steelblue': '#4682B4',
+    'tan': '#D2B48C',
+    'teal': '#008080',
+    'thistle': '#D8BFD8',
+    'tomato': '#FF6347',
+    'turquoise': '#40E0D0',
+    'violet': '#EE82EE',
+    'wheat': '#F5DEB3',
+    'white': '#FFFFFF',
+    'whitesmoke': '#F5F5F5',
+    'yellow': '#FFFF00',
+    'yellowgreen': '#9ACD32',
+}
+
+
+class ColorTable(Mapping):
+
+    def __init__(self, table: dict) -> None:
+        """ Read-only mapping of color names to pptx RGBColor
+
+        :param table: '#RRGGBB' hex string of each name
+        """
+        self.table = table
+        self.rgb = {}
+
+    def __getitem__(self, name: str):
+        rgb = self.rgb.get(name)
+        if rgb is None:
+            # imported here so that importing grid_pptx does not import python-pptx
+            from pptx.dml.color import RGBColor
+
+            rgb = self.rgb[name] = RGBColor.from_string(self.table[name][1:])
+        return rgb
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+colors = ColorTable(css4_colors)
+
+# names of python-pptx's MSO_THEME_COLOR members that refer to a color of the theme
+theme_colors = {
+    'ACCENT_1', 'ACCENT_2', 'ACCENT_3', 'ACCENT_4', 'ACCENT_5', 'ACCENT_6', 'BACKGROUND_1', 'BACKGROUND_2',
+    'DARK_1', 'DARK_2', 'FOLLOWED_HYPERLINK', 'HYPERLINK', 'LIGHT_1', 'LIGHT_2', 'TEXT_1', 'TEXT_2',
+}
+
+_HEX_RE = re.compile(r'#?([0-9a-f]{6})|#([0-9a-f]{3})')
+
+
+@dataclass(frozen=True)
+class Color:
+    """
+    A resolved color: either an RGB value or a theme color, which follows the presentation's theme.
+    """
+
+    rgb: tuple = None  # (r, g, b) integers from 0 to 255
+    theme: str = None  # name of a pptx MSO_THEME_COLOR member, e.g. 'ACCENT_1'
+
+    def apply(self, color_format) -> None:
+        """ Set this color on a python-pptx ColorFormat, e.g. ``shape.fill.fore_color`` or ``font.color``
+
+        :param color_format:
+        :return:
+        """
+        if self.theme is not None:
+            from pptx.enum.dml import MSO_THEME_COLOR
+            color_format.theme_color = getattr(MSO_THEME_COLOR, self.theme)
+        else:
+            from pptx.dml.color import RGBColor
+            color_format.rgb = RGBColor(*self.rgb)
+
+    def xml(self) -> str:
+        """ DrawingML element of this color, ``a:srgbClr`` or ``a:schemeClr``, e.g. to go in an ``a:solidFill``
+
+        :return:
+        """
+        if self.theme is not None:
+            from pptx.enum.dml import MSO_THEME_COLOR
+            return f'<a:schemeClr val="{getattr(MSO_THEME_COLOR, self.theme).xml_value}"/>'
+        return '<a:srgbClr val="%02X%02X%02X"/>' % self.rgb
+
+
+def parse_color(value: Union[str, tuple, Color]) -> Color:
+    """ Resolve a color given as a CSS4 name ('steelblue'), hex string ('#4682B4', '4682B4' or '#48B'), (r, g, b)
+    tuple of 0-255 integers or theme color name ('accent_1', 'Accent 1', 'text1', ...)
+
+    :param value:
+    :return:
+    """
+    if isinstance(value, Color):
+        return value
+    if isinstance(value, list):
+        value = tuple(value)
+    try:
+        return _parse_color(value)
+    except TypeError:  # unhashable
+        raise ValueError(f'Cannot interpret {value!r} as a color.') from None
+
+
+@lru_cache(maxsize=1024)
+def _parse_color(value: Union[str, tuple]) -> Color:
+    if isinstance(value, tuple):
+        if len(value) != 3 or not all(isinstance(_, numbers.Integral) and 0 <= _ <= 255 for _ in value):
+            raise ValueError(f'RGB colors must be three integers from 0 to 255, not {value!r}.')
+        return Color(rgb=tuple(int(_) for _ in value))
+
+    if not isinstance(value, str):
+        raise ValueError(f'Cannot interpret {value!r} as a color.')
+
+    name = value.strip().lower()
+    if name in css4_colors:
+        name = css4_colors[name].lower()
+
+    match = _HEX_RE.fullmatch(name)
+    if match:
+        digits = match[1] or ''.join(_ * 2 for _ in match[2])
+        return Color(rgb=tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4)))
+
+    theme = re.sub(r'(?<=[a-z])(?=\d)', '_', re.sub(r'[\s-]+', '_', name)).upper()
+    if theme in theme_colors:
+        return Color(theme=theme)
 
-import matplotlib.colors as mcolors
-from pptx.dml.color import RGBColor
+    raise ValueError(f'Unknown color {value!r}; expected a CSS color name, hex string, RGB tuple or theme color.')
 
-colors = {name: RGBColor(*[int(_ * 255) for _ in mcolors.hex2color(rgb)]) for name, rgb in mcolors.CSS4_COLORS.items()}
 
 if __name__ == '__main__':  # pragma: no cover
-    print(colors)
+    print(dict(colors))
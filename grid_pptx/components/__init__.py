@@ -1,7 +1,43 @@
-from .chart import (
-    ColumnChart, PieChart, BarChart, AreaChart, LineChart,
-    RadarChart, StockChart, ScatterChart, SurfaceChart, BubbleChart
-)
-from .image import Image
-from .table import Table
-from .text import Text, Footnotes, Bullets
+"""
+Components are imported when first used (PEP 562): ``Text`` does not need pandas, and only charts need python-pptx's
+chart machinery.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .chart import (
+        ColumnChart, PieChart, BarChart, AreaChart, LineChart,
+        RadarChart, StockChart, ScatterChart, SurfaceChart, BubbleChart
+    )
+    from .image import Image
+    from .table import Table
+    from .numberformat import ColumnFormat
+    from .conditional import ConditionalFill
+    from .text import Text, Footnotes, Bullets
+
+# public name -> submodule defining it
+_submodules = {
+    **dict.fromkeys(['ColumnChart', 'PieChart', 'BarChart', 'AreaChart', 'LineChart', 'RadarChart', 'StockChart',
+                     'ScatterChart', 'SurfaceChart', 'BubbleChart'], 'chart'),
+    'Image': 'image',
+    'Table': 'table',
+    'ColumnFormat': 'numberformat',
+    'ConditionalFill': 'conditional',
+    **dict.fromkeys(['Text', 'Footnotes', 'Bullets'], 'text'),
+}
+
+__all__ = list(_submodules)
+
+
+def __getattr__(name: str):
+    if name not in _submodules:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{_submodules[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *__all__})
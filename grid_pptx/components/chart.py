@@ -1,21 +1,31 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Union
 from dataclasses import dataclass, field
+import hashlib
+import warnings
 import pandas as pd
 
 import pptx
-from pptx.chart import axis
 from pptx.chart.data import CategoryChartData, XyChartData, BubbleChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_TICK_MARK, XL_TICK_LABEL_POSITION
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
 from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
 from pptx.util import Pt
 
+from grid_pptx.tracing import span
+from grid_pptx.writer import workbook_policies
+
+from .chartdata import ArrayCategoryChartData
+from .conditional import ConditionalFill
+from .palette import chart_colors, color_by_options, color_chart_xml, resolve_colormap, resolve_palette
 from .panel import _GridPanel, _GridPanelDefaults
 
 # imports for type hints that would normally cause circular imports
 if TYPE_CHECKING:  # pragma: no cover
-    from grid_pptx import GridSlide
+    from grid_pptx import GridSlide, GridPresentation
 
 tick_mark_options = {
     'none': XL_TICK_MARK.NONE,
@@ -35,7 +45,6 @@ tick_label_positions = {
 
 inv_tick_label_positions = {v: k for k, v in tick_label_positions.items()}
 
-
 @dataclass(kw_only=True)
 class _ChartAxis:
     # Options for tick mark placement on either the x or y axes. Values are the constants
@@ -51,30 +60,47 @@ class _ChartAxis:
     tick_label_italic: bool = False
     tick_label_fontsize: int = 16
 
-    # populated later when adding the chart to the pptx slide
-    axis: Union[axis.CategoryAxis, axis.DateAxis, axis.ValueAxis] = None
+    @property
+    def axis(self) -> Union[pptx.chart.axis.CategoryAxis, pptx.chart.axis.ValueAxis, None]:
+        """ Deprecated: the python-pptx axis of the chart most recently rendered for gridchart, see
+        ``_GridChart.chart``
+        """
+        warnings.warn('_ChartAxis.axis is deprecated; get the chart with GridSlide.shape(chart) and use its '
+                      'value_axis or category_axis.', DeprecationWarning, stacklevel=2)
+        chart = self.gridchart._rendered
+        if chart is None or not hasattr(chart, 'value_axis'):
+            return None
+        return chart.value_axis if self.axis_type == 'x' else chart.category_axis
 
-    def add_to_slide(self) -> None:
-        # set self.axis if possible, or raise an exception if axis_type is something other than 'x' or 'y'
+    def add_to_slide(self, chart: pptx.chart.chart.Chart) -> None:
+        """ Apply the axis options to the matching axis of *chart*, the python-pptx chart rendered for gridchart
+
+        :param chart:
+        :return:
+        """
+        # the axis is looked up on each render rather than kept, so the options can be shared by many slides
         if self.axis_type == 'x':
-            self.axis = self.gridchart.chart.value_axis
+            axis = chart.value_axis
         elif self.axis_type == 'y':
-            self.axis = self.gridchart.chart.category_axis
+            axis = chart.category_axis
 
         # set options
-        self.axis.minor_tick_mark = tick_mark_options[self.minor_tick_marks]
-        self.axis.major_tick_mark = tick_mark_options[self.major_tick_marks]
-        self.axis.has_minor_gridlines = self.has_minor_gridlines
-        self.axis.has_major_gridlines = self.has_major_gridlines
-        self.axis.tick_label_position = tick_label_positions[self.tick_label_position]
-        self.axis.tick_labels.font.italic = self.tick_label_italic
-        self.axis.tick_labels.font.size = Pt(self.tick_label_fontsize)
+        axis.minor_tick_mark = tick_mark_options[self.minor_tick_marks]
+        axis.major_tick_mark = tick_mark_options[self.major_tick_marks]
+        axis.has_minor_gridlines = self.has_minor_gridlines
+        axis.has_major_gridlines = self.has_major_gridlines
+        axis.tick_label_position = tick_label_positions[self.tick_label_position]
+        axis.tick_labels.font.italic = self.tick_label_italic
+        axis.tick_labels.font.size = Pt(self.tick_label_fontsize)
 
 
 class NewInitCaller(type):
     """
-    metaclass that overrides the "__call__" function to automatically call "set_chart_dat_type"
-    "prep_chart_data" methods after __init__, even if __init__ has been overridden
+    metaclass that overrides the "__call__" function to automatically call the cheap "add_axes",
+    "set_chart_type", "evaluate_dataframe" and "resolve_colors" methods after __init__, even if __init__ has been
+    overridden.
+    Invalid chart options therefore still raise at construction, while "prep_chart_data" is deferred until
+    the chart is added to a slide.
     """
 
     def __call__(cls, *args, **kwargs):
@@ -82,13 +108,13 @@ class NewInitCaller(type):
         obj = type.__call__(cls, *args, **kwargs)
         obj.add_axes()
         obj.set_chart_type()
-        obj.prep_chart_data()
+        obj.evaluate_dataframe()
+        obj.resolve_colors()
         return obj
 
 
 @dataclass(kw_only=True)
 class _GridChartDefaults(_GridPanelDefaults):
-    chart: pptx.chart.chart.Chart = None
     x_axis: _ChartAxis = None
     y_axis: _ChartAxis = None
 
@@ -96,6 +122,10 @@ class _GridChartDefaults(_GridPanelDefaults):
     title: str = None
     has_legend: bool = True
     smooth_lines: bool = False
+    workbook: str = None  # one of workbook_policies; None uses the GridPresentation's policy
+    palette: Union[str, tuple] = None  # name in palettes or a sequence of colors
+    color_by: str = 'series'  # one of color_by_options
+    colormap: Union[str, ConditionalFill] = None  # name in colormaps or a ConditionalFill
 
 
 @dataclass(kw_only=True)
@@ -106,11 +136,18 @@ class _GridChart(_GridPanel, metaclass=NewInitCaller):
     :param df: Pandas dataframe containing data for the chart.
     :param title:
     :param has_legend:
+    :param palette: colors cycled over the series, or over the categories with ``color_by='category'``. Either the \
+            name of one of the palettes in ``grid_pptx.components.palette`` or a sequence of colors.
+    :param color_by: 'series' or 'category'
+    :param colormap: colors the data points by value, either with the name of one of the colormaps in \
+            ``grid_pptx.components.palette`` or with a ``ConditionalFill``. Only category charts support colormaps.
     """
     df: pd.DataFrame
     chart_type: pptx.enum.chart.XL_CHART_TYPE = field(init=False)  # initialized in subclasses -- here as a placeholder
-    chart_data: Union[CategoryChartData, XyChartData, BubbleChartData] = field(init=False)
-    chart: pptx.chart.chart.Chart
+    chart_data: Union[CategoryChartData, XyChartData, BubbleChartData] = field(init=False, default=None)
+    _chart_data_df: pd.DataFrame = field(init=False, default=None, repr=False)  # df that chart_data was built from
+    # what add_to_slide last returned, only for the deprecated ``chart`` attribute; not pickled
+    _rendered: object = field(init=False, default=None, repr=False, compare=False)
     x_axis: _ChartAxis
     y_axis: _ChartAxis
 
@@ -118,6 +155,10 @@ class _GridChart(_GridPanel, metaclass=NewInitCaller):
     title: str
     has_legend: bool
     smooth_lines: bool
+    workbook: str
+    palette: Union[str, tuple]
+    color_by: str
+    colormap: Union[str, ConditionalFill]
 
     def add_axes(self):
         self.x_axis = _ChartAxis(gridchart=self, axis_type='x')
@@ -126,44 +167,175 @@ class _GridChart(_GridPanel, metaclass=NewInitCaller):
     def evaluate_dataframe(self):
         return None
 
-    def prep_chart_data(self) -> None:
+    def resolve_colors(self) -> None:
+        """ Resolve the palette and colormap, so that invalid colors raise when the chart is created
+
+        :return:
         """
+        if self.color_by not in color_by_options:
+            raise ValueError(f'color_by must be one of {color_by_options}, not {self.color_by!r}.')
+        self.palette = resolve_palette(self.palette)
+        self.colormap = resolve_colormap(self.colormap)
+        if self.colormap is not None and self.chart_data_type is not CategoryChartData:
+            raise ValueError(f'{type(self).__name__} does not support colormaps.')
+
+    def prep_chart_data(self) -> None:
+        """ Build a new chart data object owned by this chart and populate it from ``df``.
+
+        Subclasses set ``chart_data_type`` to the python-pptx chart data class they need. The object is
+        created per chart (never shared at class level) when the chart is first added to a slide.
+        Category charts whose index allows it use ``ArrayCategoryChartData``, which writes the same XML in bulk.
 
         :return:
         """
+        if self.chart_data_type is CategoryChartData and ArrayCategoryChartData.supports(self.df):
+            self.chart_data = ArrayCategoryChartData()
+        else:
+            self.chart_data = self.chart_data_type()
         self.chart_data.categories = self.df.index
         for column in self.df.columns:
             self.chart_data.add_series(column, self.df[column])
 
-    def add_axes_to_slide(self):
-        self.x_axis.add_to_slide()
-        self.y_axis.add_to_slide()
+    def add_axes_to_slide(self, chart: pptx.chart.chart.Chart):
+        self.x_axis.add_to_slide(chart)
+        self.y_axis.add_to_slide(chart)
+
+    def add_to_slide(self, gridslide: GridSlide,
+                     rect: tuple = None) -> Union[pptx.chart.chart.Chart, pptx.shapes.autoshape.Shape]:
+        """ Add the chart to *gridslide*
+
+        The python-pptx chart is returned (and available from ``GridSlide.shape``) rather than kept on the component,
+        so that the same chart can be added to any number of slides and pickled for ``add_slides`` workers.
+
+        :param gridslide:
+        :param rect: (x, y, cx, cy) in EMU assigned by the layout; defaults to the panel's own position
+        :return: the python-pptx chart, or the rectangle showing why a chart type python-pptx cannot draw is missing
+        """
+
+        # prepared data is memoized, so placing the same chart again only rebuilds it if df was replaced
+        if self.chart_data is None or self._chart_data_df is not self.df:
+            with span('prep_chart_data') as s:
+                self.prep_chart_data()
+                s.set(chart_data=type(self.chart_data).__name__)
+            self._chart_data_df = self.df
+
+        self._rendered = self._add_chart_to_slide(gridslide, rect)
+        return self._rendered
 
-    def add_to_slide(self, gridslide: GridSlide) -> None:
+    @property
+    def chart(self) -> Union[pptx.chart.chart.Chart, pptx.shapes.autoshape.Shape, None]:
+        """ Deprecated: what the most recent ``add_to_slide`` returned. Use ``GridSlide.shape(chart)``, which also
+        tells apart the slides a chart was added to.
         """
+        warnings.warn('_GridChart.chart is deprecated; use GridSlide.shape(chart) instead.', DeprecationWarning,
+                      stacklevel=2)
+        return self._rendered
+
+    def __getstate__(self) -> dict:
+        # python-pptx objects cannot be pickled
+        return {**self.__dict__, '_rendered': None}
+
+    def trace_attributes(self) -> dict:
+        chart_type = self.chart_type[0] if isinstance(self.chart_type, tuple) else self.chart_type
+        return {'chart_type': getattr(chart_type, 'name', str(chart_type)), 'rows': len(self.df.index),
+                'columns': len(self.df.columns), 'points': int(self.df.size)}
+
+    def workbook_key(self) -> str:
+        """ Content hash identifying the workbook for this chart's data, used by the 'dedupe' workbook policy.
+
+        :return:
+        """
+        digest = hashlib.sha1(type(self.chart_data).__name__.encode())
+        digest.update(repr(list(self.df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(self.df, index=True).values.tobytes())
+        return digest.hexdigest()
+
+    def _add_chart(self, gridslide: GridSlide, chart_type: XL_CHART_TYPE,
+                   rect: tuple = None) -> pptx.chart.chart.Chart:
+        """ Equivalent of ``slide.shapes.add_chart`` in which the workbook policy decides how (and whether) the
+        chart's Excel workbook is stored.
 
         :param gridslide:
+        :param chart_type:
+        :param rect:
         :return:
         """
+        policy = self.workbook if self.workbook is not None else gridslide.prs.workbook
+        if policy not in workbook_policies:
+            raise ValueError(f'workbook must be one of {workbook_policies}, not {policy!r}.')
+
+        shapes = gridslide.slide.shapes
+        slide_part = shapes.part
+        package = slide_part.package
+
+        # partnames come from the presentation's counters rather than python-pptx's scan of the whole package
+        prs = gridslide.prs
+        with span('chart_xml', colored=self.palette is not None or self.colormap is not None):
+            chart_part = ChartPart.load(
+                partname=prs.next_partname(ChartPart.partname_template), content_type=CT.DML_CHART,
+                package=package, blob=self.chart_xml(chart_type)
+            )
+
+        with span('workbook', policy=policy) as s:
+            if policy == 'embed':
+                chart_part.chart_workbook.xlsx_part = self._new_xlsx_part(prs, package)
+            elif policy == 'dedupe':
+                key = self.workbook_key()
+                s.set(shared=key in prs.workbooks)
+                if key not in prs.workbooks:
+                    prs.workbooks[key] = self._new_xlsx_part(prs, package)
+                chart_part.chart_workbook.xlsx_part = prs.workbooks[key]
+
+        graphic_frame = shapes._add_chart_graphicFrame(slide_part.relate_to(chart_part, RT.CHART),
+                                                       *self.bounds(rect))
+        shapes._recalculate_extents()
+        return shapes._shape_factory(graphic_frame).chart
+
+    def chart_xml(self, chart_type: XL_CHART_TYPE) -> bytes:
+        """ Chart part XML of the prepared chart data, with the series and point colors written in
+
+        :param chart_type:
+        :return:
+        """
+        xml = self.chart_data.xml_bytes(chart_type)
+        if self.palette is None and self.colormap is None:
+            return xml
+        colors = chart_colors(self.df, chart_type, self.palette, self.color_by, self.colormap)
+        return color_chart_xml(xml.decode('utf-8'), *colors).encode('utf-8')
+
+    def _new_xlsx_part(self, prs: GridPresentation, package: pptx.package.Package) -> EmbeddedXlsxPart:
+        """ Embedded workbook part holding this chart's data
+
+        :param prs:
+        :param package:
+        :return:
+        """
+        return EmbeddedXlsxPart(prs.next_partname(EmbeddedXlsxPart.partname_template), EmbeddedXlsxPart.content_type,
+                                package, self.chart_data.xlsx_blob)
+
+    def _add_chart_to_slide(self, gridslide: GridSlide, rect: tuple = None):
+        """
+
+        :param gridslide:
+        :param rect:
+        :return: see add_to_slide
+        """
 
-        slide = gridslide.slide
         try:
             # For some chart types, XL_CHART_TYPE.<chart type> returns a tuple with one integer. For these, we need
             # the zeroth element of the tuple
 
-            self.chart = slide.shapes.add_chart(
-                self.chart_type[0], self.x, self.y, self.cx, self.cy, self.chart_data
-            ).chart
+            chart = self._add_chart(gridslide, self.chart_type[0], rect)
 
             try:
-                self.chart.chart_title.text_frame.text = self.title
+                chart.chart_title.text_frame.text = self.title
             except TypeError:
                 pass
 
-            self.chart.has_legend = self.has_legend
-            self.chart.series[0].smooth = self.smooth_lines
+            chart.has_legend = self.has_legend
+            chart.series[0].smooth = self.smooth_lines
 
-            self.add_axes_to_slide()
+            self.add_axes_to_slide(chart)
 
         except TypeError:
 
@@ -171,26 +343,27 @@ class _GridChart(_GridPanel, metaclass=NewInitCaller):
                 # For other chart types, XL_CHART_TYPE.<chart type> returns an EnumValue
                 # object that is all that is needed.
                 # Taking the zeroth element will throw a TypeError, which is caught here
-                self.chart = slide.shapes.add_chart(
-                    self.chart_type, self.x, self.y, self.cx, self.cy, self.chart_data
-                ).chart
+                chart = self._add_chart(gridslide, self.chart_type, rect)
 
                 try:
-                    self.chart.chart_title.text_frame.text = self.title
+                    chart.chart_title.text_frame.text = self.title
                 except TypeError:
                     pass
 
-                self.chart.has_legend = self.has_legend
-                self.chart.series[0].smooth = self.smooth_lines
+                chart.has_legend = self.has_legend
+                chart.series[0].smooth = self.smooth_lines
 
-                self.add_axes_to_slide()
+                self.add_axes_to_slide(chart)
             except NotImplementedError as ne:
-                self.add_error_to_slide(gridslide, ne)
+                return self.add_error_to_slide(gridslide, ne, rect)
 
         except NotImplementedError as ne:
-            self.add_error_to_slide(gridslide, ne)
+            return self.add_error_to_slide(gridslide, ne, rect)
+
+        return chart
 
-    def add_error_to_slide(self, gridslide: GridSlide, ne: NotImplementedError) -> None:
+    def add_error_to_slide(self, gridslide: GridSlide, ne: NotImplementedError,
+                           rect: tuple = None) -> pptx.shapes.autoshape.Shape:
 
         # Some chart types are not yet implemented in python-pptx. In those situations, attempting to add
         # the chart type to the slide will throw a NotImplementedError, which is caught here. For more info, see:
@@ -201,17 +374,18 @@ class _GridChart(_GridPanel, metaclass=NewInitCaller):
 
         slide = gridslide.slide
 
-        self.chart = slide.shapes.add_shape(
-            MSO_AUTO_SHAPE_TYPE.RECTANGLE, self.x, self.y, self.cx, self.cy
+        shape = slide.shapes.add_shape(
+            MSO_AUTO_SHAPE_TYPE.RECTANGLE, *self.bounds(rect)
         )
 
         # configure text for the rectangle
-        p = self.chart.text_frame.paragraphs[0]
+        p = shape.text_frame.paragraphs[0]
         p.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
         run = p.add_run()
         run.text = str(ne)  # text of the rectangle is the error message
         font = run.font
         font.size = Pt(10)
+        return shape
 
 
 @dataclass(kw_only=True)
@@ -231,7 +405,7 @@ class AreaChart(_GridChartDefaults, _GridChart):
     stacked: bool = False
     normalized: bool = False
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self) -> None:
 
@@ -287,7 +461,7 @@ class BarChart(_GridChartDefaults, _GridChart):
     stacked: bool = False
     normalized: bool = False
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self) -> None:
         # dictionary keys are tuples of booleans of the form (three_d, stacked, normalized)
@@ -355,7 +529,7 @@ class ColumnChart(_GridChartDefaults, _GridChart):
     stacked: bool = False
     normalized: bool = False
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self):
         chart_types = {
@@ -446,7 +620,7 @@ class LineChart(_GridChartDefaults, _GridChart):
     stacked: bool = False
     normalized: bool = False
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self):
         # dictionary keys are tuples of booleans of the form (markers, three_d, stacked, normalized)
@@ -489,14 +663,16 @@ class PieChart(_GridChartDefaults, _GridChart):
     :param exploded:
     :param compound:
     :param compound_type:
+    :param color_by: pie and doughnut slices are the categories, so palettes color them one by one by default
     """
 
     three_d: bool = False
     doughnut: bool = False
     exploded: bool = False
     compound_type: str = None
+    color_by: str = 'category'
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self):
         # dictionary keys are tuples of booleans of the form (three_d, exploded, doughnut, compound_type)
@@ -539,7 +715,7 @@ class PieChart(_GridChartDefaults, _GridChart):
         """ Pie charts don't have axes in python-pptx, so this method must be "nullified" """
         return None
 
-    def add_axes_to_slide(self):
+    def add_axes_to_slide(self, chart: pptx.chart.chart.Chart):
         """ Pie charts don't have axes in python-pptx, so this method must be "nullified" """
         return None
 
@@ -555,7 +731,7 @@ class RadarChart(_GridChartDefaults, _GridChart):
     filled: bool = False
     markers: bool = False
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self):
         # dictionary keys are tuples of booleans of the form (filled, markers)
@@ -590,7 +766,7 @@ class ScatterChart(_GridChartDefaults, _GridChart):
     lines: str = None  # options are None, 'straight', 'smooth'
     markers: bool = True
 
-    chart_data = XyChartData()
+    chart_data_type = XyChartData
 
     def set_chart_type(self):
         # dictionary keys are tuples of booleans of the form (lines, markers)
@@ -661,7 +837,7 @@ class BubbleChart(_GridChartDefaults, _GridChart):
     size_col: str
     three_d: bool = False
 
-    chart_data = BubbleChartData()
+    chart_data_type = BubbleChartData
 
     def set_chart_type(self):
         if self.three_d:
@@ -681,7 +857,7 @@ class StockChart(_GridChartDefaults, _GridChart):
     incl_open: bool = False
     volume: bool = False
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self):
 
@@ -709,7 +885,7 @@ class SurfaceChart(_GridChartDefaults, _GridChart):
     top_view: bool = False
     wireframe: bool = False
 
-    chart_data = CategoryChartData()
+    chart_data_type = CategoryChartData
 
     def set_chart_type(self):
         if self.top_view:
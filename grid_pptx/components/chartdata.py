@@ -0,0 +1,226 @@
+"""
+Array-backed chart data for category charts.
+
+python-pptx builds a ``Category`` and a ``CategoryDataPoint`` object for every point and then concatenates the
+``c:pt`` XML one point at a time, which is quadratic in the number of points. ``ArrayCategoryChartData`` keeps the
+DataFrame's index and columns as NumPy arrays and writes the category/value number caches and the embedded
+worksheet in bulk. The chart XML it produces is identical to the python-pptx output.
+"""
+from __future__ import annotations
+import re
+from typing import Union
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+from pptx.chart.data import CategoryChartData
+from pptx.chart.xlsx import CategoryWorkbookWriter
+from pptx.chart.xmlwriter import ChartXmlWriter, _CategorySeriesXmlWriter
+
+# the same ``c:pt`` layout python-pptx uses for category names, numeric categories and series values
+_PT_TMPL = (
+    '                <c:pt idx="%d">\n'
+    '                  <c:v>%s</c:v>\n'
+    '                </c:pt>\n'
+)
+
+_CAT_RE = re.compile(r'          <c:cat>\n.*?          </c:cat>\n', re.S)
+_VAL_RE = re.compile(r'          <c:val>\n.*?          </c:val>\n', re.S)
+
+# pd.api.types.infer_dtype results that can be written without per-label Python objects
+_SUPPORTED_INDEX_TYPES = {'integer', 'floating', 'mixed-integer-float', 'string'}
+
+
+def _pt_xml(idx: np.ndarray, labels: list) -> str:
+    """ Render all ``c:pt`` elements for *idx*/*labels* with a single format operation.
+
+    :param idx: point indices
+    :param labels: already stringified (and escaped, if necessary) point values
+    :return:
+    """
+    flat = [None] * (2 * len(labels))
+    flat[0::2] = idx.tolist()
+    flat[1::2] = labels
+    return (_PT_TMPL * len(labels)) % tuple(flat)
+
+
+class _ArrayCategories:
+    """
+    Single-level stand-in for ``pptx.chart.data.Categories`` backed by a pandas Index.
+    """
+
+    depth = 1
+    are_dates = False
+
+    def __init__(self, index: pd.Index, number_format: str = None) -> None:
+        self.index = index
+        self._number_format = number_format
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def are_numeric(self) -> bool:
+        return pd.api.types.is_numeric_dtype(self.index)
+
+    @property
+    def leaf_count(self) -> int:
+        return len(self.index)
+
+    @property
+    def number_format(self) -> str:
+        return 'General' if self._number_format is None else self._number_format
+
+    @property
+    def pt_xml(self) -> str:
+        labels = self.index.astype(str).tolist()
+        if not self.are_numeric:
+            labels = [escape(_) for _ in labels]
+        return _pt_xml(np.arange(len(labels)), labels)
+
+
+class _ArraySeries:
+    """
+    Stand-in for ``pptx.chart.data.CategorySeriesData`` holding its values as a NumPy array.
+    """
+
+    def __init__(self, chart_data: ArrayCategoryChartData, name: str, values: np.ndarray,
+                 number_format: str = None) -> None:
+        self._chart_data = chart_data
+        self._name = name
+        self._values = values
+        self._number_format = number_format
+        self.index = len(chart_data)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def name(self) -> str:
+        return self._name if self._name is not None else ''
+
+    @property
+    def number_format(self) -> str:
+        return self._chart_data.number_format if self._number_format is None else self._number_format
+
+    @property
+    def categories(self) -> _ArrayCategories:
+        return self._chart_data.categories
+
+    @property
+    def categories_ref(self) -> str:
+        return self._chart_data.categories_ref
+
+    @property
+    def values(self) -> list:
+        return self._values.tolist()
+
+    @property
+    def values_ref(self) -> str:
+        return self._chart_data.values_ref(self)
+
+    @property
+    def val_pt_xml(self) -> str:
+        values = self._values
+        if values.dtype == object:
+            # python-pptx skips ``None`` values rather than writing an empty point
+            idx = np.flatnonzero(values != None)  # noqa: E711 -- elementwise comparison
+            values = values[idx]
+        else:
+            idx = np.arange(len(values))
+        return _pt_xml(idx, [str(_) for _ in values.tolist()])
+
+
+class _ArraySeriesXmlWriter(_CategorySeriesXmlWriter):
+    """
+    python-pptx's category series writer with the per-point loops replaced by bulk rendering.
+    """
+
+    @property
+    def _cat_num_pt_xml(self) -> str:
+        return self._series.categories.pt_xml
+
+    @property
+    def _cat_pt_xml(self) -> str:
+        return self._series.categories.pt_xml
+
+    @property
+    def _val_pt_xml(self) -> str:
+        return self._series.val_pt_xml
+
+
+class _ArrayWorkbookWriter(CategoryWorkbookWriter):
+    """
+    Writes the embedded worksheet one column at a time instead of one cell at a time.
+    """
+
+    def _write_categories(self, workbook, worksheet) -> None:
+        categories = self._chart_data.categories
+        num_format = workbook.add_format({'num_format': categories.number_format})
+        worksheet.set_column(0, 0, 10)  # wide enough for a date
+        worksheet.write_column(1, 0, categories.index.tolist(), num_format)
+
+
+class ArrayCategoryChartData(CategoryChartData):
+    """
+    Drop-in replacement for ``CategoryChartData`` for single-level, non-date indexes.
+
+    ``add_series`` stores the values as a NumPy array (no copy for numeric pandas columns) and assigning
+    ``categories`` stores the pandas Index as-is.
+    """
+
+    @staticmethod
+    def supports(df: pd.DataFrame) -> bool:
+        """ Whether the index of *df* can be written by this class.
+
+        :param df:
+        :return:
+        """
+        if isinstance(df.index, pd.MultiIndex) or len(df.index) == 0:
+            return False
+        return pd.api.types.infer_dtype(df.index, skipna=False) in _SUPPORTED_INDEX_TYPES
+
+    @property
+    def categories(self) -> _ArrayCategories:
+        if not hasattr(self, '_categories'):
+            self._categories = _ArrayCategories(pd.Index([]))
+        return self._categories
+
+    @categories.setter
+    def categories(self, category_labels: Union[pd.Index, list]) -> None:
+        self._categories = _ArrayCategories(pd.Index(category_labels))
+
+    def add_series(self, name: str, values=(), number_format: str = None) -> _ArraySeries:
+        series = _ArraySeries(self, name, np.asarray(values), number_format)
+        self.append(series)
+        return series
+
+    @property
+    def _workbook_writer(self) -> _ArrayWorkbookWriter:
+        return _ArrayWorkbookWriter(self)
+
+    def _skeleton(self) -> CategoryChartData:
+        """ A python-pptx chart data object with the same series but only the first point of each.
+
+        Everything in the chart XML other than the ``c:cat``/``c:val`` caches is independent of the number of
+        points, so the skeleton is rendered by python-pptx and the caches are then swapped for full ones.
+
+        :return:
+        """
+        skeleton = CategoryChartData(number_format=self.number_format)
+        skeleton.categories = self.categories.index[:1].tolist()
+        skeleton.categories.number_format = self.categories._number_format
+        for series in self:
+            skeleton.add_series(series.name, series._values[:1].tolist(), series._number_format)
+        return skeleton
+
+    def _xml(self, chart_type) -> str:
+        xml = ChartXmlWriter(chart_type, self._skeleton()).xml
+
+        # series appear in the XML in chart data order; pie charts only write the first one
+        writers = [_ArraySeriesXmlWriter(_) for _ in self]
+        cat_xml = iter([_.cat_xml for _ in writers])
+        val_xml = iter([_.val_xml for _ in writers])
+        xml = _CAT_RE.sub(lambda match: next(cat_xml), xml)
+        return _VAL_RE.sub(lambda match: next(val_xml), xml)
@@ -0,0 +1,141 @@
+"""
+Conditional formatting (heatmap fills) for table cells.
+
+Setting ``cell.fill.fore_color.rgb`` cell by cell goes through several python-pptx proxies per cell. ``cell_fills``
+instead maps all values of the selected columns to colors in one NumPy pass, either by interpolating between color
+stops or by binning the values with thresholds, and returns the ``a:tcPr`` XML of each cell for ``Table`` to write
+along with the cell text. Cells with the same color share one cached fragment.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from grid_pptx.colors import Color, parse_color
+
+# a:tcPr of a cell without a fill of its own
+EMPTY_TCPR = '<a:tcPr/>'
+
+
+@dataclass(kw_only=True)
+class ConditionalFill:
+    """
+    Cell fills computed from the values of numeric table columns.
+
+    Without ``thresholds`` the values are mapped linearly from ``vmin`` .. ``vmax`` onto the evenly spaced color
+    stops in ``colors``. With ``thresholds`` (ascending) a value below ``thresholds[0]`` gets ``colors[0]``, a value
+    from ``thresholds[i - 1]`` up to ``thresholds[i]`` gets ``colors[i]`` and so on, so there is one more color than
+    there are thresholds. Colors are CSS color names, hex strings or (r, g, b) tuples (see ``parse_color``).
+
+    Charts accept a ConditionalFill as ``colormap`` to color their data points the same way.
+    """
+
+    colors: tuple = ('#F8696B', '#FFEB84', '#63BE7B')  # red - yellow - green, like Excel's 3-color scale
+    thresholds: tuple = None
+    vmin: float = None  # defaults to the smallest value in the columns
+    vmax: float = None  # defaults to the largest value in the columns
+    columns: list = None  # labels of the columns to fill; defaults to all numeric columns
+    na_color: Union[str, tuple] = None  # None leaves cells with missing values unfilled
+
+
+def rgb(color: Union[str, tuple, Color]) -> tuple:
+    """ (r, g, b) of a color accepted by ``parse_color``, which must not be a theme color
+
+    :param color:
+    :return:
+    """
+    rgb = parse_color(color).rgb
+    if rgb is None:
+        raise ValueError(f'ConditionalFill colors must be RGB colors, not the theme color {color!r}.')
+    return tuple(rgb)
+
+
+@lru_cache(maxsize=4096)
+def tcPr_xml(value: int) -> str:
+    """ a:tcPr with a solid fill of the 24-bit RGB *value*, as python-pptx writes it
+
+    :param value:
+    :return:
+    """
+    return f'<a:tcPr><a:solidFill><a:srgbClr val="{value:06X}"/></a:solidFill></a:tcPr>'
+
+
+def cell_fills(df: pd.DataFrame, fill: ConditionalFill) -> list:
+    """ a:tcPr XML of each cell of *df*, as a list per column
+
+    Columns not filled by *fill* are None.
+
+    :param df:
+    :param fill:
+    :return:
+    """
+    # one fragment per distinct color
+    positions, codes = color_codes(df, fill)
+    unique, inverse = np.unique(codes, return_inverse=True)
+    fragments = np.array([EMPTY_TCPR if _ < 0 else tcPr_xml(_) for _ in unique.tolist()], dtype=object)
+    cells = fragments[inverse.reshape(codes.shape)]
+
+    result = [None] * len(df.columns)
+    for k, j in enumerate(positions):
+        result[j] = cells[:, k].tolist()
+    return result
+
+
+def color_codes(df: pd.DataFrame, fill: ConditionalFill) -> tuple:
+    """ Colors *fill* gives the values of *df*, as 24-bit RGB integers
+
+    :param df:
+    :param fill:
+    :return: positions of the filled columns in *df* and an int64 array with one row per row of *df* and one column \
+            per filled column; -1 where a missing value is left unfilled
+    """
+    columns = fill.columns
+    if columns is None:
+        columns = [_ for _ in df.columns if pd.api.types.is_numeric_dtype(df[_].dtype)]
+    missing = [_ for _ in columns if _ not in df.columns]
+    if missing:
+        raise ValueError(f'ConditionalFill refers to columns that are not in the DataFrame: {missing}.')
+    not_numeric = [_ for _ in columns if not pd.api.types.is_numeric_dtype(df[_].dtype)]
+    if not_numeric:
+        raise ValueError(f'ConditionalFill columns must be numeric: {not_numeric}.')
+
+    stops = np.array([rgb(_) for _ in fill.colors], dtype=float)
+    if fill.thresholds is not None and len(fill.colors) != len(fill.thresholds) + 1:
+        raise ValueError('ConditionalFill needs one more color than thresholds.')
+    if fill.thresholds is None and len(fill.colors) < 2:
+        raise ValueError('ConditionalFill needs at least two colors without thresholds.')
+
+    positions = [list(df.columns).index(_) for _ in columns]
+    values = np.column_stack([df.iloc[:, j].to_numpy(dtype=float, na_value=np.nan) for j in positions]) \
+        if positions else np.empty((len(df.index), 0))
+    na = np.isnan(values)
+
+    if fill.thresholds is not None:
+        thresholds = np.asarray(fill.thresholds, dtype=float)
+        if np.any(np.diff(thresholds) < 0):
+            raise ValueError('ConditionalFill thresholds must be ascending.')
+        filled = stops[np.searchsorted(thresholds, values, side='right')]
+    else:
+        vmin, vmax = fill.vmin, fill.vmax
+        if vmin is None:
+            vmin = np.nanmin(values) if not na.all() else 0
+        if vmax is None:
+            vmax = np.nanmax(values) if not na.all() else 0
+        scaled = np.clip((values - vmin) / (vmax - vmin), 0, 1) if vmax > vmin else np.zeros(values.shape)
+        scaled = np.nan_to_num(scaled) * (len(stops) - 1)
+        lower = np.minimum(scaled.astype(int), len(stops) - 2)
+        weight = (scaled - lower)[..., np.newaxis]
+        filled = stops[lower] * (1 - weight) + stops[lower + 1] * weight
+
+    # one 24-bit integer per cell
+    filled = np.rint(filled).astype(np.int64)
+    codes = (filled[..., 0] << 16) | (filled[..., 1] << 8) | filled[..., 2]
+    if fill.na_color is None:
+        codes[na] = -1
+    else:
+        r, g, b = rgb(fill.na_color)
+        codes[na] = (r << 16) | (g << 8) | b
+    return positions, codes
@@ -0,0 +1,137 @@
+"""
+Column-wise number formatting for tables.
+
+Formatting a column with ``f'{value:,.2f}'`` creates a Python float and a format call per value. ``format_column``
+instead rounds the whole column to integers with NumPy, writes the digits, separators and decimal point into a
+fixed-width byte matrix (one row per value) with a few array operations per digit position, and adds signs,
+parentheses, prefixes and suffixes with ``numpy.char``. Values that do not fit in the integer arithmetic (more
+than 15 significant digits, infinities) are formatted by Python instead, and so are values whose scaled product
+lands within rounding error of a half: Python rounds the exact binary value (28.765 is slightly above it, so
+'28.77'), which the rounded product no longer tells apart.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+import re
+
+import numpy as np
+import pandas as pd
+
+# the subset of Python's format spec mini-language accepted by ColumnFormat.from_spec, e.g. ',.2f', ',d' or '.1%'
+_SPEC_RE = re.compile(r'(?P<thousands>,)?(?:\.(?P<precision>\d+))?(?P<type>[fd%])')
+
+# largest integer float64 represents exactly; rounded values from here on are formatted by Python
+_MAX_EXACT = 2 ** 53
+
+_SPACE, _COMMA, _POINT, _ZERO = (ord(_) for _ in ' ,.0')
+
+
+@dataclass(kw_only=True)
+class ColumnFormat:
+    """
+    How the numbers of a table column are displayed.
+    """
+
+    precision: int = 0
+    thousands: bool = False
+    percent: bool = False
+    prefix: str = ''
+    suffix: str = ''
+    na_rep: str = ''
+    negative_parentheses: bool = False
+
+    @classmethod
+    def from_spec(cls, spec: str, **kwargs) -> ColumnFormat:
+        """ ColumnFormat for a Python format spec such as ',.2f' (thousands separators, 2 decimals), ',d' or '.1%'
+
+        :param spec: optional ',', optional '.precision' and a type of 'f', 'd' or '%'. As in Python, 'f' and '%' \
+                default to 6 decimals.
+        :param kwargs: other ColumnFormat fields, e.g. prefix='$'
+        :return:
+        """
+        match = _SPEC_RE.fullmatch(spec)
+        if match is None or (match['type'] == 'd' and match['precision'] is not None):
+            raise ValueError(f'Unsupported format spec {spec!r}; expected e.g. ",.2f", ",d" or ".1%".')
+
+        precision = 0 if match['type'] == 'd' else 6 if match['precision'] is None else int(match['precision'])
+        return cls(precision=precision, thousands=match['thousands'] is not None, percent=match['type'] == '%',
+                   **kwargs)
+
+
+def format_column(column: pd.Series, fmt: ColumnFormat) -> list:
+    """ Text of each value in the numeric *column* according to *fmt*
+
+    Zero is never shown with a sign, even when a small negative value rounds to it.
+
+    :param column:
+    :param fmt:
+    :return:
+    """
+    if not pd.api.types.is_numeric_dtype(column.dtype):
+        raise ValueError(f'Column {column.name!r} has dtype {column.dtype} and cannot be formatted as numbers.')
+
+    x = column.to_numpy(dtype=float, na_value=np.nan)
+    if fmt.percent:
+        x = x * 100
+
+    na = np.isnan(x)
+    scale = 10 ** fmt.precision
+    with np.errstate(over='ignore', invalid='ignore'):
+        product = np.abs(x) * scale
+        scaled = np.rint(product)
+        # the product is off by up to half an ulp, so near a half its rounding can differ from that of the exact value
+        halfway = np.abs(product - np.floor(product) - 0.5) <= 2 * np.spacing(product)
+    python = ~na & (~(scaled < _MAX_EXACT) | halfway)  # also true for infinities
+    scaled = np.where(na | python, 0, scaled).astype(np.int64)
+
+    text = np.char.add(np.char.add(fmt.prefix, _digits(scaled, fmt.precision, fmt.thousands)),
+                       fmt.suffix + ('%' if fmt.percent else ''))
+    negative = (x < 0) & (scaled > 0) & ~python
+    if fmt.negative_parentheses:
+        text = np.char.add(np.char.add(np.where(negative, '(', ''), text), np.where(negative, ')', ''))
+    else:
+        text = np.char.add(np.where(negative, '-', ''), text)
+    text = np.where(na, fmt.na_rep, text).tolist()
+
+    for i in np.flatnonzero(python).tolist():
+        number = f'{abs(x[i]):{"," if fmt.thousands else ""}.{fmt.precision}f}'
+        body = fmt.prefix + number + fmt.suffix + ('%' if fmt.percent else '')
+        if x[i] < 0 and number.strip('0.,'):  # no sign on a value rounded to zero
+            body = f'({body})' if fmt.negative_parentheses else f'-{body}'
+        text[i] = body
+
+    return text
+
+
+def _digits(scaled: np.ndarray, precision: int, thousands: bool) -> np.ndarray:
+    """ Decimal representation of the non-negative integers *scaled* / 10 ** *precision*, without sign
+
+    :param scaled:
+    :param precision: digits after the decimal point
+    :param thousands: separate groups of three integer digits with ','
+    :return: str array
+    """
+    whole_max = int(scaled.max()) // 10 ** precision if len(scaled) else 0
+    int_digits = len(str(whole_max))
+    width = int_digits + ((int_digits - 1) // 3 if thousands else 0) + (precision + 1 if precision else 0)
+
+    # right-aligned text, one row per value, filled from the last column (least significant digit) to the first
+    chars = np.empty((len(scaled), width), dtype=np.uint8)
+    col = width - 1
+    rest = scaled
+    for k in range(precision + int_digits):
+        if precision and k == precision:
+            chars[:, col] = _POINT
+            col -= 1
+        quotient = rest // 10
+        digit = (rest - quotient * 10 + _ZERO).astype(np.uint8)
+        if k > precision:
+            # integer digits (and their separators) beyond the first are left blank once the number has run out
+            if thousands and (k - precision) % 3 == 0:
+                chars[:, col] = np.where(rest > 0, _COMMA, _SPACE)
+                col -= 1
+            digit[rest == 0] = _SPACE
+        chars[:, col] = digit
+        rest = quotient
+        col -= 1
+
+    return np.char.lstrip(chars.view(f'S{width}').ravel()).astype(str)
@@ -0,0 +1,191 @@
+"""
+Series and point colors for charts.
+
+Coloring a chart through python-pptx (``chart.series[i].format.fill``, ``series.points[j].format.fill``) creates
+several proxies and inserts one element into the parsed chart per series or point. Charts with a ``palette`` or
+``colormap`` instead compute all of their colors up front (a palette is cycled over the series or categories, a
+colormap maps the values with ``ConditionalFill`` in one NumPy pass), and ``color_chart_xml`` writes the ``c:spPr``
+of each series and the ``c:dPt`` of each point into the chart XML before it is parsed. Series and points with the
+same color share one cached fragment.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Union
+import re
+
+import numpy as np
+import pandas as pd
+
+from pptx.enum.chart import XL_CHART_TYPE
+
+from grid_pptx.colors import Color, parse_color
+from .conditional import ConditionalFill, color_codes
+
+palettes = {
+    'office': ('#4472C4', '#ED7D31', '#A5A5A5', '#FFC000', '#5B9BD5', '#70AD47'),  # default Office theme accents
+    'theme': ('accent_1', 'accent_2', 'accent_3', 'accent_4', 'accent_5', 'accent_6'),  # the template's accents
+    'tab10': ('#1F77B4', '#FF7F0E', '#2CA02C', '#D62728', '#9467BD', '#8C564B', '#E377C2', '#7F7F7F', '#BCBD22',
+              '#17BECF'),  # matplotlib's default color cycle
+    'colorblind': ('#E69F00', '#56B4E9', '#009E73', '#F0E442', '#0072B2', '#D55E00', '#CC79A7',
+                   '#000000'),  # Okabe & Ito
+}
+
+# evenly spaced color stops, interpolated like a ConditionalFill without thresholds
+colormaps = {
+    'viridis': ('#440154', '#3B528B', '#21918C', '#5EC962', '#FDE725'),
+    'blues': ('#F7FBFF', '#C6DBEF', '#6BAED6', '#2171B5', '#08306B'),
+    'reds': ('#FFF5F0', '#FCBBA1', '#FB6A4A', '#CB181D', '#67000D'),
+    'rdylgn': ('#F8696B', '#FFEB84', '#63BE7B'),  # Excel's 3-color scale
+}
+
+color_by_options = ('series', 'category')
+
+# chart types drawn as lines, which are colored through a:ln rather than a fill
+line_chart_types = {
+    XL_CHART_TYPE.LINE, XL_CHART_TYPE.LINE_MARKERS, XL_CHART_TYPE.LINE_MARKERS_STACKED,
+    XL_CHART_TYPE.LINE_MARKERS_STACKED_100, XL_CHART_TYPE.LINE_STACKED, XL_CHART_TYPE.LINE_STACKED_100,
+    XL_CHART_TYPE.RADAR, XL_CHART_TYPE.RADAR_MARKERS, XL_CHART_TYPE.XY_SCATTER_LINES,
+    XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS, XL_CHART_TYPE.XY_SCATTER_SMOOTH,
+    XL_CHART_TYPE.XY_SCATTER_SMOOTH_NO_MARKERS,
+}
+
+# chart types that show markers, which get the color of their series or point as well
+marker_chart_types = {
+    XL_CHART_TYPE.LINE_MARKERS, XL_CHART_TYPE.LINE_MARKERS_STACKED, XL_CHART_TYPE.LINE_MARKERS_STACKED_100,
+    XL_CHART_TYPE.RADAR_MARKERS, XL_CHART_TYPE.XY_SCATTER, XL_CHART_TYPE.XY_SCATTER_LINES,
+    XL_CHART_TYPE.XY_SCATTER_SMOOTH,
+}
+
+_DPT_TMPL = '<c:dPt><c:idx val="%d"/>%s</c:dPt>'
+
+# first element of a series after its c:dPt elements (python-pptx writes no c:dLbls, c:trendline or c:errBars)
+_DATA_RE = re.compile(r' *<c:(?:cat|xVal)>')
+
+
+def resolve_palette(palette: Union[str, tuple]) -> tuple:
+    """ Colors of *palette*, given by name (see ``palettes``) or as a sequence of colors accepted by ``parse_color``
+
+    :param palette:
+    :return: tuple of Color, or None without a palette
+    """
+    if palette is None:
+        return None
+    if isinstance(palette, str):
+        if palette not in palettes:
+            raise ValueError(f'palette must be one of {tuple(palettes)} or a sequence of colors, not {palette!r}.')
+        palette = palettes[palette]
+    palette = tuple(parse_color(_) for _ in palette)
+    if not palette:
+        raise ValueError('palette needs at least one color.')
+    return palette
+
+
+def resolve_colormap(colormap: Union[str, ConditionalFill]) -> ConditionalFill:
+    """ ConditionalFill for *colormap*, given by name (see ``colormaps``) or as a ConditionalFill
+
+    :param colormap:
+    :return:
+    """
+    if colormap is None or isinstance(colormap, ConditionalFill):
+        return colormap
+    if colormap not in colormaps:
+        raise ValueError(f'colormap must be one of {tuple(colormaps)} or a ConditionalFill, not {colormap!r}.')
+    return ConditionalFill(colors=colormaps[colormap])
+
+
+@lru_cache(maxsize=4096)
+def shape_xml(color: Color, line: bool, spPr: bool, marker: bool) -> tuple:
+    """ c:spPr and c:marker giving a series or data point *color*
+
+    :param color:
+    :param line: color the line rather than fill the shape
+    :param spPr: whether to write the c:spPr
+    :param marker: whether to write the c:marker
+    :return: (spPr, marker) XML, either of which may be empty
+    """
+    fill = f'<a:solidFill>{color.xml()}</a:solidFill>'
+    spPr_xml = marker_xml = ''
+    if spPr:
+        spPr_xml = f'<c:spPr><a:ln>{fill}</a:ln></c:spPr>' if line else f'<c:spPr>{fill}</c:spPr>'
+    if marker:
+        marker_xml = f'<c:marker><c:spPr>{fill}<a:ln>{fill}</a:ln></c:spPr></c:marker>'
+    return spPr_xml, marker_xml
+
+
+def chart_colors(df: pd.DataFrame, chart_type: XL_CHART_TYPE, palette: tuple = None, color_by: str = 'series',
+                 colormap: ConditionalFill = None) -> tuple:
+    """ XML coloring the series (one per column of *df*) and data points (one per row) of a chart
+
+    Point colors from *colormap* take precedence over the palette in the columns it applies to.
+
+    :param df:
+    :param chart_type:
+    :param palette: tuple of Color, cycled over the series or categories as given by *color_by*
+    :param color_by: one of color_by_options
+    :param colormap:
+    :return: list of the c:spPr/c:marker XML of each series and list of the c:dPt XML of each series
+    """
+    # python-pptx writes a c:spPr hiding the line of XY_SCATTER series, the markers are colored instead
+    style = (chart_type in line_chart_types, chart_type != XL_CHART_TYPE.XY_SCATTER,
+             chart_type in marker_chart_types)
+    series = [''] * len(df.columns)
+    points = [''] * len(df.columns)
+
+    if palette is not None and color_by == 'series':
+        series = [''.join(shape_xml(palette[i % len(palette)], *style)) for i in range(len(df.columns))]
+    elif palette is not None:
+        # the same colors in every series, so the c:dPt elements are written once
+        fragments = np.array([_point_xml(_, style) for _ in palette], dtype=object)
+        idx = np.arange(len(df.index))
+        points = [_dpt_xml(idx, fragments[idx % len(palette)].tolist())] * len(df.columns)
+
+    if colormap is not None:
+        positions, codes = color_codes(df, colormap)
+        unique, inverse = np.unique(codes, return_inverse=True)
+        fragments = np.array([None if _ < 0 else _point_xml(Color(rgb=(_ >> 16, (_ >> 8) & 255, _ & 255)), style)
+                              for _ in unique.tolist()], dtype=object)
+        cells = fragments[inverse.reshape(codes.shape)]
+        for k, j in enumerate(positions):
+            idx = np.flatnonzero(codes[:, k] >= 0)
+            points[j] = _dpt_xml(idx, cells[idx, k].tolist())
+
+    return series, points
+
+
+def _point_xml(color: Color, style: tuple) -> str:
+    spPr, marker = shape_xml(color, *style)
+    return marker + spPr  # c:dPt has its c:marker before its c:spPr, c:ser the other way round
+
+
+def _dpt_xml(idx: np.ndarray, fragments: list) -> str:
+    """ c:dPt elements for the points *idx* with one format operation
+
+    :param idx:
+    :param fragments: c:marker/c:spPr XML of each point
+    :return:
+    """
+    flat = [None] * (2 * len(fragments))
+    flat[0::2] = idx.tolist()
+    flat[1::2] = fragments
+    return (_DPT_TMPL * len(fragments)) % tuple(flat)
+
+
+def color_chart_xml(xml: str, series: list, points: list) -> str:
+    """ Chart XML written by python-pptx with the XML of ``chart_colors`` added to each c:ser
+
+    :param xml:
+    :param series: c:spPr/c:marker XML of each series
+    :param points: c:dPt XML of each series
+    :return:
+    """
+    parts = xml.split('<c:ser>')
+    for i, (ser, series_xml, points_xml) in enumerate(zip(parts[1:], series, points), start=1):
+        head, tx, tail = ser.partition('</c:tx>')
+        # the colors go after a c:spPr python-pptx wrote itself (XY_SCATTER), c:spPr comes before c:marker
+        start = tail.index('</c:spPr>') + len('</c:spPr>') if tail.lstrip().startswith('<c:spPr>') else 0
+        tail = tail[:start] + series_xml + tail[start:]
+        if points_xml:
+            start = _DATA_RE.search(tail).start()
+            tail = tail[:start] + points_xml + tail[start:]
+        parts[i] = head + tx + tail
+    return '<c:ser>'.join(parts)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from pptx.util import Inches
+from pptx.util import Emu, Inches
 
 
 @dataclass
@@ -104,3 +104,20 @@ class _GridPanel:
         The height of the panel in EMU (default PowerPoint units).
         """
         return Inches(self.height)
+
+    def bounds(self, rect: tuple = None) -> tuple:
+        """ (x, y, cx, cy) of the panel in EMU
+
+        :param rect: rectangle from a Row/Column layout. Without it the panel's own left/top/width/height are used.
+        :return:
+        """
+        if rect is not None:
+            return tuple(Emu(_) for _ in rect)
+        return self.x, self.y, self.cx, self.cy
+
+    def trace_attributes(self) -> dict:
+        """ Attributes of the span timing this panel's ``add_to_slide`` (see grid_pptx.tracing), e.g. its size
+
+        :return:
+        """
+        return {}
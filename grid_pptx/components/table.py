@@ -1,14 +1,27 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 from dataclasses import dataclass
+from functools import cached_property
+from xml.sax.saxutils import escape
+import math
+import re
+import numpy as np
 import pandas as pd
 
-from pptx.util import Pt
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches, Pt
 
+from grid_pptx.fonts import EMU_PER_PT, fonts, inset_x, inset_y, largest_size, min_fontsize
+from grid_pptx.tracing import span
+
+from .conditional import EMPTY_TCPR, ConditionalFill, cell_fills
+from .numberformat import ColumnFormat, format_column
 from .panel import _GridPanel
 
 # imports for type hints that would normally cause circular imports
 if TYPE_CHECKING:  # pragma: no cover
+    from pptx.shapes.graphfrm import GraphicFrame
     from grid_pptx.slide import GridSlide
 
 styles = {
@@ -88,6 +101,51 @@ styles = {
     'dark_style_2_accent_5_6': '{46F890A9-2807-4EBB-B81D-B2AA78EC7F39}',
 }
 
+# row height estimate for pagination: one line of text at this multiple of the font size, plus the default top and
+# bottom cell margins (0.05" each). Header cells have no font size of their own and use the table style's 18pt.
+line_spacing = 1.2
+cell_margins = Inches(0.1)
+header_fontsize = 18
+
+# a:tc as python-pptx writes it after ``cell.text = text`` (and setting the font size of the first run), followed by
+# the cell's a:tcPr
+_TC_TMPL = '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p><a:r>%s<a:t>%s</a:t></a:r></a:p></a:txBody>%s</a:tc>'
+_EMPTY_TC_TMPL = '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody>%s</a:tc>'
+
+# text python-pptx splits into paragraphs/line breaks or escapes itself; such cells are set through python-pptx
+_SPECIAL_RE = re.compile(r'[\x00-\x1f]')
+
+
+def _tc_xml(texts: list, rPr: str, tcPrs: list = None) -> tuple:
+    """ a:tc XML for each of *texts*, plus the positions of the texts that must be set through python-pptx instead
+
+    :param texts:
+    :param rPr: run properties XML written before each text
+    :param tcPrs: cell properties XML of each cell, e.g. with a fill; None for cells without properties
+    :return: (list of a:tc XML, list of indices)
+    """
+    if tcPrs is None:
+        tcPrs = [EMPTY_TCPR] * len(texts)
+    special = [i for i, text in enumerate(texts) if _SPECIAL_RE.search(text)]
+    tcs = [_TC_TMPL % (rPr, escape(text), tcPr) if text else _EMPTY_TC_TMPL % tcPr for text, tcPr in zip(texts, tcPrs)]
+    for i in special:
+        tcs[i] = _EMPTY_TC_TMPL % tcPrs[i]
+    return tcs, special
+
+
+def _column_text(column: pd.Series) -> list:
+    """ ``str(value)`` of each value in *column*
+
+    NumPy formats numeric and boolean columns in bulk; other columns (including pandas' extension dtypes, whose
+    ``astype(str)`` keeps missing values as NA) are converted one value at a time.
+
+    :param column:
+    :return:
+    """
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biuf':
+        return column.to_numpy().astype(str).tolist()
+    return [str(_) for _ in column.tolist()]
+
 
 @dataclass(kw_only=True)
 class Table(_GridPanel):
@@ -97,29 +155,190 @@ class Table(_GridPanel):
     first_col: bool = False
     fontsize: int = 14
     style: str = 'medium_style_3_accent_1'
+    paginate: bool = False
+    rows_per_page: int = None
+    formats: dict = None
+    conditional_fill: ConditionalFill = None
+    autofit: bool = False  # shrink the font below fontsize as far as needed for the wrapped rows to fit the panel
+
+    def __post_init__(self) -> None:
+        if self.rows_per_page is not None and (
+                isinstance(self.rows_per_page, bool) or not isinstance(self.rows_per_page, (int, np.integer))
+                or self.rows_per_page < 1):
+            raise ValueError(f'rows_per_page must be a positive integer, not {self.rows_per_page!r}.')
 
-    def add_to_slide(self, gridslide: GridSlide) -> None:
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in ('df', 'formats'):
+            self.__dict__.pop('cell_text', None)
+        if name in ('df', 'conditional_fill'):
+            self.__dict__.pop('cell_fills', None)
+
+    def __getstate__(self) -> dict:
+        # the cell text and fills are cheaper to recompute than to send to add_slides() workers
+        state = self.__dict__.copy()
+        state.pop('cell_text', None)
+        state.pop('cell_fills', None)
+        return state
+
+    @cached_property
+    def cell_text(self) -> list:
+        """ Text of the cells below the header, as a list of strings per column
+
+        Columns in ``formats`` (a dict of column label to ColumnFormat or to a format spec such as ',.2f', see
+        ``ColumnFormat.from_spec``) are formatted in bulk with NumPy, other columns with ``str(value)``. Computed on
+        the first render and kept, so re-rendering the table (e.g. on each page) does not format the columns again.
+
+        :return:
         """
+        df = self.df.to_frame() if type(self.df) == pd.Series else self.df
+        formats = {} if self.formats is None else self.formats
+        missing = [_ for _ in formats if _ not in df.columns]
+        if missing:
+            raise ValueError(f'formats refers to columns that are not in the DataFrame: {missing}.')
 
-        :param gridslide:
+        texts = []
+        with span('format_cells', formatted=len(formats)):
+            for j, label in enumerate(df.columns):
+                fmt = formats.get(label)
+                if isinstance(fmt, str):
+                    fmt = ColumnFormat.from_spec(fmt)
+                texts.append(_column_text(df.iloc[:, j]) if fmt is None else format_column(df.iloc[:, j], fmt))
+        return texts
+
+    @cached_property
+    def cell_fills(self) -> list:
+        """ a:tcPr XML of the cells below the header from ``conditional_fill``, as a list per column (None for columns
+        without fills). Computed on the first render and kept like ``cell_text``.
+
+        :return:
+        """
+        df = self.df.to_frame() if type(self.df) == pd.Series else self.df
+        if self.conditional_fill is None:
+            return [None] * len(df.columns)
+        with span('cell_fills'):
+            return cell_fills(df, self.conditional_fill)
+
+    def trace_attributes(self) -> dict:
+        df = self.df.to_frame() if type(self.df) == pd.Series else self.df
+        return {'rows': len(df.index), 'columns': len(df.columns), 'cells': int(df.size)}
+
+    def page_rows(self, cy: int) -> int:
+        """ Number of DataFrame rows on each page of a paginated table in a panel *cy* EMU high
+
+        Estimated from ``fontsize`` assuming every cell holds a single line of text, unless ``rows_per_page`` is set.
+        The header row is repeated on each page and takes its share of the height. With ``minimize_height`` the
+        table is just as tall as its rows, otherwise the rows are stretched to fill the panel; the number of rows
+        that fit is the same.
+
+        :param cy:
         :return:
         """
+        if self.rows_per_page is not None:
+            return self.rows_per_page
+        header = Pt(header_fontsize * line_spacing) + cell_margins if self.header else 0
+        row = Pt(self.fontsize * line_spacing) + cell_margins
+        return max(1, (cy - header) // row)
+
+    def fit_rows(self, cx: int, cy: int, start: int, stop: int) -> tuple:
+        """ Font size and row heights at which rows *start* to *stop* fit in a panel *cx* x *cy* EMU
+
+        The font size is the largest one up to ``fontsize`` (and at least fonts.min_fontsize) at which the rows, with
+        the text of each cell wrapped in its column, are at most *cy* high. Cells are measured with the metrics of
+        ``fonts.default_font`` (see grid_pptx.fonts); the width of each cell text is computed once and memoized, so
+        only cells wider than their column are wrapped at each size tried.
+
+        :param cx:
+        :param cy:
+        :param start:
+        :param stop:
+        :return: (font size, list of row heights in EMU including the header row)
+        """
+        texts = [_[start:stop] for _ in self.cell_text]
+        n_rows = stop - start
+        column_width = cx / max(1, len(texts)) / EMU_PER_PT - 2 * inset_x
+        metrics = fonts.font()
+
+        header = 0
+        if self.header:
+            bold = fonts.font(bold=True)
+            df = self.df.to_frame() if type(self.df) == pd.Series else self.df
+            lines = max([bold.line_count(str(_), column_width / header_fontsize) for _ in df.columns], default=1)
+            header = lines * header_fontsize * bold.line_height + 2 * inset_y
+
+        # cells on a single line at every size tried are never wrapped
+        flat = [text for column in texts for text in column]
+        widths = np.array([metrics.text_width(_) for _ in flat]).reshape(len(texts), n_rows)
+        multiline = np.array(['\n' in _ for _ in flat], dtype=bool).reshape(len(texts), n_rows)
+
+        def row_lines(size: int) -> np.ndarray:
+            lines = np.ones((len(texts), n_rows), dtype=int)
+            for j, i in zip(*np.nonzero(multiline | (widths > column_width / size))):
+                lines[j, i] = metrics.line_count(texts[j][i], column_width / size)
+            return lines.max(axis=0, initial=1)
+
+        def heights(size: int) -> np.ndarray:
+            return row_lines(size) * size * metrics.line_height + 2 * inset_y
+
+        size = largest_size(lambda _: header + heights(_).sum() <= cy / EMU_PER_PT, self.fontsize,
+                            min(min_fontsize, self.fontsize))
+        rows = ([header] if self.header else []) + heights(size).tolist()
+        return size, [math.ceil(_ * EMU_PER_PT) for _ in rows]
+
+    def add_to_slide(self, gridslide: GridSlide, rect: tuple = None) -> Optional[GraphicFrame]:
+        """
+
+        :param gridslide:
+        :param rect: (x, y, cx, cy) in EMU assigned by the layout; defaults to the panel's own position
+        :return: the table shape, None when nothing was added
+        """
+
+        df = self.df.to_frame() if type(self.df) == pd.Series else self.df
+        x, y, cx, cy = self.bounds(rect)
 
-        if type(self.df) == pd.Series:
-            self.df = self.df.to_frame()
+        # a paginated table shows the rows for the slide's page and tells the slide how many pages it needs in total
+        start, stop = 0, len(df.index)
+        if self.paginate:
+            page_rows = self.page_rows(cy)
+            gridslide.n_pages = max(gridslide.n_pages, math.ceil(len(df.index) / page_rows))
+            start = gridslide.page * page_rows
+            if gridslide.page and start >= len(df.index):
+                return  # a longer table on the same slide needs more pages than this one
+            stop = min(start + page_rows, len(df.index))
+
+        rows = stop - start + (1 if self.header else 0)
+        if rows == 0:
+            return  # nothing to show: an empty DataFrame without a header row
+
+        # measured row heights of an auto-fit table; rows without a measured height share the table height
+        fontsize, heights = self.fontsize, None
+        if self.autofit:
+            with span('fit_rows', rows=stop - start) as s:
+                fontsize, heights = self.fit_rows(cx, cy, start, stop)
+                s.set(fontsize=fontsize)
+            if heights and not self.minimize_height and cy > sum(heights):
+                # stretch the rows to fill the panel
+                extra = (cy - sum(heights)) // len(heights)
+                heights = [_ + extra for _ in heights]
+                heights[-1] += cy - sum(heights)
+            else:
+                # a compact table, or one whose text overflows the panel even at min_fontsize: the rows keep their
+                # measured heights
+                cy = sum(heights)
 
         # if minimize height, then set a very small initial height so the table will be as compact as possible
         # note: must be done before creating table as cy is a required argument.
-        if self.minimize_height:
-            self.height = 0.5
+        if self.minimize_height and heights is None:
+            cy = Inches(0.5)
 
-        rows = len(self.df.index) + 1 if self.header else 0
-        cols = len(self.df.columns)
+        cols = len(df.columns)
 
         slide = gridslide.slide
 
+        # python-pptx creates (and parses) every a:tc of a new table separately, so only a single empty row is created
+        # here; all rows are written below
         table_shape = slide.shapes.add_table(
-            rows, cols, self.x, self.y, self.cx, self.cy
+            1, cols, x, y, cx, cy
         )
 
         # table style -- ref https://github.com/scanny/python-pptx/issues/27
@@ -133,22 +352,42 @@ class Table(_GridPanel):
         table.first_row = self.header
         table.first_col = self.first_col
 
-        # populate header with df.columns if applicable
-        row_count = 0
+        # write all rows in one go: take the text of each column (see cell_text) and parse the rows from a single XML
+        # string
+        first = 1 if self.header else 0
+        rows_tcs, special = [], []
         if self.header:
-            for i, val in enumerate(self.df.columns):
-                table.cell(row_count, i).text = self.df.columns[i]
-            row_count += 1
-
-        # populate main table values
-        for index, row in self.df.iterrows():
-            for j, value in enumerate(row):
-                table.cell(row_count, j).text = str(value)
+            texts = [str(_) for _ in df.columns]
+            tcs, indices = _tc_xml(texts, '')
+            rows_tcs.append(tcs)
+            special += [(0, j, texts[j]) for j in indices]
+
+        rPr = f'<a:rPr sz="{Pt(fontsize).centipoints}"/>'
+        columns_tcs = []
+        for j, (column, fills) in enumerate(zip(self.cell_text, self.cell_fills)):
+            texts = column[start:stop]
+            tcs, indices = _tc_xml(texts, rPr, None if fills is None else fills[start:stop])
+            columns_tcs.append(tcs)
+            special += [(i + first, j, texts[i]) for i in indices]
+        rows_tcs += zip(*columns_tcs)
+
+        # otherwise row heights as python-pptx divides cy between the rows, the last row absorbing the remainder
+        if heights is None:
+            heights = [cy // rows] * rows
+            heights[-1] = cy - (rows - 1) * heights[-1]
+        xml = ''.join(f'<a:tr h="{h}">{"".join(tcs)}</a:tr>' for h, tcs in zip(heights, rows_tcs))
+
+        tbl.remove(tbl.tr_lst[0])
+        tbl.extend(parse_xml(f'<a:tbl {nsdecls("a")}>{xml}</a:tbl>'))
+
+        for i, j, text in special:
+            cell = table.cell(i, j)
+            cell.text = text
+            if i >= first:
                 try:
                     # set font size
-                    table.cell(row_count, j).text_frame.paragraphs[0].runs[0].font.size = Pt(self.fontsize)
+                    cell.text_frame.paragraphs[0].runs[0].font.size = Pt(fontsize)
                 except IndexError:
-                    # if passing "" as the value for the table, it will raise an error when trying to set
-                    # characteristics of the font
+                    # the first paragraph of e.g. "\nvalue" has no run
                     pass
-            row_count += 1
+        return table_shape
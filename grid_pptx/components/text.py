@@ -1,15 +1,23 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 from dataclasses import dataclass
-from pptx.util import Pt
+from functools import lru_cache
+from xml.sax.saxutils import escape, quoteattr
+import re
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
 from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT
 
 from .panel import _GridPanel
-from grid_pptx import colors
+from grid_pptx.colors import Color, parse_color
+from grid_pptx.fonts import EMU_PER_PT, fit_text, fonts, inset_x, inset_y, largest_size, min_fontsize
 
 # imports for type hints that would normally cause circular imports
 if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+    from pptx.shapes.autoshape import Shape
     from grid_pptx.slide import GridSlide
 
 text_alignments = {
@@ -22,16 +30,37 @@ text_alignments = {
     'thai_distribute': PP_PARAGRAPH_ALIGNMENT.THAI_DISTRIBUTE,
 }
 
+# bullet characters of the outline levels, cycled below the last one
+bullet_chars = ('\u2022', '\u2013', '\u25aa')
+
+# deepest outline level of a DrawingML paragraph (a:pPr lvl)
+max_level = 8
+
+_P_TMPL = '<a:p>%s<a:r>%s<a:t>%s</a:t></a:r></a:p>'
+
+# line ends separating the bullets of ``text``, line breaks within a bullet (\r\n, \r and \n all end a line), and
+# the other control characters, which XML cannot hold
+_LINE_RE = re.compile(r'\r\n?|\n')
+_BREAK_RE = re.compile(r'\r\n?|[\n\v]')
+_CONTROL_RE = re.compile(r'[\x00-\x08\x0c\x0e-\x1f]')
+
 
 @dataclass(kw_only=True)
 class Text(_GridPanel):
     text: str = None
     alignment: str = 'left'
-    fill_color: str = 'white'
-    outline_color: str = None
-    fontcolor: str = 'black'
+    fill_color: Union[str, tuple, Color] = 'white'
+    outline_color: Union[str, tuple, Color] = None
+    fontcolor: Union[str, tuple, Color] = 'black'
     bold: bool = False
     fontsize: int = 16
+    autofit: bool = False  # shrink the font below fontsize as far as needed for the text to fit the panel
+
+    def __post_init__(self) -> None:
+        # resolve the colors once (see grid_pptx.colors.parse_color), not each time the text is rendered
+        for name in ('fill_color', 'outline_color', 'fontcolor'):
+            if getattr(self, name) is not None:
+                setattr(self, name, parse_color(getattr(self, name)))
 
     # def __init__(self, text: str, alignment: str = 'left', outline_color: str = None) -> None:
     #     """
@@ -50,16 +79,40 @@ class Text(_GridPanel):
     #     self.fontsize = 16
     #     self.alignment = alignment
 
-    def add_to_slide(self, gridslide: GridSlide) -> None:
+    def trace_attributes(self) -> dict:
+        return {'characters': len(self.text or '')}
+
+    def add_to_slide(self, gridslide: GridSlide, rect: tuple = None) -> Shape:
         """
 
         :param gridslide:
-        :return:
+        :param rect: (x, y, cx, cy) in EMU assigned by the layout; defaults to the panel's own position
+        :return: the text box
         """
-        slide = gridslide.slide
+        shape = self.add_shape(gridslide, rect)
 
-        shape = slide.shapes.add_shape(
-            MSO_AUTO_SHAPE_TYPE.RECTANGLE, self.x, self.y, self.cx, self.cy
+        # configure text
+        p = shape.text_frame.paragraphs[0]
+        p.alignment = text_alignments[self.alignment]
+        text = self.text or ''
+        run = p.add_run()
+        run.text = text
+        font = run.font
+        font.size = Pt(fit_text(text, shape.width, shape.height, self.fontsize, self.bold) if self.autofit
+                       else self.fontsize)
+        font.bold = self.bold
+        parse_color(self.fontcolor).apply(font.color)
+        return shape
+
+    def add_shape(self, gridslide: GridSlide, rect: tuple = None):
+        """ Add the filled and outlined rectangle holding the text to the slide
+
+        :param gridslide:
+        :param rect: (x, y, cx, cy) in EMU assigned by the layout; defaults to the panel's own position
+        :return: the python-pptx shape
+        """
+        shape = gridslide.slide.shapes.add_shape(
+            MSO_AUTO_SHAPE_TYPE.RECTANGLE, *self.bounds(rect)
         )
 
         # configure fill color
@@ -67,33 +120,129 @@ class Text(_GridPanel):
             shape.fill.background()
         else:
             shape.fill.solid()
-            shape.fill.fore_color.rgb = colors.colors[self.fill_color]
+            parse_color(self.fill_color).apply(shape.fill.fore_color)
 
         # configure outline color
         if self.outline_color is None:
             shape.line.fill.background()
         else:
             shape.line.fill.solid()
-            shape.line.color.rgb = colors.colors[self.outline_color]
-
-        # configure text
-        p = shape.text_frame.paragraphs[0]
-        p.alignment = text_alignments[self.alignment]
-        run = p.add_run()
-        run.text = self.text
-        font = run.font
-        font.size = Pt(self.fontsize)
-        font.bold = self.bold
-        font.color.rgb = colors.colors[self.fontcolor]
+            parse_color(self.outline_color).apply(shape.line.color)
+        return shape
+
+
+@lru_cache(maxsize=256)
+def paragraph_properties(level: int, char: str, indent: int, alignment: str) -> str:
+    """ a:pPr of a bullet paragraph, shared by all the paragraphs of an outline level
+
+    :param level: outline level, 0 for top-level bullets
+    :param char: bullet character
+    :param indent: indent of each level and hanging indent of the bullet in EMU
+    :param alignment: one of text_alignments
+    :return:
+    """
+    return (f'<a:pPr marL="{(level + 1) * indent}" lvl="{level}" indent="{-indent}" '
+            f'algn="{text_alignments[alignment].xml_value}"><a:buFont typeface="Arial"/>'
+            f'<a:buChar char={quoteattr(char)}/></a:pPr>')
+
+
+def outline(items, level: int = 0) -> list:
+    """ (level, text) of each bullet of a nested list, where a list holds the sub-bullets of the item before it, or of
+    an outline DataFrame with a ``text`` and an optional ``level`` column
+
+    :param items:
+    :param level: level of the top-level items
+    :return:
+    """
+    if hasattr(items, 'columns'):
+        if 'text' not in items.columns:
+            raise ValueError(f'An outline DataFrame needs a "text" column, not {list(items.columns)}.')
+        levels = items['level'].tolist() if 'level' in items.columns else [0] * len(items.index)
+        paragraphs = [(int(lvl) + level, str(text)) for lvl, text in zip(levels, items['text'].tolist())]
+    else:
+        paragraphs = []
+        for item in items:
+            if isinstance(item, (list, tuple)):
+                paragraphs += outline(item, level + 1)
+            else:
+                paragraphs.append((level, str(item)))
+
+    if any(not 0 <= lvl <= max_level for lvl, _ in paragraphs):
+        raise ValueError(f'Bullet levels must be from 0 to {max_level}.')
+    return paragraphs
 
 
+@dataclass(kw_only=True)
 class Bullets(Text):
-    def __init__(self, **kwargs) -> None:
+    """
+    A bulleted list, written as one block of XML rather than paragraph by paragraph through python-pptx.
+
+    Give the bullets as ``items``, a nested list (``['a', ['a.1', 'a.2'], 'b']``) or an outline DataFrame with a
+    ``text`` and a ``level`` column; without items, each line of ``text`` is a top-level bullet. All the paragraphs
+    share the run properties, and those at the same level their paragraph properties.
+    """
+
+    items: Union[list, pd.DataFrame] = None
+    bullet_chars: tuple = bullet_chars  # cycled over the levels
+    indent: float = 0.25  # inches per level
+
+    @property
+    def paragraphs(self) -> list:
+        """ (level, text) of each bullet
+
+        :return:
         """
+        if self.items is None:
+            return [(0, _) for _ in _LINE_RE.split(self.text)] if self.text else []
+        return outline(self.items)
 
-        :param kwargs:
+    def trace_attributes(self) -> dict:
+        return {'paragraphs': len(self.paragraphs)}
+
+    def add_to_slide(self, gridslide: GridSlide, rect: tuple = None) -> Shape:
         """
-        super().__init__(**kwargs)
+
+        :param gridslide:
+        :param rect: (x, y, cx, cy) in EMU assigned by the layout; defaults to the panel's own position
+        :return: the text box
+        """
+        paragraphs = self.paragraphs
+        shape = self.add_shape(gridslide, rect)
+        fontsize = self.fit_fontsize(paragraphs, shape.width, shape.height) if self.autofit else self.fontsize
+
+        rPr = (f'<a:rPr sz="{Pt(fontsize).centipoints}" b="{int(self.bold)}"><a:solidFill>'
+               f'{parse_color(self.fontcolor).xml()}</a:solidFill></a:rPr>')
+        indent, br = Inches(self.indent), f'</a:t></a:r><a:br>{rPr}</a:br><a:r>{rPr}<a:t>'
+        pPrs = [paragraph_properties(_, self.bullet_chars[_ % len(self.bullet_chars)], indent, self.alignment)
+                for _ in range(max_level + 1)]
+        xml = ''.join([_P_TMPL % (pPrs[level], rPr, _BREAK_RE.sub(br, escape(_CONTROL_RE.sub('', text))))
+                       for level, text in paragraphs])
+
+        txBody = shape.text_frame._txBody
+        for p in txBody.p_lst:
+            txBody.remove(p)
+        txBody.extend(parse_xml(f'<a:txBody {nsdecls("a")}>{xml or "<a:p/>"}</a:txBody>'))
+        return shape
+
+    def fit_fontsize(self, paragraphs: list, cx: int, cy: int) -> int:
+        """ Largest font size up to ``fontsize`` (and at least fonts.min_fontsize) at which the wrapped bullets fit in
+        a panel *cx* x *cy* EMU, each level being narrower by its indent
+
+        :param paragraphs: (level, text) of each bullet
+        :param cx:
+        :param cy:
+        :return:
+        """
+        metrics = fonts.font(bold=self.bold)
+        width = cx / EMU_PER_PT - 2 * inset_x
+        indent = Inches(self.indent) / EMU_PER_PT
+        texts = [(width - (level + 1) * indent, _BREAK_RE.sub('\n', text)) for level, text in paragraphs]
+
+        def fits(size: int) -> bool:
+            lines = sum([metrics.line_count(text, max(0, text_width) / size) for text_width, text in texts])
+            return lines * size * metrics.line_height <= cy / EMU_PER_PT - 2 * inset_y
+
+        return largest_size(fits, self.fontsize, min(min_fontsize, self.fontsize))
 
 
 class Footnotes(Text):
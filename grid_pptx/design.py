@@ -1,60 +1,116 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Union
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError
+from functools import cached_property
+import threading
+
+import numpy as np
 
 from .components.panel import _GridPanel
+from .tracing import span
 
 if TYPE_CHECKING:  # pragma: no cover
     from grid_pptx import GridSlide
 
+# one record per leaf panel, in depth-first order; ``leaf`` indexes the list returned by ``leaves``
+layout_dtype = np.dtype([
+    ('leaf', np.int32),
+    ('depth', np.int32),
+    ('x', np.int64),
+    ('y', np.int64),
+    ('cx', np.int64),
+    ('cy', np.int64),
+])
 
-class Row(_GridPanel):
-    def __init__(self, value: int, *args: Union[_GridPanel, Column], **kwargs) -> None:
-        """
 
-        :param value:
-        :param args:
-        :param kwargs:
-        """
+class _GridContainer(_GridPanel):
+    """
+    Base class for Row and Column.
+
+    Containers are frozen once created and render without being modified (each panel's position comes from the
+    layout table), so one design can be added to any number of slides. Two containers are equal, and hash equally,
+    when they have the same structure and hold the same component objects.
+    """
+
+    def __init__(self, value: int, *args: _GridPanel, **kwargs) -> None:
         super().__init__(**kwargs)
 
         self.value = value
-        self.containers = [_ for _ in args]
-        self.terminal = len(args) == 1 and not isinstance(args[0], Column)
+        self.containers = tuple(args)
+        self._frozen = True
 
-    def build(self, slide: GridSlide) -> None:
-        """
+    def __setattr__(self, name: str, value) -> None:
+        if self.__dict__.get('_frozen'):
+            raise FrozenInstanceError(f'cannot assign to field {name!r} of a {type(self).__name__}')
+        super().__setattr__(name, value)
 
-        :param slide:
-        :return:
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __reduce__(self) -> tuple:
+        # pickled as a flat list rather than recursively, so designs of any depth can be sent to add_slides workers
+        return _unflatten, (_flatten(self),)
+
+    @cached_property
+    def fingerprint(self) -> tuple:
+        """ Structure of the design, see ``fingerprint``; computed once as the design cannot change """
+        return fingerprint(self)
+
+    @cached_property
+    def key(self) -> tuple:
+        """ Structure of the design and identity of its components """
+        return self.fingerprint, tuple(id(_) for _ in leaves(self))
+
+    def layout(self, slide_width: int, slide_height: int, margins: tuple = (0, 0, 0, 0)) -> np.ndarray:
+        """ Rectangle of every leaf panel when this design fills the slide inside *margins*
+
+        Layouts are cached by the structure of the design (see ``fingerprint``), so the returned array is shared and
+        read-only.
+
+        :param slide_width: EMU
+        :param slide_height: EMU
+        :param margins: (left, top, right, bottom) in EMU
+        :return: structured array of ``layout_dtype``
         """
+        return layouts.layout(self, slide_width, slide_height, margins)
 
-        if self.terminal:  # configure panel and add to slide
-            panel = self.containers[0]
+    def leaves(self) -> list:
+        """ Leaf panels in the order of the ``leaf`` column of ``layout``
 
-            panel.top = self.top
-            panel.height = self.height
-            panel.left = self.left
-            panel.width = self.width
+        :return:
+        """
+        return leaves(self)
 
-            panel.add_to_slide(slide)
+    def build(self, slide: GridSlide) -> list:
+        """ Add the leaf panels to *slide*, filling the slide inside its margins as ``GridSlide.build`` does
 
-        else:
-            left_tracker = self.left
-            for container in self.containers:
-                # Top and height will be the same for all columns in row
-                container.top = self.top
-                container.height = self.height
+        :param slide:
+        :return: see ``render``
+        """
+        prs = slide.prs.prs
+        with span('layout') as s:
+            table = self.layout(prs.slide_width, prs.slide_height, slide.margins)
+            s.set(panels=len(table))
+        return render(self, table, slide)
 
-                # width will be determined by width of current row and value (out of 12) given to panel
-                container.left = left_tracker
-                container.width = container.value / 12.0 * self.width
 
-                container.build(slide)
+class Row(_GridContainer):
+    def __init__(self, value: int, *args: Union[_GridPanel, Column], **kwargs) -> None:
+        """
 
-                left_tracker += container.width
+        :param value:
+        :param args:
+        :param kwargs:
+        """
+        object.__setattr__(self, 'terminal', len(args) == 1 and not isinstance(args[0], Column))
+        super().__init__(value, *args, **kwargs)
 
 
-class Column(_GridPanel):
+class Column(_GridContainer):
     def __init__(self, value: int, *args: Union[_GridPanel, Row], **kwargs) -> None:
         """
 
@@ -62,41 +118,215 @@ class Column(_GridPanel):
         :param args:
         :param kwargs:
         """
-        super().__init__(**kwargs)
+        object.__setattr__(self, 'terminal', len(args) == 1 and not isinstance(args[0], Row))
+        super().__init__(value, *args, **kwargs)
 
-        self.value = value
-        self.containers = [_ for _ in args]
-        self.terminal = len(args) == 1 and not isinstance(args[0], Row)
 
-    def build(self, slide: GridSlide) -> None:
+class LayoutCache:
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """ LRU cache of layout tables keyed by design structure, slide size and margins
+
+        :param maxsize: number of layouts kept; the least recently used one is evicted beyond that
         """
+        self.maxsize = maxsize
+        self.tables = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
 
-        :param slide:
-        :return:
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def layout(self, design: Union[Row, Column], slide_width: int, slide_height: int,
+               margins: tuple = (0, 0, 0, 0)) -> np.ndarray:
+        """ Layout table of *design* filling the slide inside *margins*, from the cache where possible
+
+        :param design:
+        :param slide_width: EMU
+        :param slide_height: EMU
+        :param margins: (left, top, right, bottom) in EMU
+        :return: read-only structured array of ``layout_dtype``
         """
+        key = (design.fingerprint, int(slide_width), int(slide_height), tuple(int(_) for _ in margins))
+
+        with self.lock:
+            table = self.tables.get(key)
+            if table is not None:
+                self.hits += 1
+                self.tables.move_to_end(key)
+                return table
+            self.misses += 1
+
+        left, top, right, bottom = key[3]
+        table = layout(design, left, top, key[1] - left - right, key[2] - top - bottom)
+        table.flags.writeable = False
+
+        with self.lock:
+            self.tables[key] = table
+            while len(self.tables) > self.maxsize:
+                self.tables.popitem(last=False)
+        return table
+
+    def clear(self) -> None:
+        with self.lock:
+            self.tables.clear()
+            self.hits = self.misses = 0
+
+
+def fingerprint(design: Union[Row, Column]) -> tuple:
+    """ Hashable description of everything in *design* that determines its layout: the kind of each container, its
+    ``value`` and the order of its children. Leaf panels only count by position.
+
+    The tree is encoded as a flat tuple of (kind, value, terminal, number of children) in depth-first order, which
+    identifies it uniquely and stays cheap to hash however deep the design is. The terminal flag tells a container
+    holding one leaf panel apart from an empty one.
+
+    :param design:
+    :return:
+    """
+    items = []
+    stack = [design]
+    while stack:
+        container = stack.pop()
+        if container.terminal:
+            items.append((type(container).__name__, container.value, True, 0))
+        else:
+            items.append((type(container).__name__, container.value, False, len(container.containers)))
+            stack.extend(reversed(container.containers))
+    return tuple(items)
+
+
+def _flatten(design: Union[Row, Column]) -> list:
+    """ *design* as a list of nodes in depth-first order: (type, attributes, number of children) for each container
+    and (None, panel, 0) for each other panel, see ``_unflatten``
 
-        if self.terminal:  # configure panel and add to slide
-            panel = self.containers[0]
+    :param design:
+    :return:
+    """
+    nodes = []
+    stack = [design]
+    while stack:
+        panel = stack.pop()
+        if isinstance(panel, _GridContainer):
+            # the cached key refers to object ids, which do not survive pickling
+            attributes = {k: v for k, v in panel.__dict__.items() if k not in ('containers', 'fingerprint', 'key')}
+            nodes.append((type(panel), attributes, len(panel.containers)))
+            stack.extend(reversed(panel.containers))
+        else:
+            nodes.append((None, panel, 0))
+    return nodes
+
+
+def _unflatten(nodes: list) -> Union[Row, Column]:
+    """ Rebuild the design flattened by ``_flatten``
+
+    :param nodes:
+    :return:
+    """
+    stack = []
+    for cls, attributes, n_children in reversed(nodes):  # children are rebuilt before their container
+        if cls is None:
+            stack.append(attributes)
+            continue
+        container = cls.__new__(cls)
+        children = tuple(reversed(stack[len(stack) - n_children:]))
+        del stack[len(stack) - n_children:]
+        container.__dict__.update(attributes, containers=children)
+        stack.append(container)
+    return stack[0]
+
+
+def allocate(values: list, extent: int) -> list:
+    """ Split *extent* EMU between children in proportion to their ``value`` out of 12
+
+    Every child gets the integer part of its exact share and the EMU left over go to the children with the largest
+    remainders (the earliest on ties), so children whose values add up to 12 tile *extent* exactly.
+
+    :param values: integer grid values of the children
+    :param extent: EMU
+    :return: size of each child in EMU
+    """
+    shares = [divmod(value * extent, 12) for value in values]
+    sizes = [_[0] for _ in shares]
+    extra = sum(values) * extent // 12 - sum(sizes)
+    for i in sorted(range(len(shares)), key=lambda i: -shares[i][1])[:extra]:
+        sizes[i] += 1
+    return sizes
 
-            panel.top = self.top
-            panel.height = self.height
-            panel.left = self.left
-            panel.width = self.width
 
-            panel.add_to_slide(slide)
+def layout(design: Union[Row, Column], left: int, top: int, width: int, height: int) -> np.ndarray:
+    """ Lay out *design* in the given box (EMU) without touching any panel
 
+    Each Row splits its width between its Columns and each Column splits its height between its Rows, in
+    proportion to their ``value`` out of 12 (see ``allocate``). All arithmetic is on integer EMU.
+
+    :param design:
+    :param left:
+    :param top:
+    :param width:
+    :param height:
+    :return: structured array of ``layout_dtype``
+    """
+    records = []
+    stack = [(design, left, top, width, height, 0)]  # explicit stack, so nesting depth is not limited by recursion
+    while stack:
+        container, left, top, width, height, depth = stack.pop()
+        if container.terminal:
+            records.append((len(records), depth, left, top, width, height))
+            continue
+
+        sizes = allocate([_.value for _ in container.containers], width if isinstance(container, Row) else height)
+        children = []
+        for child, size in zip(container.containers, sizes):
+            if isinstance(container, Row):
+                children.append((child, left, top, size, height, depth + 1))
+                left += size
+            else:
+                children.append((child, left, top, width, size, depth + 1))
+                top += size
+        stack.extend(reversed(children))  # popped in order, keeping the depth-first leaf order
+
+    return np.array(records, dtype=layout_dtype)
+
+
+def leaves(design: Union[Row, Column]) -> list:
+    """ Leaf panels of *design* in depth-first order
+
+    :param design:
+    :return:
+    """
+    panels = []
+    stack = [design]
+    while stack:
+        container = stack.pop()
+        if container.terminal:
+            panels.append(container.containers[0])
         else:
-            top_tracker = self.top
-            for container in self.containers:
-                # Left and width will be the same for all columns in row
-                container.left = self.left
-                container.width = self.width
+            stack.extend(reversed(container.containers))
+    return panels
+
+
+def render(design: Union[Row, Column], table: np.ndarray, slide: GridSlide) -> list:
+    """ Add the leaf panels of *design* to *slide* at the rectangles in *table*
 
-                # width will be determined by width of current row and value (out of 12) given to panel
+    What rendering creates is returned rather than kept on the panels, which stay unchanged and can be rendered again.
 
-                container.top = top_tracker
-                container.height = container.value / 12.0 * self.height
+    :param design:
+    :param table: output of ``layout`` for *design*
+    :param slide:
+    :return: what the ``add_to_slide`` of each leaf panel returned (e.g. its python-pptx shape or chart), in the order
+        of ``leaves``
+    """
+    panels = leaves(design)
+    results = [None] * len(panels)
+    for leaf, x, y, cx, cy in table[['leaf', 'x', 'y', 'cx', 'cy']].tolist():
+        panel = panels[leaf]
+        with span(type(panel).__name__) as s:
+            if s:  # only computed while tracing
+                s.set(**panel.trace_attributes())
+            results[leaf] = panel.add_to_slide(slide, (x, y, cx, cy))
+    return results
 
-                container.build(slide)
 
-                top_tracker += container.height
+layouts = LayoutCache()
@@ -0,0 +1,369 @@
+"""
+Text measurement from font metrics.
+
+PowerPoint wraps text and sizes table rows when a deck is opened, so nothing in the file says whether a panel's text
+fits. ``FontMetrics`` reads the advance width of every glyph of a font once from its TrueType/OpenType file (the
+``cmap``, ``hmtx``, ``hhea`` and ``head`` tables) and wraps text the way PowerPoint does, greedily at spaces. Word
+and paragraph widths are memoized per font, so measuring the same strings (table cells repeat a lot) at many widths
+and font sizes costs a dictionary lookup.
+
+Fonts are looked up by family name in ``font_dirs``. A font that is not installed is replaced by a metric-compatible
+substitute (e.g. Carlito for Calibri) if one is, and otherwise by a fixed average advance, so measuring never fails.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+import math
+import os
+import struct
+import sys
+import threading
+
+if sys.platform == 'win32':  # pragma: no cover
+    font_dirs = [os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+                 os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts')]
+elif sys.platform == 'darwin':  # pragma: no cover
+    font_dirs = ['/Library/Fonts', '/System/Library/Fonts', os.path.expanduser('~/Library/Fonts')]
+else:
+    font_dirs = ['/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.fonts'),
+                 os.path.expanduser('~/.local/share/fonts')]
+
+# metric-compatible replacements for the usual Office fonts, by lower-case family name
+substitutes = {
+    'calibri': 'carlito',
+    'cambria': 'caladea',
+    'arial': 'liberation sans',
+    'helvetica': 'liberation sans',
+    'times new roman': 'liberation serif',
+    'courier new': 'liberation mono',
+}
+
+# the body font of python-pptx's default template, used for text without a font of its own
+default_font = 'Calibri'
+
+# height of a line as a multiple of the font size for fonts without hhea metrics, as in PowerPoint's single spacing
+default_line_height = 1.2
+
+# text insets of shapes and table cells in points (0.1" left and right, 0.05" top and bottom)
+inset_x = 7.2
+inset_y = 3.6
+
+# auto-fit never makes text smaller than this
+min_fontsize = 6
+
+EMU_PER_PT = 12700
+
+
+class FontMetrics:
+
+    def __init__(self, advances: dict, units_per_em: int, default_advance: int,
+                 line_height: float = default_line_height, name: str = None) -> None:
+        """ Advance widths of a font, and text measured with them
+
+        :param advances: code point -> advance width in font units
+        :param units_per_em: font units per em
+        :param default_advance: advance of characters missing from *advances*
+        :param line_height: line height as a multiple of the font size
+        :param name: font family, for repr
+        """
+        self.advances = advances
+        self.units_per_em = units_per_em
+        self.default_advance = default_advance
+        self.line_height = line_height
+        self.name = name
+        self.space = self.advances.get(ord(' '), default_advance) / units_per_em
+
+        # per-instance caches, so that each font keeps its own most used words and paragraphs
+        self.word_width = lru_cache(maxsize=2 ** 16)(self._word_width)
+        self.text_width = lru_cache(maxsize=2 ** 16)(self._text_width)
+        self.paragraph_lines = lru_cache(maxsize=2 ** 16)(self._paragraph_lines)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.name!r})'
+
+    @classmethod
+    def from_file(cls, path: str) -> FontMetrics:
+        """ Metrics read from a TrueType or OpenType font file
+
+        :param path:
+        :return:
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        tables = {tag: data[offset:offset + length] for tag, (offset, length) in _table_directory(data).items()}
+
+        units_per_em, = struct.unpack_from('>H', tables['head'], 18)
+        ascender, descender, line_gap = struct.unpack_from('>hhh', tables['hhea'], 4)
+        n_metrics, = struct.unpack_from('>H', tables['hhea'], 34)
+        widths = struct.unpack_from(f'>{2 * n_metrics}H', tables['hmtx'])[0::2]
+
+        # glyphs beyond the last horizontal metric have its advance width
+        advances = {codepoint: widths[min(glyph, n_metrics - 1)] for codepoint, glyph in _cmap(tables['cmap']).items()}
+        line_height = (ascender - descender + line_gap) / units_per_em or default_line_height
+        return cls(advances, units_per_em, widths[0], line_height, _names(tables['name'], tables['head'])[0])
+
+    @classmethod
+    def fallback(cls) -> FontMetrics:
+        """ Metrics for fonts that are not installed: half an em per character, a quarter em per space
+
+        :return:
+        """
+        return cls({ord(' '): 250}, 1000, 500, name='fallback')
+
+    def _word_width(self, word: str) -> float:
+        advances, default = self.advances, self.default_advance
+        return sum([advances.get(_, default) for _ in map(ord, word)]) / self.units_per_em
+
+    def _text_width(self, text: str) -> float:
+        """ Width of *text* on a single line, in em
+
+        :param text:
+        :return:
+        """
+        words = text.split(' ')
+        return sum(map(self.word_width, words)) + (len(words) - 1) * self.space
+
+    def _paragraph_lines(self, paragraph: str, width: float) -> int:
+        lines, x = 1, None  # x is the width taken on the current line, None while it is empty
+        for w in map(self.word_width, paragraph.split(' ')):
+            if x is not None and x + self.space + w <= width:
+                x += self.space + w
+                continue
+            if x is not None:
+                lines += 1
+            # words longer than a line are broken between characters
+            extra = max(0, math.ceil(w / width) - 1) if width > 0 else 0
+            lines += extra
+            x = w - extra * width
+        return lines
+
+    def line_count(self, text: str, width: float) -> int:
+        """ Number of lines *text* takes when wrapped at *width* em
+
+        :param text: paragraphs separated by line feeds
+        :param width:
+        :return:
+        """
+        return sum([self.paragraph_lines(_, width) for _ in text.split('\n')])
+
+    def fit_fontsize(self, text: str, width: float, height: float, max_size: int, min_size: int = 1) -> int:
+        """ Largest font size in whole points at which *text* wrapped at *width* points is at most *height* points high
+
+        :param text:
+        :param width:
+        :param height:
+        :param max_size:
+        :param min_size: returned when even this size does not fit
+        :return:
+        """
+        return largest_size(lambda size: self.line_count(text, width / size) * size * self.line_height <= height,
+                            max_size, min_size)
+
+
+def fit_text(text: str, cx: int, cy: int, max_size: int, bold: bool = False, italic: bool = False,
+             font: str = None) -> int:
+    """ Largest font size up to *max_size* at which *text* fits in a text box of *cx* x *cy* EMU with the default
+    insets, and at least min_fontsize
+
+    :param text:
+    :param cx:
+    :param cy:
+    :param max_size:
+    :param bold:
+    :param italic:
+    :param font: font family, default_font when None
+    :return:
+    """
+    metrics = fonts.font(font, bold, italic)
+    return metrics.fit_fontsize(text, cx / EMU_PER_PT - 2 * inset_x, cy / EMU_PER_PT - 2 * inset_y, max_size,
+                                min(min_fontsize, max_size))
+
+
+def largest_size(fits, max_size: int, min_size: int = 1) -> int:
+    """ Largest font size from *min_size* to *max_size* for which *fits(size)* is true, by bisection
+
+    Wrapped text never takes more lines at a smaller size, so *fits* is true up to some size and false beyond it.
+
+    :param fits: callable taking a font size
+    :param max_size:
+    :param min_size: returned when even this size does not fit
+    :return:
+    """
+    low, high = min_size, max_size
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _table_directory(data: bytes) -> dict:
+    """ (offset, length) of each table of a font file, by tag
+
+    :param data: the font file, or at least its header and table directory
+    :return:
+    """
+    if data[:4] not in (b'\x00\x01\x00\x00', b'OTTO', b'true'):
+        raise ValueError('Not a TrueType or OpenType font file.')
+    n_tables, = struct.unpack_from('>H', data, 4)
+    return {tag.decode('latin-1'): (offset, length)
+            for tag, _, offset, length in struct.iter_unpack('>4sLLL', data[12:12 + 16 * n_tables])}
+
+
+def _cmap(data: bytes) -> dict:
+    """ Glyph index of each code point from the Unicode subtable of a cmap table
+
+    :param data: the cmap table
+    :return:
+    """
+    n_subtables, = struct.unpack_from('>H', data, 2)
+    subtables = {}
+    for i in range(n_subtables):
+        platform, encoding, offset = struct.unpack_from('>HHL', data, 4 + 8 * i)
+        subtables[platform, encoding] = offset
+
+    # prefer the full Unicode (format 12) subtables to the BMP (format 4) ones
+    for key in [(3, 10), (0, 4), (0, 6), (3, 1), (0, 3), (0, 0), (0, 1), (0, 2)]:
+        start = subtables.get(key)
+        if start is None:
+            continue
+        fmt, = struct.unpack_from('>H', data, start)
+        if fmt == 12:
+            n_groups, = struct.unpack_from('>L', data, start + 12)
+            glyphs = {}
+            for first, last, glyph in struct.iter_unpack('>LLL', data[start + 16:start + 16 + 12 * n_groups]):
+                glyphs.update(zip(range(first, last + 1), range(glyph, glyph + last - first + 1)))
+            return glyphs
+        if fmt == 4:
+            return _cmap_format_4(data, start)
+    raise ValueError('Font has no Unicode cmap subtable.')
+
+
+def _cmap_format_4(data: bytes, start: int) -> dict:
+    n_segments = struct.unpack_from('>H', data, start + 6)[0] // 2
+    ends = struct.unpack_from(f'>{n_segments}H', data, start + 14)
+    starts = struct.unpack_from(f'>{n_segments}H', data, start + 16 + 2 * n_segments)
+    deltas = struct.unpack_from(f'>{n_segments}h', data, start + 16 + 4 * n_segments)
+    range_offsets_at = start + 16 + 6 * n_segments
+    range_offsets = struct.unpack_from(f'>{n_segments}H', data, range_offsets_at)
+
+    glyphs = {}
+    for i, (first, last, delta, range_offset) in enumerate(zip(starts, ends, deltas, range_offsets)):
+        if first == 0xFFFF:
+            break
+        if range_offset == 0:
+            glyphs.update(zip(range(first, last + 1), ((_ + delta) & 0xFFFF for _ in range(first, last + 1))))
+            continue
+        # glyph ids are read from glyphIdArray, addressed relative to this segment's idRangeOffset entry
+        at = range_offsets_at + 2 * i + range_offset
+        for codepoint, glyph in zip(range(first, last + 1),
+                                    struct.unpack_from(f'>{last - first + 1}H', data, at)):
+            if glyph:
+                glyphs[codepoint] = (glyph + delta) & 0xFFFF
+    return glyphs
+
+
+def _names(name: bytes, head: bytes) -> tuple:
+    """ Family name and (bold, italic) style of a font from its name and head tables
+
+    :param name:
+    :param head:
+    :return:
+    """
+    _, count, strings = struct.unpack_from('>HHH', name)
+    family = None
+    for platform, _, _, name_id, length, at in struct.iter_unpack('>6H', name[6:6 + 12 * count]):
+        if name_id != 1 or platform not in (1, 3):
+            continue
+        family = name[strings + at:strings + at + length].decode('utf-16-be' if platform == 3 else 'mac_roman',
+                                                                 errors='replace')
+        if platform == 3:
+            break
+    mac_style, = struct.unpack_from('>H', head, 44)
+    return family, (bool(mac_style & 1), bool(mac_style & 2))
+
+
+def _file_names(path: str) -> tuple:
+    """ ``_names`` of the font file *path*, reading only its table directory and name and head tables
+
+    :param path:
+    :return:
+    """
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        directory = _table_directory(header + f.read(16 * struct.unpack_from('>H', header, 4)[0]))
+        tables = {}
+        for tag in ('name', 'head'):
+            offset, length = directory[tag]
+            f.seek(offset)
+            tables[tag] = f.read(length)
+    return _names(tables['name'], tables['head'])
+
+
+class FontCache:
+
+    def __init__(self) -> None:
+        """ Metrics of the installed fonts, each read from its file when it is first used """
+        self.files = None  # (lower-case family, bold, italic) -> path, indexed on the first lookup
+        self.metrics = {}  # path -> FontMetrics
+        self.lock = threading.Lock()
+
+    def register(self, path: str) -> None:
+        """ Make the font file *path* available, e.g. a font shipped with a template rather than installed
+
+        :param path:
+        :return:
+        """
+        with self.lock:
+            self._index()
+            self._add(str(path), replace=True)
+
+    def font(self, family: str = None, bold: bool = False, italic: bool = False) -> FontMetrics:
+        """ Metrics of *family*, of its substitute when it is not installed, or of the fallback font
+
+        :param family: font family, default_font when None
+        :param bold:
+        :param italic:
+        :return:
+        """
+        family = (default_font if family is None else family).lower()
+        with self.lock:
+            self._index()
+            for name in [family, substitutes.get(family)]:
+                # a missing bold or italic style is synthesized from the regular one, as PowerPoint does
+                for style in [(bold, italic), (bold, False), (False, italic), (False, False)]:
+                    path = self.files.get((name, *style))
+                    if path is not None:
+                        if path not in self.metrics:
+                            self.metrics[path] = FontMetrics.from_file(path)
+                        return self.metrics[path]
+            if None not in self.metrics:
+                self.metrics[None] = FontMetrics.fallback()
+            return self.metrics[None]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.files = None
+            self.metrics.clear()
+
+    def _index(self) -> None:
+        if self.files is not None:
+            return
+        self.files = {}
+        for directory in font_dirs:
+            for path in sorted(Path(directory).rglob('*')) if os.path.isdir(directory) else []:
+                if path.suffix.lower() in ('.ttf', '.otf'):
+                    self._add(str(path))
+
+    def _add(self, path: str, replace: bool = False) -> None:
+        try:
+            family, style = _file_names(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            return  # not a font file that can be read, e.g. a font collection or a damaged file
+        if family is not None and (replace or (family.lower(), *style) not in self.files):
+            self.files[family.lower(), *style] = path
+
+
+fonts = FontCache()
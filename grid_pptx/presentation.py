@@ -1,11 +1,24 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, IO, Iterable, Union
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import hashlib
+import io
+import math
+import re
 
-from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import parse_xml
+from pptx.opc.package import PartFactory, _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+from pptx.slide import Slide, SlideLayout
 from pptx.util import Inches
 
 from grid_pptx import GridSlide
+from grid_pptx.template import templates
+from grid_pptx.tracing import span
+from grid_pptx.writer import PackageWriter, workbook_policies
 
 # imports for type hints that would normally cause circular imports
 if TYPE_CHECKING:  # pragma: no cover
@@ -23,17 +36,34 @@ class GridPresentation:
 
     def __init__(self, template: Union[str, Path] = None, slide_size: Union[str, tuple, list] = None,
                  header_height: float = 1.0, footer_height: float = 0.75, left_margin: float = 0.5,
-                 right_margin: float = 0.5) -> None:
+                 right_margin: float = 0.5, workbook: str = 'embed',
+                 stream: Union[str, Path, IO[bytes]] = None, compression: str = 'deflate',
+                 compresslevel: int = None, save_workers: int = 1) -> None:
         """ Stores and manipulates a pptx.Presentation instance
 
-        :param template:
+        :param template: path or binary file-like object of a .pptx template. Templates given by path are parsed \
+                once per process (and again when the file changes) and cloned for each presentation.
         :param slide_size:
         :param header_height:
         :param footer_height:
         :param left_margin:
         :param right_margin:
+        :param workbook: How chart workbooks are stored: 'embed' (one per chart), 'none' (cached values only) or \
+                'dedupe' (charts with identical data share one workbook). Charts can override this individually.
+        :param stream: If given, each slide is written to this file as soon as it is built and its XML is released, \
+                so memory use does not grow with the number of slides. Slides cannot be modified after being \
+                added, and ``save`` must be called to finish the file.
+        :param compression: Default zip compression used by ``save``: 'deflate' or 'stored' (fast, larger files).
+        :param compresslevel: Default deflate level from 0 (fastest) to 9 (smallest); None uses zlib's default.
+        :param save_workers: Default number of threads used to compress parts when saving.
         """
-        self.prs = Presentation(template)
+        if workbook not in workbook_policies:
+            raise ValueError(f'workbook must be one of {workbook_policies}, not {workbook!r}.')
+
+        self.template = template
+        self.slide_size = slide_size
+
+        self.prs = templates.presentation(template)
         if template is None:
             if isinstance(slide_size, str):
                 self.prs.slide_width, self.prs.slide_height = (Inches(_) for _ in self.slide_sizes[slide_size])
@@ -48,19 +78,250 @@ class GridPresentation:
         self.left_margin = left_margin
         self.right_margin = right_margin
 
+        self.workbook = workbook
+        self.workbooks = {}  # shared workbook parts for the 'dedupe' policy, keyed by _GridChart.workbook_key()
+
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.save_workers = save_workers
+
+        self.stream = None if stream is None else self._writer(stream)
+
+        # python-pptx finds the next partname, slide id and rId by scanning the package / presentation part, which
+        # makes adding slides and charts O(n). These counters are seeded from the template on first use instead.
+        self.partname_counters = {}
+        self.next_slide_id = None
+        self.next_rId = None
+
         # self.slides = []
 
-    def save(self, loc: Union[str, Path] = Path.home()):
-        """
+    def _writer(self, loc: Union[str, Path, IO[bytes]], compression: str = None, compresslevel: int = None,
+                workers: int = None) -> PackageWriter:
+        """ PackageWriter for *loc*, with options not given falling back to the presentation's defaults
 
         :param loc:
+        :param compression:
+        :param compresslevel:
+        :param workers:
+        :return:
+        """
+        return PackageWriter(
+            loc,
+            compression=self.compression if compression is None else compression,
+            compresslevel=self.compresslevel if compresslevel is None else compresslevel,
+            workers=self.save_workers if workers is None else workers,
+        )
+
+    def save(self, loc: Union[str, Path, IO[bytes]] = Path.home(), compression: str = None,
+             compresslevel: int = None, workers: int = None):
+        """
+
+        :param loc: path or binary file-like object. Ignored when the presentation was created with ``stream``, \
+                which is where it is saved (using the compression options given at creation).
+        :param compression: 'deflate' or 'stored'; defaults to the presentation's ``compression``
+        :param compresslevel: deflate level from 0 to 9; defaults to the presentation's ``compresslevel``
+        :param workers: number of compression threads; defaults to the presentation's ``save_workers``
+        :return:
+        """
+        writer = self.stream if self.stream is not None else self._writer(loc, compression, compresslevel, workers)
+        with span('save', compression=writer.compression, workers=writer.workers, streamed=self.stream is not None):
+            writer.close(self.prs.part.package)
+
+    def save_bytes(self, compression: str = None, compresslevel: int = None, workers: int = None) -> bytes:
+        """ Save the presentation to memory and return the .pptx file contents
+
+        :param compression:
+        :param compresslevel:
+        :param workers:
+        :return:
+        """
+        if self.stream is not None:
+            raise ValueError('save_bytes() cannot be used with a streamed presentation; save() finishes the stream.')
+
+        out = io.BytesIO()
+        self.save(out, compression, compresslevel, workers)
+        return out.getvalue()
+
+    def next_partname(self, tmpl: str) -> PackURI:
+        """ Next free partname for the printf-style *tmpl*, e.g. '/ppt/charts/chart%d.xml'
+
+        The package is scanned once per template, then a counter is incremented. Parts added by calling python-pptx
+        directly are not seen by the counter.
+
+        :param tmpl:
+        :return:
+        """
+        n = self.partname_counters.get(tmpl)
+        if n is None:
+            prefix, suffix = tmpl.split('%d')
+            pattern = re.compile(re.escape(prefix) + r'(\d+)' + re.escape(suffix) + '$')
+            matches = (pattern.match(_.partname) for _ in self.prs.part.package.iter_parts())
+            n = max([int(_.group(1)) for _ in matches if _], default=0)
+
+        n += 1
+        self.partname_counters[tmpl] = n
+        return PackURI(tmpl % n)
+
+    def _append_slide(self, slide_part: SlidePart) -> None:
+        """ Relate *slide_part* to the presentation and add it at the end of the slide list
+
+        Equivalent to the bookkeeping in ``prs.slides.add_slide``, with the rId and slide id taken from counters.
+        ``_sync_slide_counters`` must have been called first.
+
+        :param slide_part:
+        :return:
+        """
+        prs_part = self.prs.part
+        rels = prs_part.rels
+        sldIdLst = prs_part._element.get_or_add_sldIdLst()
+
+        while f'rId{self.next_rId}' in rels:  # taken by a relationship python-pptx added itself
+            self.next_rId += 1
+
+        rId = f'rId{self.next_rId}'
+        rels._rels[rId] = _Relationship(rels._base_uri, rId, RT.SLIDE, RTM.INTERNAL, slide_part)
+        sldIdLst._add_sldId(id=self.next_slide_id, rId=rId)
+        self.next_rId += 1
+        self.next_slide_id += 1
+
+    def _sync_slide_counters(self) -> None:
+        """ Seed the slide id and rId counters, and reseed them (and the slide partname counter) if the last slide was
+        not added by this GridPresentation, i.e. slides were added or removed with python-pptx since
+
+        :return:
+        """
+        prs_part = self.prs.part
+        sldIdLst = prs_part._element.get_or_add_sldIdLst()
+        # lxml counts children by walking them, so only the last one (found from the end) is looked at
+        last = next(sldIdLst.iterchildren(reversed=True), None)
+        if self.next_slide_id is not None and last is not None and last.id == self.next_slide_id - 1:
+            return
+
+        self.next_rId = max([int(_[3:]) for _ in prs_part.rels if _[3:].isdigit()], default=0) + 1
+        self.next_slide_id = max([255] + [int(_) for _ in sldIdLst.xpath('./p:sldId/@id')]) + 1
+        self.partname_counters.pop('/ppt/slides/slide%d.xml', None)
+
+    def _add_slide(self, layout: SlideLayout) -> Slide:
+        """ Equivalent of ``prs.slides.add_slide(layout)`` in O(1)
+
+        :param layout:
         :return:
         """
-        self.prs.save(loc)
+        self._sync_slide_counters()
+        slide_part = SlidePart.new(self.next_partname('/ppt/slides/slide%d.xml'), self.prs.part.package, layout.part)
+        self._append_slide(slide_part)
+        slide = slide_part.slide
+        slide.shapes.clone_layout_placeholders(layout)
+        return slide
+
+    def add_slides(self, designs: list, layout_num: int = 5, titles: list = None, workers: int = 1) -> list:
+        """ Add a slide (plus any continuation slides, see ``add_slide``) for each design, in order, rendering them in
+        *workers* processes
+
+        With ``workers > 1`` each worker process opens the same template, builds a contiguous chunk of the slides and
+        returns their parts (slide XML, charts, workbooks, images) serialized. The parts are then merged into this
+        presentation under new part names, in the order of *designs*. The returned GridSlides refer to the merged
+        slides; what their components created was rendered in the workers, so it is not available from their
+        ``shape``. Designs are pickled to be sent to the workers, so they must be picklable.
+
+        :param designs:
+        :param layout_num:
+        :param titles: one title per design, or None
+        :param workers: number of worker processes; 1 builds the slides in this process with ``add_slide``
+        :return: the GridSlide of the first slide of each design
+        """
+        titles = [None] * len(designs) if titles is None else list(titles)
+        if len(titles) != len(designs):
+            raise ValueError('titles must have one entry per design.')
+
+        if workers <= 1 or len(designs) < 2:
+            return [self.add_slide(design, layout_num, title) for design, title in zip(designs, titles)]
+
+        if self.template is not None and not isinstance(self.template, (str, Path)):
+            raise ValueError('add_slides() with workers > 1 requires a template given by path.')
+
+        settings = dict(template=self.template, slide_size=self.slide_size, header_height=self.header_height,
+                        footer_height=self.footer_height, left_margin=self.left_margin,
+                        right_margin=self.right_margin, workbook=self.workbook)
+        jobs = list(zip(designs, titles))
+        size = math.ceil(len(jobs) / (workers * 4))  # a few chunks per worker to even out their run time
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+
+        with span('add_slides', designs=len(designs), workers=workers, chunks=len(chunks)), \
+                ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+            results = executor.map(_render_slides, [settings] * len(chunks), chunks, [layout_num] * len(chunks))
+            slides = self._merge_slides(results)
+
+        gridslides = []
+        for slide, page in slides:
+            if page == 0:
+                gridslides.append(GridSlide(self, slide, designs[len(gridslides)]))
+            else:
+                first = gridslides[-1]
+                first.n_pages = page + 1
+                first.continuations.append(GridSlide(self, slide, first.design, page=page))
+        return gridslides
+
+    def _merge_slides(self, results: Iterable[tuple]) -> list:
+        """ Add slides rendered by ``_render_slides`` to this presentation, in order
+
+        Each result holds
+            - rendered: for each slide, its page (see ``GridSlide.page``) and a list of (partname, content_type, blob, \
+                rels_xml) with the slide part first
+            - template_parts: partnames of the template parts the slides refer to, e.g. slide layouts. These have \
+                the same name in this package.
+            - workbook_keys: the 'dedupe' key of each shared workbook part, by partname
+
+        :param results:
+        :return: (slide, page) for each merged slide
+        """
+        self._sync_slide_counters()
+        package = self.prs.part.package
+        existing = {_.partname: _ for _ in package.iter_parts()}
+        images = {hashlib.sha1(_.blob).hexdigest(): _ for _ in existing.values() if _.content_type.startswith('image/')}
+
+        slides = []
+        for rendered, template_parts, workbook_keys in results:
+            parts = {_: existing[_] for _ in template_parts}  # worker partname -> part in this package
+            for page, slide_parts in rendered:
+                added = []
+                for partname, content_type, blob, rels_xml in slide_parts:
+                    if partname in parts:
+                        continue  # shared with an earlier slide from the same worker
+                    key = workbook_keys.get(partname)
+                    sha1 = hashlib.sha1(blob).hexdigest() if content_type.startswith('image/') else None
+                    if key in self.workbooks:
+                        parts[partname] = self.workbooks[key]
+                    elif sha1 in images:
+                        parts[partname] = images[sha1]
+                    else:
+                        tmpl = re.sub(r'\d+(?=\.\w+$)', '%d', partname)
+                        part = parts[partname] = PartFactory(self.next_partname(tmpl), content_type, package, blob)
+                        added.append((part, rels_xml))
+                        if key is not None:
+                            self.workbooks[key] = part
+                        if sha1 is not None:
+                            images[sha1] = part
+
+                for part, rels_xml in added:
+                    part.load_rels_from_xml(parse_xml(rels_xml), parts)
+
+                slide_part = parts[slide_parts[0][0]]
+                self._append_slide(slide_part)
+                if self.stream is not None:
+                    self.stream.write_slide(slide_part)
+                slides.append((slide_part.slide, page))
+
+        return slides
 
     def add_slide(self, design: Row, layout_num: int = 5, title: str = None) -> GridSlide:
         """ Add a Slide to the pptx Presentation and a GridSlide to GridPresentation to manage it'
 
+        If the design has paginated tables whose rows do not fit on one slide, continuation slides with the same
+        design, layout and title are added after it, each showing the next rows of the tables (with the header
+        repeated). Their GridSlides are in the ``continuations`` of the returned one. With ``stream`` each slide is
+        written and released as soon as it is built, so memory use does not grow with the number of rows.
+
         :param self:
         :param design:
         :param layout_num:
@@ -70,9 +331,62 @@ class GridPresentation:
 
         layout = self.prs.slide_layouts[layout_num]
 
-        slide = self.prs.slides.add_slide(layout)
-        gridslide = GridSlide(self, slide, design, title=title)
-        # self.slides.append(gridslide)
+        with span('add_slide', layout=layout_num) as s:
+            gridslide = self._build_slide(layout, design, title)
+            for page in range(1, gridslide.n_pages):
+                gridslide.continuations.append(self._build_slide(layout, design, title, page))
+            s.set(pages=gridslide.n_pages)
+
+        return gridslide
+
+    def _build_slide(self, layout: SlideLayout, design: Row, title: str = None, page: int = 0) -> GridSlide:
+        """ Add a slide and build *design* on it
+
+        :param layout:
+        :param design:
+        :param title:
+        :param page:
+        :return:
+        """
+        with span('slide', page=page):
+            slide = self._add_slide(layout)
+            gridslide = GridSlide(self, slide, design, title=title, page=page)
+            # self.slides.append(gridslide)
+
+            gridslide.build()
+
+            if self.stream is not None:
+                with span('write_slide'):
+                    self.stream.write_slide(slide.part)
 
-        gridslide.build()
         return gridslide
+
+
+def _render_slides(settings: dict, jobs: list, layout_num: int) -> tuple:
+    """ Build slides in a fresh GridPresentation and serialize the parts that belong to them
+
+    Runs in a worker process for ``GridPresentation.add_slides``.
+
+    :param settings: GridPresentation arguments
+    :param jobs: (design, title) pairs
+    :param layout_num:
+    :return: (rendered, template_parts, workbook_keys) as expected by ``GridPresentation._merge_slides``
+    """
+    p = GridPresentation(**settings)
+    template_parts = {_.partname for _ in p.prs.part.package.iter_parts()}
+
+    rendered = []
+    for design, title in jobs:
+        first = p.add_slide(design, layout_num, title)
+        for gridslide in [first, *first.continuations]:
+            parts = [gridslide.slide.part]
+            for part in parts:  # grows while iterating to follow chart -> workbook relationships
+                parts.extend(
+                    rel.target_part for rel in part.rels.values()
+                    if not rel.is_external and rel.target_part.partname not in template_parts
+                    and rel.target_part not in parts
+                )
+            rendered.append((gridslide.page,
+                             [(part.partname, part.content_type, part.blob, part.rels.xml) for part in parts]))
+
+    return rendered, template_parts, {part.partname: key for key, part in p.workbooks.items()}
@@ -2,25 +2,38 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pptx.slide import Slide
+from pptx.util import Inches
+
+from .design import render
+from .tracing import span
 
 # imports for type hints that would normally cause circular imports
 if TYPE_CHECKING:  # pragma: no cover
     from grid_pptx import Row, GridPresentation
+    from grid_pptx.components.panel import _GridPanel
 
 
 class GridSlide:
 
-    def __init__(self, prs: GridPresentation, slide: Slide, design: Row, title=None) -> None:
+    def __init__(self, prs: GridPresentation, slide: Slide, design: Row, title=None, page: int = 0) -> None:
         """ Manages a pptx.slides.Slide instance
 
         :param prs:
         :param slide:
         :param design:
         :param title:
+        :param page: index of the slide among the slides showing *design* when it has paginated tables; 0 for the \
+                first slide, 1 for the first continuation slide, etc.
         """
+        self.prs = prs
         self.slide = slide
         self.design = design
 
+        self.page = page
+        self.n_pages = 1  # raised by paginated components while the slide is built
+        self.continuations = []  # GridSlides for the following pages, only kept on the first one
+        self.rendered = []  # what rendering each leaf panel of the design created, see ``shape``
+
         self.left = 0.0
         self.top = 0.0
         self.width = prs.prs.slide_width.inches
@@ -51,14 +64,37 @@ class GridSlide:
         """
         self.slide.shapes.title.text = value
 
-    def build(self):
+    @property
+    def margins(self) -> tuple:
+        """ (left, top, right, bottom) space around the design in EMU; the header and footer are the top and bottom
+
+        :return:
         """
+        return (Inches(self.left_margin), Inches(self.header_height), Inches(self.right_margin),
+                Inches(self.footer_height))
+
+    def build(self):
+        """ Lay out the design on the slide, then add its panels
 
         :return:
         """
-        self.design.left = self.left + self.left_margin
-        self.design.width = self.width - self.left_margin - self.right_margin
-        self.design.top = self.top + self.header_height
-        self.design.height = self.height - self.header_height - self.footer_height
+        # python-pptx finds the id of each new shape by scanning every @id on the slide. In turbo-add mode the ids come
+        # from a counter on the slide's (cached) shape collection instead, seeded once from the current maximum.
+        # All shapes are added through that same collection, so the counter stays accurate.
+        self.slide.shapes.turbo_add_enabled = True
+
+        with span('layout') as s:
+            table = self.design.layout(self.prs.prs.slide_width, self.prs.prs.slide_height, self.margins)
+            s.set(panels=len(table))
+        self.rendered = render(self.design, table, self)
 
-        self.design.build(self)
+    def shape(self, panel: _GridPanel):
+        """ What adding *panel* to this slide created: the python-pptx chart of a chart, the shape of other components
+
+        :param panel: a leaf panel of the slide's design
+        :return: None for a panel that added nothing, e.g. a paginated table on a page past its last row
+        """
+        for leaf, result in zip(self.design.leaves(), self.rendered):
+            if leaf is panel:
+                return result
+        raise ValueError('The panel was not rendered on this slide.')
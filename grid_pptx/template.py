@@ -0,0 +1,114 @@
+"""
+Process-wide cache of parsed .pptx templates.
+
+``pptx.Presentation(path)`` unzips the template and parses every master, layout and theme each time it is called.
+``TemplateCache`` parses a template once per (path, mtime) and hands out clones of the parsed package: XML parts
+get their own copy of the element tree (an lxml deep copy, much cheaper than parsing), while binary parts such as
+theme images and fonts share the cached ``bytes`` object. python-pptx replaces a binary part's blob rather than
+modifying it, so a shared blob is never changed under another deck.
+"""
+from __future__ import annotations
+from typing import IO, Union
+from collections import OrderedDict
+from copy import copy, deepcopy
+from pathlib import Path
+import os
+import threading
+
+from pptx import Presentation
+from pptx.api import _default_pptx_path
+from pptx.opc.oxml import parse_xml
+from pptx.opc.package import OpcPackage, XmlPart
+from pptx.opc.packuri import PACKAGE_URI
+
+
+class TemplateCache:
+
+    def __init__(self, maxsize: int = 8) -> None:
+        """ LRU cache of parsed templates
+
+        :param maxsize: number of templates kept; the least recently used one is evicted beyond that
+        """
+        self.maxsize = maxsize
+        self.templates = OrderedDict()  # path -> (mtime_ns, package, {partname: CT_Relationships})
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def presentation(self, template: Union[str, Path, IO[bytes]] = None):
+        """ A new pptx.Presentation loaded from *template*, cloned from the cache where possible
+
+        File-like templates have no path or mtime to key on and are always parsed.
+
+        :param template: path of a .pptx file, a binary file-like object or None for python-pptx's default template
+        :return:
+        """
+        if template is not None and not isinstance(template, (str, Path)):
+            return Presentation(template)
+
+        path = os.path.abspath(_default_pptx_path() if template is None else template)
+        mtime = os.stat(path).st_mtime_ns
+
+        with self.lock:
+            entry = self.templates.get(path)
+            if entry is not None and entry[0] == mtime:
+                self.hits += 1
+                self.templates.move_to_end(path)
+            else:
+                self.misses += 1
+                entry = self.templates[path] = (mtime, *snapshot(Presentation(path).part.package))
+                self.templates.move_to_end(path)
+                while len(self.templates) > self.maxsize:
+                    self.templates.popitem(last=False)
+
+            return clone(*entry[1:]).presentation_part.presentation
+
+    def clear(self) -> None:
+        with self.lock:
+            self.templates.clear()
+            self.hits = self.misses = 0
+
+
+def snapshot(package: OpcPackage) -> tuple:
+    """ The freshly loaded *package* along with the parsed relationships of it and each of its parts
+
+    :param package:
+    :return:
+    """
+    xml_rels = {PACKAGE_URI: parse_xml(package._rels.xml)}
+    for part in package.iter_parts():
+        xml_rels[part.partname] = parse_xml(part.rels.xml)
+    return package, xml_rels
+
+
+def clone(package: OpcPackage, xml_rels: dict) -> OpcPackage:
+    """ A copy of *package* that can be modified independently of it
+
+    :param package:
+    :param xml_rels: parsed relationships of the package and each part, keyed by partname
+    :return:
+    """
+    new_package = type(package)(package._pkg_file)
+
+    parts = {}
+    for part in package.iter_parts():
+        new_part = copy(part)
+        # lazyproperty values are cached in the instance __dict__ under their public name and refer to the
+        # original part, the relationships are rebuilt below
+        for name in [_ for _ in vars(new_part) if not _.startswith('_') or _ == '_rels']:
+            del new_part.__dict__[name]
+        new_part._package = new_package
+        if isinstance(part, XmlPart):
+            new_part._element = deepcopy(part._element)
+        parts[part.partname] = new_part
+
+    for partname, part in parts.items():
+        part.load_rels_from_xml(xml_rels[partname], parts)
+    new_package._rels.load_from_xml(PACKAGE_URI, xml_rels[PACKAGE_URI], parts)
+    return new_package
+
+
+templates = TemplateCache()
@@ -1,11 +1,17 @@
+import pickle
+
 import pytest
 import pandas as pd
 import numpy as np
+from lxml import etree
 
+from pptx.dml.color import RGBColor
 from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.util import Pt
 
-from grid_pptx.components import chart
+from grid_pptx.components import chart, ConditionalFill
 from grid_pptx import GridPresentation, Row
 
 
@@ -1007,3 +1013,149 @@ class TestSurfaceChart(TestChart):
         else:  # pragma: no cover
             print('test not accounting for all scenarios.')
             assert False
+
+
+class TestChartData:
+    def test_chart_data_not_shared(self, main_df):
+        a = chart.LineChart(df=main_df)
+        b = chart.LineChart(df=main_df)
+        a.prep_chart_data()
+        b.prep_chart_data()
+        assert a.chart_data is not b.chart_data
+
+    def test_series_count_constant(self, main_df):
+        p = GridPresentation()
+        charts = [chart.ColumnChart(df=main_df, title='chart title') for _ in range(5)]
+        rendered = [p.add_slide(layout_num=5, design=Row(12, c)).shape(c) for c in charts]
+
+        assert all(len(_.plots[0].series) == len(main_df.columns) for _ in rendered)
+
+    def test_chart_data_deferred(self, main_df):
+        c = chart.LineChart(df=main_df, title='chart title')
+        assert c.chart_data is None
+
+        GridPresentation().add_slide(layout_num=5, design=Row(12, c))
+        assert c.chart_data is not None
+
+    def test_chart_data_memoized(self, main_df):
+        c = chart.LineChart(df=main_df, title='chart title')
+        p = GridPresentation()
+        p.add_slide(layout_num=5, design=Row(12, c))
+        chart_data = c.chart_data
+
+        p.add_slide(layout_num=5, design=Row(12, c))
+        assert c.chart_data is chart_data
+
+        c.df = main_df * 2
+        p.add_slide(layout_num=5, design=Row(12, c))
+        assert c.chart_data is not chart_data
+
+
+class TestDeprecatedAttributes:
+    def test_chart(self, main_df):
+        c = chart.ColumnChart(df=main_df, title='chart title')
+        gridslide = GridPresentation().add_slide(layout_num=5, design=Row(12, c))
+        with pytest.deprecated_call():
+            assert c.chart is gridslide.shape(c)
+        with pytest.deprecated_call():
+            assert c.x_axis.axis.tick_labels.font.size == Pt(16)
+        with pytest.deprecated_call():
+            assert c.y_axis.axis.major_tick_mark == chart.tick_mark_options['inside']
+
+    def test_not_rendered(self, main_df):
+        c = chart.ColumnChart(df=main_df, title='chart title')
+        with pytest.deprecated_call():
+            assert c.chart is None
+        with pytest.deprecated_call():
+            assert c.x_axis.axis is None
+
+    def test_pickle(self, main_df):
+        c = chart.ColumnChart(df=main_df, title='chart title')
+        GridPresentation().add_slide(layout_num=5, design=Row(12, c))
+        restored = pickle.loads(pickle.dumps(c))
+        with pytest.deprecated_call():
+            assert restored.chart is None
+        assert restored.title == c.title
+
+
+class TestWorkbookPolicy:
+    def add_charts(self, p, dfs, **kwargs):
+        charts = [chart.ColumnChart(df=df, title='chart title', **kwargs) for df in dfs]
+        rendered = [p.add_slide(layout_num=5, design=Row(12, c)).shape(c) for c in charts]
+        return [_.part.chart_workbook.xlsx_part for _ in rendered]
+
+    def test_embed(self, main_df):
+        parts = self.add_charts(GridPresentation(), [main_df, main_df])
+        assert all(parts) and parts[0] is not parts[1]
+
+    def test_none(self, main_df):
+        assert self.add_charts(GridPresentation(workbook='none'), [main_df]) == [None]
+
+    def test_dedupe(self, main_df):
+        parts = self.add_charts(GridPresentation(workbook='dedupe'), [main_df, main_df.copy(), main_df * 2])
+        assert parts[0] is parts[1]
+        assert parts[0] is not parts[2]
+
+    def test_chart_overrides_presentation(self, main_df):
+        assert self.add_charts(GridPresentation(workbook='dedupe'), [main_df], workbook='none') == [None]
+
+    def test_invalid_policy(self, main_df):
+        with pytest.raises(ValueError):
+            GridPresentation(workbook='zip')
+        with pytest.raises(ValueError):
+            self.add_charts(GridPresentation(), [main_df], workbook='zip')
+
+    def test_save_round_trip(self, main_df, tmp_path):
+        from pptx import Presentation
+
+        for policy in ['embed', 'none', 'dedupe']:
+            p = GridPresentation(workbook=policy)
+            self.add_charts(p, [main_df, main_df])
+            p.save(tmp_path / f'{policy}.pptx')
+            assert len(Presentation(tmp_path / f'{policy}.pptx').slides) == 2
+
+
+class TestChartColors:
+    def add_chart(self, c):
+        return GridPresentation().add_slide(layout_num=5, design=Row(12, c)).shape(c).plots[0].series
+
+    def test_palette(self, main_df):
+        series = self.add_chart(chart.ColumnChart(df=main_df, title='chart title', palette=['#010203', 'accent 2']))
+        assert series[0].format.fill.fore_color.rgb == RGBColor(1, 2, 3)
+        assert series[1].format.fill.fore_color.theme_color == MSO_THEME_COLOR.ACCENT_2
+        assert series[2].format.fill.fore_color.rgb == RGBColor(1, 2, 3)
+
+    def test_line_palette(self, main_df):
+        series = self.add_chart(chart.LineChart(df=main_df, title='chart title', palette='office'))
+        assert series[1].format.line.color.rgb == RGBColor.from_string('ED7D31')
+
+    def test_pie_colored_by_category(self, main_df):
+        series = self.add_chart(chart.PieChart(df=main_df[['a']], title='chart title', palette='tab10'))
+        assert [_.format.fill.fore_color.rgb for _ in series[0].points] == \
+            [RGBColor.from_string(_) for _ in ['1F77B4', 'FF7F0E', '2CA02C']]
+
+    def test_colormap(self, main_df):
+        c = chart.BarChart(df=main_df, title='chart title', colormap=ConditionalFill(colors=('black', 'white')))
+        series = self.add_chart(c)
+        assert series[0].points[0].format.fill.fore_color.rgb == RGBColor(0, 0, 0)
+        assert series[1].points[0].format.fill.fore_color.rgb == RGBColor(255, 255, 255)
+
+    def test_matches_python_pptx(self, main_df):
+        colored = self.add_chart(chart.BarChart(df=main_df, title='chart title', palette=['red', 'blue'],
+                                                color_by='category'))
+        series = self.add_chart(chart.BarChart(df=main_df, title='chart title'))
+        for s in series:
+            for j, point in enumerate(s.points):
+                point.format.fill.solid()
+                point.format.fill.fore_color.rgb = RGBColor.from_string(['FF0000', '0000FF'][j % 2])
+        assert [etree.tostring(_._element) for _ in colored] == [etree.tostring(_._element) for _ in series]
+
+    @pytest.mark.parametrize('kwargs', [{'palette': 'rainbow'}, {'palette': ['not a color']}, {'color_by': 'row'},
+                                        {'colormap': 'rainbow'}])
+    def test_invalid(self, main_df, kwargs):
+        with pytest.raises(ValueError):
+            chart.ColumnChart(df=main_df, **kwargs)
+
+    def test_colormap_needs_category_chart(self, main_df):
+        with pytest.raises(ValueError):
+            chart.ScatterChart(df=main_df, x_col='a', y_col='b', colormap='viridis')
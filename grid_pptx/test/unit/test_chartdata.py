@@ -0,0 +1,64 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+
+from grid_pptx.components import chart
+from grid_pptx.components.chartdata import ArrayCategoryChartData
+
+
+@pytest.fixture(params=[
+    XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED_100, XL_CHART_TYPE.BAR_CLUSTERED, XL_CHART_TYPE.COLUMN_STACKED,
+    XL_CHART_TYPE.LINE, XL_CHART_TYPE.LINE_MARKERS, XL_CHART_TYPE.PIE, XL_CHART_TYPE.DOUGHNUT,
+    XL_CHART_TYPE.RADAR, XL_CHART_TYPE.RADAR_FILLED,
+])
+def chart_type(request):
+    return request.param
+
+
+@pytest.fixture(params=[
+    pd.DataFrame({'a': [1, 2, 3], 'b': [9, 8, 7], 'c': [7, 3, 3]}),
+    pd.DataFrame({'a': [1.5, np.nan, 3e20], 'b & c': [0.1, 1e-5, -2.0]}, index=['x & y', '<b>', 'c']),
+    pd.DataFrame({'a': [1, 2, 3]}, index=[0.5, 1.0, 2.25]),
+    pd.DataFrame({'a': pd.Series([1, None, 3], dtype=object)}),
+])
+def df(request):
+    return request.param
+
+
+def build(cls, df):
+    chart_data = cls()
+    chart_data.categories = df.index
+    for column in df.columns:
+        chart_data.add_series(column, df[column])
+    return chart_data
+
+
+class TestArrayCategoryChartData:
+    def test_xml_matches_python_pptx(self, df, chart_type):
+        expected = build(CategoryChartData, df).xml_bytes(chart_type)
+        assert build(ArrayCategoryChartData, df).xml_bytes(chart_type) == expected
+
+    def test_workbook_refs(self, df):
+        expected = build(CategoryChartData, df)
+        chart_data = build(ArrayCategoryChartData, df)
+        assert chart_data.categories_ref == expected.categories_ref
+        assert [chart_data.values_ref(_) for _ in chart_data] == [expected.values_ref(_) for _ in expected]
+
+    def test_supports(self):
+        assert ArrayCategoryChartData.supports(pd.DataFrame({'a': [1, 2]}))
+        assert not ArrayCategoryChartData.supports(pd.DataFrame({'a': [1, 2]}, index=pd.date_range('2022', periods=2)))
+        assert not ArrayCategoryChartData.supports(
+            pd.DataFrame({'a': [1, 2]}, index=pd.MultiIndex.from_tuples([('a', 'b'), ('a', 'c')]))
+        )
+
+    def test_chart_uses_fast_path(self, df):
+        c = chart.LineChart(df=df)
+        c.prep_chart_data()
+        assert isinstance(c.chart_data, ArrayCategoryChartData)
+
+        c = chart.ScatterChart(df=df, x_col='a', y_col='a')
+        c.prep_chart_data()
+        assert not isinstance(c.chart_data, ArrayCategoryChartData)
@@ -1,3 +1,78 @@
+import pickle
+
+import pytest
+
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx.colors import Color, _parse_color, css4_colors, parse_color
+from grid_pptx.components import Text
+
+
 def test_colors():
     from grid_pptx import colors
-    assert colors['aliceblue'] == (240, 248, 255)
\ No newline at end of file
+    assert colors['aliceblue'] == (240, 248, 255)
+
+
+def test_colors_mapping():
+    from grid_pptx import colors
+    assert isinstance(colors['black'], RGBColor)
+    assert len(colors) == len(css4_colors) == 148
+    with pytest.raises(KeyError):
+        colors['not a color']
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('aliceblue', Color(rgb=(240, 248, 255))),
+    ('AliceBlue', Color(rgb=(240, 248, 255))),
+    ('#0A0b0C', Color(rgb=(10, 11, 12))),
+    ('0a0b0c', Color(rgb=(10, 11, 12))),
+    ('#abc', Color(rgb=(170, 187, 204))),
+    ((1, 2, 3), Color(rgb=(1, 2, 3))),
+    ([1, 2, 3], Color(rgb=(1, 2, 3))),
+    ('accent_1', Color(theme='ACCENT_1')),
+    ('Accent 1', Color(theme='ACCENT_1')),
+    ('text1', Color(theme='TEXT_1')),
+    ('followed-hyperlink', Color(theme='FOLLOWED_HYPERLINK')),
+])
+def test_parse_color(value, expected):
+    assert parse_color(value) == expected
+
+
+@pytest.mark.parametrize('value', ['not a color', 'abc', '#12345', (1, 2), (0, 0, 256), (0.5, 0, 0), 3, {'r': 1}])
+def test_parse_color_invalid(value):
+    with pytest.raises(ValueError):
+        parse_color(value)
+
+
+def test_parse_color_cached():
+    color = Color(rgb=(1, 2, 3))
+    assert parse_color(color) is color
+
+    parse_color('#123456')
+    hits = _parse_color.cache_info().hits
+    assert parse_color('#123456') is parse_color('#123456')
+    assert _parse_color.cache_info().hits == hits + 2
+
+
+class TestTextColors:
+    def test_resolved_on_creation(self):
+        t = Text(text='text', fill_color='steelblue', outline_color=None, fontcolor='accent 2')
+        assert t.fill_color == Color(rgb=(70, 130, 180))
+        assert t.outline_color is None
+        assert t.fontcolor == Color(theme='ACCENT_2')
+        assert pickle.loads(pickle.dumps(t)) == t
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Text(text='text', fill_color='not a color')
+
+    def test_rendered(self):
+        t = Text(text='text', fill_color=(1, 2, 3), outline_color='#ABCDEF', fontcolor='text1')
+        p = GridPresentation()
+        p.add_slide(layout_num=5, design=Row(12, t), title='colors')
+        shape = p.prs.slides[-1].shapes[-1]
+        assert shape.fill.fore_color.rgb == RGBColor(1, 2, 3)
+        assert shape.line.color.rgb == RGBColor(0xAB, 0xCD, 0xEF)
+        assert shape.text_frame.paragraphs[0].runs[0].font.color.theme_color == MSO_THEME_COLOR.TEXT_1
@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from grid_pptx.components import ConditionalFill
+from grid_pptx.components.conditional import EMPTY_TCPR, cell_fills, rgb, tcPr_xml
+
+
+def fill_colors(fills: list) -> list:
+    return [None if _ is None else [None if tcPr == EMPTY_TCPR else tcPr.split('"')[1] for tcPr in _] for _ in fills]
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'name': ['a', 'b', 'c'], 'x': [0.0, 5.0, 10.0], 'y': [10, np.nan, 2]})
+
+
+class TestCellFills:
+    def test_gradient(self, df):
+        fills = cell_fills(df, ConditionalFill(colors=('#000000', '#FFFFFF')))
+        assert fill_colors(fills) == [None, ['000000', '808080', 'FFFFFF'], ['FFFFFF', None, '333333']]
+
+    def test_stops(self, df):
+        fill = ConditionalFill(colors=('#FF0000', '#00FF00', '#0000FF'), columns=['x'])
+        assert fill_colors(cell_fills(df, fill))[1] == ['FF0000', '00FF00', '0000FF']
+
+    def test_vmin_vmax(self, df):
+        fill = ConditionalFill(colors=('#000000', '#FFFFFF'), vmin=5, vmax=7.5, columns=['x'])
+        assert fill_colors(cell_fills(df, fill))[1] == ['000000', '000000', 'FFFFFF']
+
+    def test_thresholds(self, df):
+        fill = ConditionalFill(colors=('red', 'white', 'green'), thresholds=(2, 10), na_color='#CCCCCC')
+        assert fill_colors(cell_fills(df, fill)) == [None, ['FF0000', 'FFFFFF', '008000'],
+                                                     ['008000', 'CCCCCC', 'FFFFFF']]
+
+    def test_identical_colors_share_fragment(self, df):
+        fills = cell_fills(pd.concat([df] * 100), ConditionalFill(columns=['x', 'y']))
+        assert len({id(_) for column in fills[1:] for _ in column}) == 5
+        assert fills[1][0] is tcPr_xml(0xF8696B)
+
+    def test_constant_column(self):
+        fills = cell_fills(pd.DataFrame({'x': [3, 3]}), ConditionalFill(colors=('#000000', '#FFFFFF')))
+        assert fill_colors(fills) == [['000000', '000000']]
+
+    @pytest.mark.parametrize('fill', [
+        ConditionalFill(columns=['missing']),
+        ConditionalFill(columns=['name']),
+        ConditionalFill(colors=('red', 'green'), thresholds=(1, 2)),
+        ConditionalFill(colors=('red', 'white', 'green'), thresholds=(2, 1)),
+        ConditionalFill(colors=('red',)),
+    ])
+    def test_invalid(self, df, fill):
+        with pytest.raises(ValueError):
+            cell_fills(df, fill)
+
+
+def test_rgb():
+    assert rgb('#0A0b0C') == (10, 11, 12)
+    assert rgb('aliceblue') == (240, 248, 255)
+    assert rgb((1, 2, 3)) == (1, 2, 3)
+    with pytest.raises(ValueError):
+        rgb('not a color')
+    with pytest.raises(ValueError, match='theme color'):
+        rgb('accent_1')
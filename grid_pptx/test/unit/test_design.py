@@ -1,8 +1,221 @@
+from dataclasses import FrozenInstanceError
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pptx.util import Inches
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, ColumnChart
+from grid_pptx.design import layout_dtype, layouts, LayoutCache, fingerprint, allocate
+
+
+def nested_design():
+    return Row(12,
+               Column(4, Text(text='a')),
+               Column(8,
+                      Row(6, Text(text='b')),
+                      Row(6, Column(6, Text(text='c')), Column(6, Text(text='d')))))
+
+
 class TestRow:
     def test_build(self):
         assert True
 
+    def test_build_on_slide(self):
+        p = GridPresentation()
+        gridslide = p.add_slide(design=Row(12, Text(text='first')))
+        design = nested_design()  # no coordinates, the box comes from the slide
+        rendered = design.build(gridslide)
+
+        table = design.layout(p.prs.slide_width, p.prs.slide_height, gridslide.margins)
+        assert [(_.left, _.top, _.width, _.height) for _ in rendered] == table[['x', 'y', 'cx', 'cy']].tolist()
+        assert [_.text_frame.text for _ in rendered] == ['a', 'b', 'c', 'd']
+
+    def test_layout(self):
+        design = nested_design()
+        table = design.layout(Inches(12), Inches(6), (Inches(0), Inches(1), Inches(0), Inches(1)))
+
+        assert table.dtype == layout_dtype
+        assert table['leaf'].tolist() == [0, 1, 2, 3]
+        assert table['depth'].tolist() == [1, 2, 3, 3]
+        assert table[['x', 'y', 'cx', 'cy']].tolist() == [
+            (Inches(0), Inches(1), Inches(4), Inches(4)),
+            (Inches(4), Inches(1), Inches(8), Inches(2)),
+            (Inches(4), Inches(3), Inches(4), Inches(2)),
+            (Inches(8), Inches(3), Inches(4), Inches(2)),
+        ]
+        assert [_.text for _ in design.leaves()] == ['a', 'b', 'c', 'd']
+
+    def test_layout_is_pure(self):
+        design = nested_design()
+        design.layout(Inches(12), Inches(6))
+        assert all(_.left is None for _ in design.leaves())
+
+    def test_terminal(self):
+        table = Row(12, Text(text='a')).layout(Inches(10), Inches(5), (Inches(1), Inches(1), Inches(1), Inches(1)))
+        assert table[['x', 'y', 'cx', 'cy']].tolist() == [(Inches(1), Inches(1), Inches(8), Inches(3))]
+
+    def test_siblings_tile(self):
+        # 3 levels of rows of 3 columns and columns of 3 rows over an extent that does not divide evenly
+        def grid(depth, cls=Row):
+            other = Column if cls is Row else Row
+            if depth == 0:
+                return cls(4, Text(text='leaf'))
+            return cls(4, *[grid(depth - 1, other) for _ in range(3)])
+
+        table = Row(12, *[grid(3, Column) for _ in range(3)]).layout(9144007, 5143501)
+        area = (table['cx'] * table['cy']).sum()
+        assert area == 9144007 * 5143501
+        assert (table['x'] + table['cx']).max() == 9144007
+        assert (table['y'] + table['cy']).max() == 5143501
+
+    def test_deep(self):
+        design = Row(12, Text(text='leaf'))
+        for i in range(1500):  # nested far deeper than the recursion limit allows for a recursive traversal
+            design = Row(12, Column(6, Text(text=str(i))), Column(6, design))
+
+        table = LayoutCache().layout(design, Inches(10), Inches(8))
+        assert len(table) == len(design.leaves()) == 1501
+        assert table['depth'].max() == 3000
+        assert design.leaves()[-1].text == 'leaf'
+        assert table['cx'][0] == Inches(5)
+
+    def test_render_uses_layout(self):
+        p = GridPresentation()
+        design = nested_design()
+        gridslide = p.add_slide(design=design)
+        table = design.layout(p.prs.slide_width, p.prs.slide_height, gridslide.margins)
+
+        shapes = {_.text_frame.text: _ for _ in gridslide.slide.shapes if _.has_text_frame and _.text_frame.text}
+        for panel, row in zip(design.leaves(), table):
+            shape = shapes[panel.text]
+            assert (shape.left, shape.top, shape.width, shape.height) == tuple(row[['x', 'y', 'cx', 'cy']].tolist())
+
 
 class TestColumn:
     def test_build(self):
         assert True
+
+    def test_layout(self):
+        design = Column(12, Row(3, Text(text='a')), Row(9, Text(text='b')))
+        table = design.layout(Inches(10), Inches(8))
+        assert table[['x', 'y', 'cx', 'cy']].tolist() == [
+            (0, 0, Inches(10), Inches(2)),
+            (0, Inches(2), Inches(10), Inches(6)),
+        ]
+        assert isinstance(table, np.ndarray)
+
+
+class TestAllocate:
+    def test_exact(self):
+        assert allocate([4, 8], 1200) == [400, 800]
+
+    def test_tiles_exactly(self):
+        for extent in [1, 7, 1001, 9144007]:
+            assert sum(allocate([5, 7], extent)) == extent
+            assert sum(allocate([1] * 12, extent)) == extent
+
+    def test_largest_remainder(self):
+        # exact shares are 1.75, 2.5 and 2.75 EMU
+        assert allocate([3, 4, 5], 7) == [2, 2, 3]
+
+    def test_partial(self):
+        assert allocate([3, 3], 10) == [3, 2]
+
+
+class TestLayoutCache:
+    def test_hit_for_same_structure(self):
+        cache = LayoutCache()
+        a = cache.layout(nested_design(), Inches(12), Inches(6))
+        b = cache.layout(nested_design(), Inches(12), Inches(6))
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert a is b
+        with pytest.raises(ValueError):
+            a['x'][0] = 0
+
+    def test_miss_for_different_key(self):
+        cache = LayoutCache()
+        cache.layout(nested_design(), Inches(12), Inches(6))
+        cache.layout(nested_design(), Inches(10), Inches(6))
+        cache.layout(nested_design(), Inches(12), Inches(6), (Inches(1), 0, 0, 0))
+        cache.layout(Row(12, Column(6, Text(text='a')), Column(6, Text(text='b'))), Inches(12), Inches(6))
+        cache.layout(Row(12, Column(4, Text(text='a')), Column(8, Text(text='b'))), Inches(12), Inches(6))
+        assert (cache.misses, cache.hits) == (5, 0)
+
+    def test_fingerprint(self):
+        assert fingerprint(nested_design()) == fingerprint(nested_design())
+        assert fingerprint(Row(12, Column(6, Text(text='a')), Column(6, Text(text='b')))) != \
+            fingerprint(Row(12, Column(6, Row(12, Text(text='a'))), Column(6, Text(text='b'))))
+
+    def test_empty_container(self):
+        cache = LayoutCache()
+        assert fingerprint(Row(12)) != fingerprint(Row(12, Text(text='a')))
+        assert len(cache.layout(Row(12, Text(text='a')), Inches(12), Inches(6))) == 1
+        assert len(cache.layout(Row(12), Inches(12), Inches(6))) == 0
+
+    def test_eviction(self):
+        cache = LayoutCache(maxsize=2)
+        for width in [10, 11, 12, 10]:
+            cache.layout(nested_design(), Inches(width), Inches(6))
+        assert (cache.misses, cache.hits, len(cache)) == (4, 0, 2)
+
+    def test_used_by_slides(self):
+        layouts.clear()
+        p = GridPresentation()
+        for _ in range(3):
+            p.add_slide(design=nested_design())
+        assert (layouts.misses, layouts.hits) == (1, 2)
+
+
+class TestDesignSpec:
+    def test_frozen(self):
+        design = nested_design()
+        with pytest.raises(FrozenInstanceError):
+            design.value = 6
+        with pytest.raises(AttributeError):
+            design.containers.append(Column(12, Text(text='e')))
+
+    def test_hashable(self):
+        text = Text(text='a')
+        a = Row(12, Column(6, text), Column(6, Text(text='b')))
+        assert a == a and hash(a) == hash(a)
+        assert a != Row(12, Column(6, text), Column(6, Text(text='b')))  # different component objects
+        assert Row(12, text) == Row(12, text)
+        assert len({a, a, Row(12, text)}) == 2
+
+    def test_pickle(self):
+        design = nested_design()
+        hash(design)
+        restored = pickle.loads(pickle.dumps(design))
+        assert restored.fingerprint == design.fingerprint
+        assert restored.key != design.key
+
+    def test_pickle_deep(self):
+        design = Row(12, Text(text='leaf'))
+        for i in range(1500):
+            design = Row(12, Column(6, Text(text=str(i))), Column(6, design))
+
+        restored = pickle.loads(pickle.dumps(design))
+        assert restored.fingerprint == design.fingerprint
+        assert [_.text for _ in restored.leaves()] == [_.text for _ in design.leaves()]
+        with pytest.raises(FrozenInstanceError):
+            restored.value = 6
+
+    def test_shared_between_slides(self):
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': [3, 2, 1]})
+        design = Row(12, Column(4, Text(text='shared')), Column(8, ColumnChart(df=df, title='chart title')))
+
+        p = GridPresentation()
+        slides = [p.add_slide(design=design, title=str(i)) for i in range(3)]
+        other = GridPresentation(slide_size='widescreen')
+        slides.append(other.add_slide(design=design))
+
+        for gridslide in slides:
+            prs = gridslide.prs.prs
+            table = design.layout(prs.slide_width, prs.slide_height, gridslide.margins)
+            shapes = [_ for _ in gridslide.slide.shapes if not _.is_placeholder]
+            assert [(_.left, _.top, _.width, _.height) for _ in shapes] == table[['x', 'y', 'cx', 'cy']].tolist()
+        assert design.leaves()[0].left is None
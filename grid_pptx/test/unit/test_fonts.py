@@ -0,0 +1,233 @@
+import struct
+
+import pytest
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row
+from grid_pptx import fonts as fonts_module
+from grid_pptx.components import Bullets, Table, Text
+from grid_pptx.fonts import FontCache, FontMetrics, fit_text, fonts, largest_size
+
+
+def make_font(path, family: str, advances: dict, default: int = 600, units_per_em: int = 1000, bold: bool = False,
+              italic: bool = False, cmap_format: int = 4) -> str:
+    """ Write a minimal TrueType file with the tables read by grid_pptx.fonts
+
+    :param path:
+    :param family:
+    :param advances: character -> advance width in font units
+    :param default: advance of the .notdef glyph
+    :param units_per_em:
+    :param bold:
+    :param italic:
+    :param cmap_format: 4 (BMP segments, read through glyphIdArray) or 12 (groups)
+    :return:
+    """
+    chars = sorted(advances, key=ord)
+    glyphs = {ord(c): i for i, c in enumerate(chars, start=1)}
+
+    head = bytearray(54)
+    struct.pack_into('>H', head, 18, units_per_em)
+    struct.pack_into('>H', head, 44, bold | italic << 1)
+    hhea = bytearray(36)
+    struct.pack_into('>hhh', hhea, 4, 800, -200, 200)
+    struct.pack_into('>H', hhea, 34, len(chars) + 1)
+    hmtx = b''.join(struct.pack('>Hh', _, 0) for _ in [default] + [advances[c] for c in chars])
+
+    if cmap_format == 4:
+        first, last = min(glyphs), max(glyphs)
+        ids = [glyphs.get(_, 0) for _ in range(first, last + 1)]
+        subtable = struct.pack('>7H', 4, 0, 0, 4, 0, 0, 0) + struct.pack('>2H', last, 0xFFFF) + b'\0\0' \
+            + struct.pack('>2H', first, 0xFFFF) + struct.pack('>2h', 0, 1) + struct.pack('>2H', 4, 0) \
+            + struct.pack(f'>{len(ids)}H', *ids)
+        encoding = 1
+    else:
+        groups = [(cp, cp, glyph) for cp, glyph in glyphs.items()]
+        subtable = struct.pack('>HHLLL', 12, 0, 16 + 12 * len(groups), 0, len(groups)) \
+            + b''.join(struct.pack('>LLL', *_) for _ in groups)
+        encoding = 10
+    cmap = struct.pack('>HHHHL', 0, 1, 3, encoding, 12) + subtable
+
+    encoded = family.encode('utf-16-be')
+    name = struct.pack('>HHH', 0, 1, 18) + struct.pack('>6H', 3, 1, 0x409, 1, len(encoded), 0) + encoded
+
+    tables = {'cmap': cmap, 'head': bytes(head), 'hhea': bytes(hhea), 'hmtx': hmtx, 'name': name}
+    offset = 12 + 16 * len(tables)
+    directory, data = b'', b''
+    for tag, table in tables.items():
+        directory += struct.pack('>4sLLL', tag.encode(), 0, offset + len(data), len(table))
+        data += table + b'\0' * (-len(table) % 4)
+    with open(path, 'wb') as f:
+        f.write(struct.pack('>LHHHH', 0x00010000, len(tables), 0, 0, 0) + directory + data)
+    return str(path)
+
+
+# every character half an em wide, spaces a quarter em
+MONO = {**dict.fromkeys('abcdefghijklmnopqrstuvwxyz0123456789', 500), ' ': 250}
+
+
+@pytest.fixture
+def font(tmp_path):
+    return FontMetrics.from_file(make_font(tmp_path / 'mono.ttf', 'Mono', MONO))
+
+
+@pytest.fixture
+def installed(tmp_path, monkeypatch):
+    """ The global font cache with only test fonts installed, 'Mono' as the default font """
+    monkeypatch.setattr(fonts_module, 'font_dirs', [str(tmp_path / 'fonts')])
+    monkeypatch.setattr(fonts_module, 'default_font', 'Mono')
+    (tmp_path / 'fonts').mkdir()
+    make_font(tmp_path / 'fonts' / 'mono.ttf', 'Mono', MONO)
+    make_font(tmp_path / 'fonts' / 'mono-bold.ttf', 'Mono', {c: 2 * w for c, w in MONO.items()}, bold=True)
+    fonts.clear()
+    yield fonts
+    fonts.clear()
+
+
+class TestFontMetrics:
+    @pytest.mark.parametrize('cmap_format', [4, 12])
+    def test_from_file(self, tmp_path, cmap_format):
+        path = make_font(tmp_path / 'f.ttf', 'Test', {'a': 400, 'b': 500, 'é': 700, ' ': 200}, default=900,
+                         units_per_em=2000, cmap_format=cmap_format)
+        metrics = FontMetrics.from_file(path)
+        assert metrics.name == 'Test'
+        assert metrics.advances == {ord('a'): 400, ord('b'): 500, ord('é'): 700, ord(' '): 200}
+        assert metrics.text_width('ab é') == (400 + 500 + 200 + 700) / 2000
+        assert metrics.text_width('z') == 900 / 2000  # not in the font
+        assert metrics.line_height == (800 + 200 + 200) / 2000
+
+    def test_not_a_font(self, tmp_path):
+        (tmp_path / 'f.ttf').write_bytes(b'not a font')
+        with pytest.raises(ValueError):
+            FontMetrics.from_file(tmp_path / 'f.ttf')
+
+    @pytest.mark.parametrize('text, width, lines', [
+        ('aaaa aaaa', 4.25, 1),
+        ('aaaa aaaa', 4.2, 2),
+        ('aaaa aaaa aaaa', 4.25, 2),
+        ('aaaaaaaaaa', 2, 3),  # broken between characters
+        ('aa\naa', 10, 2),
+        ('', 1, 1),
+    ])
+    def test_line_count(self, font, text, width, lines):
+        assert font.line_count(text, width) == lines
+
+    def test_memoized(self, font):
+        font.line_count('abc def', 2)
+        hits = font.word_width.cache_info().hits, font.paragraph_lines.cache_info().hits
+        font.line_count('abc def', 2)
+        font.text_width('def abc')
+        assert font.paragraph_lines.cache_info().hits == hits[1] + 1
+        assert font.word_width.cache_info().hits == hits[0] + 2
+
+    def test_fit_fontsize(self, font):
+        text = 'lorem ipsum dolor sit amet ' * 10
+        size = font.fit_fontsize(text, 200, 100, 40)
+        height = lambda _: font.line_count(text, 200 / _) * _ * font.line_height  # noqa: E731
+        assert height(size) <= 100 < height(size + 1)
+        assert font.fit_fontsize('a', 200, 100, 40) == 40
+        assert font.fit_fontsize(text, 1, 1, 40, min_size=6) == 6
+
+
+def test_largest_size():
+    assert largest_size(lambda _: _ <= 13, 40) == 13
+    assert largest_size(lambda _: False, 40, 6) == 6
+    assert largest_size(lambda _: True, 40) == 40
+
+
+class TestFontCache:
+    def test_lookup(self, installed):
+        regular, bold = installed.font('mono'), installed.font('MONO', bold=True)
+        assert regular.text_width('a') == 0.5 and bold.text_width('a') == 1
+        assert installed.font('Mono', italic=True) is regular  # synthesized from the regular style
+        assert installed.font() is regular  # default_font
+
+    def test_fallback(self, installed):
+        metrics = installed.font('Not Installed')
+        assert metrics.name == 'fallback'
+        assert installed.font('Other') is metrics
+
+    def test_substitute(self, installed, tmp_path):
+        installed.register(make_font(tmp_path / 'carlito.ttf', 'Carlito', MONO))
+        assert installed.font('Calibri').name == 'Carlito'
+
+    def test_register_replaces(self, installed, tmp_path):
+        installed.register(make_font(tmp_path / 'wide.ttf', 'Mono', {'a': 1000}))
+        assert installed.font('Mono').text_width('a') == 1
+
+    def test_parsed_once(self, installed):
+        assert installed.font('Mono') is installed.font('Mono')
+
+    def test_unreadable_files_skipped(self, tmp_path, monkeypatch):
+        (tmp_path / 'broken.ttf').write_bytes(b'\0\1\0\0')
+        monkeypatch.setattr(fonts_module, 'font_dirs', [str(tmp_path), str(tmp_path / 'missing')])
+        assert FontCache().font('anything').name == 'fallback'
+
+
+def test_fit_text(installed):
+    # 144 x 40pt less the insets leaves 129.6 x 32.8pt: 12.96 em per line at 10pt, lines 12pt high
+    cx, cy = 144 * 12700, 40 * 12700
+    assert fit_text('a' * 40, cx, cy, 10) == 10  # 20 em on two lines
+    assert fit_text('a' * 40, cx, cy, 10, bold=True) == 9  # 40 em on three lines of 14.4 em
+    assert fit_text('a' * 40, cx, 20 * 12700, 10) == 6  # 20 em on one line
+    assert fit_text('a' * 400, cx, cy, 10) == 6  # not even at the smallest size
+
+
+class TestAutofit:
+    @staticmethod
+    def shape(panel, has_table: bool = False):
+        p = GridPresentation()
+        p.add_slide(layout_num=5, design=Row(12, panel), title='autofit')
+        return [_ for _ in p.prs.slides[-1].shapes if _.has_table == has_table][-1]
+
+    @staticmethod
+    def font_size(shape) -> float:
+        return shape.text_frame.paragraphs[0].runs[0].font.size.pt
+
+    def test_text(self, installed):
+        text = 'lorem ipsum ' * 200
+        assert 6 <= self.font_size(self.shape(Text(text=text, fontsize=40, autofit=True))) < 40
+        assert self.font_size(self.shape(Text(text='a', fontsize=40, autofit=True))) == 40
+        assert self.font_size(self.shape(Text(fontsize=40, autofit=True))) == 40
+        assert self.font_size(self.shape(Text(text=text, fontsize=40))) == 40
+
+    def test_bullets(self, installed):
+        items = ['lorem ipsum ' * 10, ['lorem ipsum ' * 10] * 10] * 3
+        shape = self.shape(Bullets(items=items, fontsize=40, autofit=True))
+        sizes = {_.runs[0].font.size.pt for _ in shape.text_frame.paragraphs}
+        assert len(sizes) == 1 and 6 <= sizes.pop() < 40
+
+        bullets = Bullets(items=items, fontsize=40)
+        paragraphs = bullets.paragraphs
+        flat = fit_text('\n'.join(text for _, text in paragraphs), shape.width, shape.height, 40)
+        assert bullets.fit_fontsize(paragraphs, shape.width, shape.height) <= flat  # indented levels are narrower
+        assert Bullets(items=['a'], fontsize=40).fit_fontsize([(0, 'a')], shape.width, shape.height) == 40
+
+    def test_table(self, installed):
+        df = pd.DataFrame({'a': ['lorem ipsum dolor sit amet ' * 3] * 10, 'b': range(10)})
+        t = Table(df=df, fontsize=30, autofit=True, minimize_height=False)
+        stretched = self.shape(t, has_table=True)
+        size, heights = t.fit_rows(stretched.width, stretched.height, 0, 10)
+        assert 6 <= size < 30
+        assert {_.get('sz') for _ in stretched._element.xpath('.//a:r/a:rPr')} == {str(size * 100)}
+        assert sum(_.height for _ in stretched.table.rows) == stretched.height  # rows stretched to the panel
+
+        compact = self.shape(Table(df=df, fontsize=30, autofit=True, minimize_height=True), has_table=True)
+        assert [_.height for _ in compact.table.rows] == heights
+        assert sum(heights) == compact.height <= stretched.height
+
+    def test_table_overflows(self, installed):
+        df = pd.DataFrame({'a': ['lorem ipsum dolor sit amet ' * 40] * 20, 'b': range(20)})
+        t = Table(df=df, fontsize=30, autofit=True, minimize_height=False)
+        shape = self.shape(t, has_table=True)
+        panel = self.shape(Text(text='same panel'))
+        size, heights = t.fit_rows(panel.width, panel.height, 0, 20)
+        assert size == 6 and sum(heights) > panel.height
+        assert all(_.height > 0 for _ in shape.table.rows)
+        assert [_.height for _ in shape.table.rows] == heights  # not shrunk to the panel
+        assert shape.height == sum(heights)
+
+    def test_table_fits_at_fontsize(self, installed):
+        t = Table(df=pd.DataFrame({'a': [1, 2]}), fontsize=12, autofit=True, minimize_height=True)
+        shape = self.shape(t, has_table=True)
+        assert {_.get('sz') for _ in shape._element.xpath('.//a:r/a:rPr')} == {'1200'}
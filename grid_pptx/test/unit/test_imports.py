@@ -0,0 +1,48 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# cumulative import time budgets in seconds, several times what they take on a laptop so that slow CI machines pass;
+# each entry also lists top-level packages the statement must not import
+budgets = {
+    'import grid_pptx': (0.15, ['pptx', 'numpy', 'pandas', 'matplotlib']),
+    'from grid_pptx import tracing': (0.15, ['pptx', 'numpy', 'pandas', 'matplotlib']),
+    'from grid_pptx import GridPresentation, Row, Column; from grid_pptx.components import Text':
+        (1.5, ['pandas', 'matplotlib', 'xlsxwriter']),
+    'from grid_pptx.components import Table': (3.0, ['matplotlib', 'xlsxwriter']),
+}
+
+
+def importtime(statement: str) -> tuple:
+    """ Total import time in seconds of *statement* in a fresh interpreter and the modules it imported """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True,
+                            check=True)
+    total, modules = 0, set()
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$', line)
+        if match:
+            modules.add(match[3])
+            if not match[2]:  # top-level import, its cumulative time includes everything below it
+                total += int(match[1])
+    return total / 1e6, modules
+
+
+@pytest.mark.parametrize('statement', budgets)
+def test_import_budget(statement):
+    budget, excluded = budgets[statement]
+    seconds, modules = importtime(statement)
+    assert not [_ for _ in excluded if _ in modules]
+    assert seconds < budget
+
+
+def test_lazy_names():
+    import grid_pptx
+    import grid_pptx.components
+
+    assert grid_pptx.GridPresentation.__module__ == 'grid_pptx.presentation'
+    assert grid_pptx.components.Table.__module__ == 'grid_pptx.components.table'
+    assert {'GridPresentation', 'colors'} <= set(dir(grid_pptx))
+    with pytest.raises(AttributeError):
+        grid_pptx.components.NotAComponent
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from grid_pptx.components import ColumnFormat
+from grid_pptx.components.numberformat import format_column
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(0)
+    # exact decimals with one more digit than shown (e.g. currency amounts to 3 places) end in a 5 one time in ten
+    decimals = [np.round(rng.uniform(-1e5, 1e5, 2000), _) for _ in (1, 2, 3, 5)]
+    values = np.concatenate([rng.normal(0, 1e6, 500), rng.normal(0, 1, 500), rng.integers(-10 ** 9, 10 ** 9, 500),
+                             *decimals])
+    values[:12] = [0, 999.9999, 1000, -999999.5, 123456789.125, 0.5, 28.765, 45.175, 86.65, -0.005, 2.5, -0.125]
+    return pd.Series(values)
+
+
+class TestFormatColumn:
+    @pytest.mark.parametrize('precision', [0, 1, 2, 4])
+    @pytest.mark.parametrize('thousands', [True, False])
+    def test_matches_python(self, values, precision, thousands):
+        spec = f'{"," if thousands else ""}.{precision}f'
+        expected = [format(_, spec) for _ in values.tolist()]
+        # format_column does not write '-0.00' for small negative values
+        expected = [_[1:] if _.startswith('-') and float(_.replace(',', '')) == 0 else _ for _ in expected]
+        assert format_column(values, ColumnFormat(precision=precision, thousands=thousands)) == expected
+
+    def test_percent(self):
+        column = pd.Series([0.1234, -0.5, 1, 12.5])
+        assert format_column(column, ColumnFormat(precision=1, percent=True, thousands=True)) == \
+            ['12.3%', '-50.0%', '100.0%', '1,250.0%']
+
+    def test_prefix_suffix_parentheses(self):
+        column = pd.Series([1234.5, -1234.5, 0])
+        fmt = ColumnFormat(precision=2, thousands=True, prefix='$', suffix=' USD', negative_parentheses=True)
+        assert format_column(column, fmt) == ['$1,234.50 USD', '($1,234.50 USD)', '$0.00 USD']
+        fmt = ColumnFormat(precision=0, prefix='$')
+        assert format_column(column, fmt) == ['$1234', '-$1234', '$0']
+
+    def test_missing_values(self):
+        fmt = ColumnFormat(precision=1, na_rep='n/a')
+        assert format_column(pd.Series([1.25, np.nan, None]), fmt) == ['1.2', 'n/a', 'n/a']
+        assert format_column(pd.Series([1, None, -3], dtype='Int64'), fmt) == ['1.0', 'n/a', '-3.0']
+
+    def test_no_negative_zero(self):
+        assert format_column(pd.Series([-0.001, -0.0]), ColumnFormat(precision=2, negative_parentheses=True)) == \
+            ['0.00', '0.00']
+
+    def test_values_beyond_integer_range(self):
+        column = pd.Series([1e300, -np.inf, 12.5, -2.0 ** 60])
+        fmt = ColumnFormat(precision=1, thousands=True, negative_parentheses=True)
+        assert format_column(column, fmt) == [f'{1e300:,.1f}', '(inf)', '12.5', f'({2.0 ** 60:,.1f})']
+
+    def test_empty(self):
+        assert format_column(pd.Series([], dtype=float), ColumnFormat(precision=2)) == []
+
+    def test_not_numeric(self):
+        with pytest.raises(ValueError):
+            format_column(pd.Series(['a', 'b']), ColumnFormat())
+
+
+class TestFromSpec:
+    @pytest.mark.parametrize('spec, expected', [
+        (',.2f', ColumnFormat(precision=2, thousands=True)),
+        ('.1%', ColumnFormat(precision=1, percent=True)),
+        (',d', ColumnFormat(thousands=True)),
+        ('f', ColumnFormat(precision=6)),
+    ])
+    def test_spec(self, spec, expected):
+        assert ColumnFormat.from_spec(spec) == expected
+
+    def test_kwargs(self):
+        assert ColumnFormat.from_spec(',.0f', prefix='$').prefix == '$'
+
+    @pytest.mark.parametrize('spec', ['', ',', '.2', '.2d', '>10.2f', 'x'])
+    def test_unsupported(self, spec):
+        with pytest.raises(ValueError):
+            ColumnFormat.from_spec(spec)
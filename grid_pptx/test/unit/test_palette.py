@@ -0,0 +1,98 @@
+import re
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from pptx.enum.chart import XL_CHART_TYPE
+
+from grid_pptx.colors import Color
+from grid_pptx.components import ConditionalFill
+from grid_pptx.components.palette import (chart_colors, color_chart_xml, colormaps, palettes, resolve_colormap,
+                                          resolve_palette, shape_xml)
+
+
+def dpt_colors(xml: str) -> dict:
+    return {int(idx): color for idx, color in re.findall(r'<c:dPt><c:idx val="(\d+)"/>.*?val="(\w+)"', xml)}
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'a': [0.0, 5.0, 10.0], 'b': [1, np.nan, 3]}, index=['x', 'y', 'z'])
+
+
+class TestResolve:
+    def test_named_palettes(self):
+        for name in palettes:
+            assert all(isinstance(_, Color) for _ in resolve_palette(name))
+        assert resolve_palette('theme')[0] == Color(theme='ACCENT_1')
+
+    def test_color_sequence(self):
+        assert resolve_palette(['red', (0, 0, 255)]) == (Color(rgb=(255, 0, 0)), Color(rgb=(0, 0, 255)))
+        assert resolve_palette(None) is None
+
+    @pytest.mark.parametrize('palette', ['rainbow', [], ['red', 'not a color']])
+    def test_invalid_palette(self, palette):
+        with pytest.raises(ValueError):
+            resolve_palette(palette)
+
+    def test_colormap(self):
+        fill = ConditionalFill(columns=['a'])
+        assert resolve_colormap(fill) is fill
+        assert resolve_colormap('viridis').colors == colormaps['viridis']
+        assert resolve_colormap(None) is None
+        with pytest.raises(ValueError):
+            resolve_colormap('rainbow')
+
+
+class TestChartColors:
+    def test_series(self, df):
+        palette = resolve_palette(['#010203', 'accent 1', '#0A0B0C'])
+        series, points = chart_colors(df, XL_CHART_TYPE.COLUMN_CLUSTERED, palette)
+        assert series == ['<c:spPr><a:solidFill><a:srgbClr val="010203"/></a:solidFill></c:spPr>',
+                          '<c:spPr><a:solidFill><a:schemeClr val="accent1"/></a:solidFill></c:spPr>']
+        assert points == ['', '']
+
+    def test_series_cycle(self, df):
+        series, _ = chart_colors(pd.concat([df] * 3, axis=1), XL_CHART_TYPE.AREA, resolve_palette(['red', 'blue']))
+        assert series[0] == series[2] == series[4] != series[1]
+
+    def test_lines_and_markers(self, df):
+        palette = resolve_palette(['#010203'])
+        line, _ = chart_colors(df, XL_CHART_TYPE.LINE, palette)
+        markers, _ = chart_colors(df, XL_CHART_TYPE.LINE_MARKERS, palette)
+        scatter, _ = chart_colors(df, XL_CHART_TYPE.XY_SCATTER, palette)
+        assert line[0] == '<c:spPr><a:ln><a:solidFill><a:srgbClr val="010203"/></a:solidFill></a:ln></c:spPr>'
+        assert markers[0].startswith(line[0] + '<c:marker>')
+        assert scatter[0].startswith('<c:marker>')
+
+    def test_category(self, df):
+        series, points = chart_colors(df, XL_CHART_TYPE.PIE, resolve_palette(['#010203', '#040506']), 'category')
+        assert series == ['', '']
+        assert points[0] is points[1]
+        assert dpt_colors(points[0]) == {0: '010203', 1: '040506', 2: '010203'}
+
+    def test_colormap(self, df):
+        fill = ConditionalFill(colors=('#000000', '#FFFFFF'), columns=['b'])
+        series, points = chart_colors(df, XL_CHART_TYPE.BAR_CLUSTERED, resolve_palette(['red']), colormap=fill)
+        assert series[1] != ''
+        assert points[0] == ''
+        assert dpt_colors(points[1]) == {0: '000000', 2: 'FFFFFF'}  # the missing value keeps the series color
+
+    def test_colormap_overrides_category_palette(self, df):
+        fill = ConditionalFill(colors=('#000000', '#FFFFFF'), columns=['a'])
+        _, points = chart_colors(df, XL_CHART_TYPE.BAR_CLUSTERED, resolve_palette(['#010203']), 'category', fill)
+        assert dpt_colors(points[0]) == {0: '000000', 1: '808080', 2: 'FFFFFF'}
+        assert dpt_colors(points[1]) == {0: '010203', 1: '010203', 2: '010203'}
+
+    def test_identical_colors_share_fragment(self):
+        color = Color(rgb=(1, 2, 3))
+        assert shape_xml(color, False, True, False) is shape_xml(Color(rgb=(1, 2, 3)), False, True, False)
+
+
+def test_color_chart_xml():
+    xml = ('<c:ser><c:tx>a</c:tx>\n  <c:cat></c:cat></c:ser>'
+           '<c:ser><c:tx>b</c:tx>\n  <c:spPr><a:ln/></c:spPr>\n  <c:xVal></c:xVal></c:ser>')
+    assert color_chart_xml(xml, ['<S1/>', '<S2/>'], ['<P1/>', '']) == (
+        '<c:ser><c:tx>a</c:tx><S1/>\n<P1/>  <c:cat></c:cat></c:ser>'
+        '<c:ser><c:tx>b</c:tx>\n  <c:spPr><a:ln/></c:spPr><S2/>\n  <c:xVal></c:xVal></c:ser>')
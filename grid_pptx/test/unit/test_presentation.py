@@ -1,6 +1,147 @@
+import io
+import os
+import zipfile
+
+import pytest
+import pandas as pd
+
+from pptx import Presentation
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, ColumnChart
+
+TEMPLATE = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'examples', 'greenblue.pptx')
+
+
 class TestGridPresentation:
     def test_save(self):
         assert True
 
     def test_add_slide(self):
         assert True
+
+
+@pytest.fixture
+def main_df():
+    return pd.DataFrame({'a': [1, 2, 3], 'b': [9, 8, 7], 'c': [7, 3, 3]})
+
+
+def designs(main_df, n_slides=6):
+    return [Row(12,
+                Column(6, Text(text=f'slide {i}')),
+                Column(6, ColumnChart(df=main_df * (i % 3), title='chart title')))
+            for i in range(n_slides)]
+
+
+def members(blob):
+    with zipfile.ZipFile(io.BytesIO(blob)) as z:
+        return {_: z.read(_) for _ in z.namelist()}
+
+
+class TestAddSlides:
+    def test_matches_serial(self, main_df):
+        titles = [f'title {i}' for i in range(6)]
+
+        serial = GridPresentation()
+        serial.add_slides(designs(main_df), titles=titles)
+        parallel = GridPresentation()
+        gridslides = parallel.add_slides(designs(main_df), titles=titles, workers=2)
+
+        assert [_.title for _ in gridslides] == titles
+        expected, actual = members(serial.save_bytes()), members(parallel.save_bytes())
+        assert sorted(expected) == sorted(actual)
+        for name in expected:
+            if not name.endswith('.xlsx'):  # workbooks contain their creation time
+                assert expected[name] == actual[name], name
+
+    def test_after_existing_slides(self, main_df):
+        p = GridPresentation()
+        p.add_slide(designs(main_df, 1)[0], title='first')
+        p.add_slides(designs(main_df), titles=[f'title {i}' for i in range(6)], workers=3)
+        p.add_slide(designs(main_df, 1)[0], title='last')
+
+        prs = Presentation(io.BytesIO(p.save_bytes()))
+        assert [_.shapes.title.text for _ in prs.slides] == ['first', *[f'title {i}' for i in range(6)], 'last']
+        assert len({_.slide_id for _ in prs.slides}) == 8
+        assert all(len(_.shapes) == 3 for _ in prs.slides)
+
+    def test_reuse_built_design(self, main_df):
+        design = designs(main_df, 1)[0]
+        p = GridPresentation()
+        p.add_slide(design, title='first')
+        p.add_slides([design, design], titles=['second', 'third'], workers=2)
+
+        prs = Presentation(io.BytesIO(p.save_bytes()))
+        assert [_.shapes.title.text for _ in prs.slides] == ['first', 'second', 'third']
+        assert all(len(_.shapes) == 3 for _ in prs.slides)
+
+    def test_deep_design(self):
+        design = Row(12, Text(text='leaf'))
+        for i in range(500):  # pickled for the workers far deeper than the recursion limit allows
+            design = Row(12, Column(6, Text(text=str(i))), Column(6, design))
+
+        serial = GridPresentation()
+        serial.add_slides([design, design])
+        parallel = GridPresentation()
+        parallel.add_slides([design, design], workers=2)
+
+        expected, actual = members(serial.save_bytes()), members(parallel.save_bytes())
+        assert sorted(expected) == sorted(actual)
+        assert all(expected[name] == actual[name] for name in expected)
+
+    def test_dedupe(self, main_df):
+        p = GridPresentation(workbook='dedupe')
+        p.add_slides(designs(main_df), workers=2)
+        names = list(members(p.save_bytes()))
+        assert len([_ for _ in names if _.endswith('.xlsx')]) == 3
+
+    def test_stream(self, main_df):
+        out = io.BytesIO()
+        p = GridPresentation(stream=out)
+        p.add_slides(designs(main_df), titles=[f'title {i}' for i in range(6)], workers=2)
+        p.save()
+        prs = Presentation(out)
+        assert [_.shapes.title.text for _ in prs.slides] == [f'title {i}' for i in range(6)]
+
+    def test_template(self, main_df):
+        p = GridPresentation(template=TEMPLATE)
+        n_slides = len(p.prs.slides)
+        p.add_slides(designs(main_df), layout_num=1, workers=2)
+        assert len(Presentation(io.BytesIO(p.save_bytes())).slides) == n_slides + 6
+
+    def test_titles_length(self, main_df):
+        with pytest.raises(ValueError):
+            GridPresentation().add_slides(designs(main_df), titles=['title'], workers=2)
+
+    def test_file_like_template(self, main_df):
+        with open(TEMPLATE, 'rb') as f:
+            p = GridPresentation(template=f)
+        with pytest.raises(ValueError):
+            p.add_slides(designs(main_df), workers=2)
+
+
+class TestCounters:
+    def test_matches_python_pptx_numbering(self, main_df):
+        p = GridPresentation(template=TEMPLATE)
+        n_slides = len(p.prs.slides)
+        for design in designs(main_df, 3):
+            p.add_slide(design, layout_num=1)
+
+        prs = Presentation(io.BytesIO(p.save_bytes()))
+        slides = list(prs.slides)[n_slides:]
+        assert [_.part.partname for _ in slides] == [f'/ppt/slides/slide{n_slides + i + 1}.xml' for i in range(3)]
+        assert [_.slide_id for _ in prs.slides] == list(range(256, 256 + n_slides + 3))
+        charts = sorted(_.partname for _ in prs.part.package.iter_parts() if _.partname.startswith('/ppt/charts/'))
+        assert charts == [f'/ppt/charts/chart{i}.xml' for i in range(1, 4)]
+
+    def test_mixed_with_python_pptx(self, main_df):
+        p = GridPresentation()
+        p.add_slide(designs(main_df, 1)[0])
+        p.prs.notes_master  # python-pptx relates a new part to the presentation part itself
+        p.prs.slides.add_slide(p.prs.slide_layouts[5])
+        p.add_slide(designs(main_df, 1)[0])
+
+        rIds = [_.rId for _ in p.prs.slides._sldIdLst]
+        assert len(set(rIds)) == 3
+        assert len({_.slide_id for _ in p.prs.slides}) == 3
+        assert len(Presentation(io.BytesIO(p.save_bytes())).slides) == 3
@@ -1,3 +1,10 @@
+import pytest
+import pandas as pd
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, Table, ColumnChart
+
+
 class TestGridSlide:
     def test_title(self):
         assert True
@@ -7,3 +14,31 @@ class TestGridSlide:
 
     def test_build(self):
         assert True
+
+    def test_shape_ids(self):
+        df = pd.DataFrame({'a': [1, 2], 'b': [3, 4]})
+        design = Row(12, *[Column(3, component) for component in [
+            Text(text='text'), Table(df=df), ColumnChart(df=df, title='chart title'), Text(text='more text')]])
+
+        p = GridPresentation()
+        gridslide = p.add_slide(design=design, title='title')
+        ids = [_.shape_id for _ in gridslide.slide.shapes]
+        assert len(ids) == len(set(ids)) == 5
+        assert ids == sorted(ids)
+        assert max(ids) == gridslide.slide.shapes._spTree.max_shape_id
+
+        # shapes added directly through python-pptx continue from the same counter
+        shape = gridslide.slide.shapes.add_textbox(0, 0, 10, 10)
+        assert shape.shape_id == max(ids) + 1
+
+    def test_shape(self):
+        df = pd.DataFrame({'a': [1, 2], 'b': [3, 4]})
+        text, table, column_chart = Text(text='text'), Table(df=df), ColumnChart(df=df, title='chart title')
+        design = Row(12, Column(4, text), Column(4, table), Column(4, column_chart))
+
+        gridslide = GridPresentation().add_slide(design=design)
+        assert gridslide.shape(text).text_frame.text == 'text'
+        assert gridslide.shape(table).has_table
+        assert gridslide.shape(column_chart).chart_title.text_frame.text == 'chart title'
+        with pytest.raises(ValueError):
+            gridslide.shape(Text(text='text'))
@@ -1,12 +1,18 @@
 import pytest
 import pandas as pd
 import numpy as np
+from lxml import etree
+
+from pptx import Presentation
 
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.dml.color import RGBColor
+from pptx.table import _Cell
+from pptx.util import Inches, Pt
 
 from grid_pptx.components import table
-from grid_pptx import GridPresentation, Row
+from grid_pptx import GridPresentation, Row, Column
 
 
 @pytest.fixture
@@ -37,3 +43,211 @@ class TestTable:
         """
         print('Missing attributes: ', *[_ for _ in self.list_of_attributes if _ not in mytable.__dict__])
         assert all(hasattr(mytable, attr) for attr in self.list_of_attributes)
+
+
+def per_cell_tbl(df: pd.DataFrame, header: bool = True, fontsize: int = 14):
+    """ a:tbl populated one cell at a time through python-pptx, as Table did before writing rows in bulk """
+    prs = GridPresentation()
+    shape = prs.prs.slides.add_slide(prs.prs.slide_layouts[6]).shapes.add_table(
+        len(df.index) + (1 if header else 0), len(df.columns), 0, 0, Inches(8), Inches(0.5)
+    )
+    table = shape.table
+    if header:
+        for j, column in enumerate(df.columns):
+            table.cell(0, j).text = str(column)
+    rows = zip(*[[str(_) for _ in df[column].tolist()] for column in df.columns])
+    for i, values in enumerate(rows, start=1 if header else 0):
+        for j, value in enumerate(values):
+            table.cell(i, j).text = value
+            runs = table.cell(i, j).text_frame.paragraphs[0].runs
+            if runs:
+                runs[0].font.size = Pt(fontsize)
+    return shape._element.graphic.graphicData.tbl
+
+
+class TestBulkRows:
+    @staticmethod
+    def tbl(t: table.Table):
+        p = GridPresentation()
+        p.add_slide(layout_num=5, design=Row(12, t), title='testing')
+        shape = [_ for _ in p.prs.slides[-1].shapes if _.has_table][0]
+        return shape._element.graphic.graphicData.tbl
+
+    @staticmethod
+    def rows_xml(tbl) -> list:
+        return [etree.tostring(_) for _ in tbl.tr_lst]
+
+    @pytest.mark.parametrize('header', [True, False])
+    def test_matches_per_cell(self, header):
+        df = pd.DataFrame({
+            'int': [1, 2, 3, 4],
+            'float': [0.5, np.nan, 1e20, -2.25],
+            'text': ['a & b', '', '<tag>', 'multi\nline'],
+            'mixed': [None, 'x', 3, '\tindented'],
+            'when': pd.date_range('2024-01-01', periods=4),
+            'flag': [True, False, True, True],
+        })
+        expected = per_cell_tbl(df, header=header, fontsize=10)
+        actual = self.tbl(table.Table(df=df, header=header, fontsize=10))
+        assert self.rows_xml(actual) == self.rows_xml(expected)
+
+    def test_columns_keep_their_dtype(self):
+        # iterrows upcast each row to a common dtype, so integers in a DataFrame with a float column became "1.0"
+        tbl = self.tbl(table.Table(df=pd.DataFrame({'a': [1], 'b': [0.5]})))
+        assert [_.text for _ in tbl.tr_lst[1].tc_lst] == ['1', '0.5']
+
+    def test_series(self):
+        tbl = self.tbl(table.Table(df=pd.Series([1, 2], name='s')))
+        assert [[tc.text for tc in tr.tc_lst] for tr in tbl.tr_lst] == [['s'], ['1'], ['2']]
+
+    def test_empty_without_header(self):
+        p = GridPresentation()
+        p.add_slide(layout_num=5, design=Row(12, table.Table(df=pd.DataFrame({'a': []}), header=False)), title='t')
+        assert not [_ for _ in p.prs.slides[-1].shapes if _.has_table]
+        assert len(self.tbl(table.Table(df=pd.DataFrame({'a': []}))).tr_lst) == 1  # just the header
+
+    def test_empty_strings(self):
+        tbl = self.tbl(table.Table(df=pd.DataFrame({'a': ['', ''], 'b': ['', 'x']})))
+        assert [[tc.text for tc in tr.tc_lst] for tr in tbl.tr_lst] == [['a', 'b'], ['', ''], ['', 'x']]
+
+
+class TestPagination:
+    @staticmethod
+    def table_texts(slide) -> list:
+        tables = [_.table for _ in slide.shapes if _.has_table]
+        return [[[cell.text for cell in row.cells] for row in t.rows] for t in tables]
+
+    def test_continuation_slides(self):
+        df = pd.DataFrame({'a': range(70), 'b': range(70, 0, -1)})
+        p = GridPresentation()
+        first = p.add_slide(design=Row(12, table.Table(df=df, paginate=True, rows_per_page=30)), title='rows')
+
+        gridslides = [first, *first.continuations]
+        assert len(p.prs.slides) == 3
+        assert [_.page for _ in gridslides] == [0, 1, 2]
+        assert all(_.title == 'rows' for _ in gridslides)
+
+        pages = [self.table_texts(_.slide)[0] for _ in gridslides]
+        assert all(rows[0] == ['a', 'b'] for rows in pages)
+        assert [len(rows) - 1 for rows in pages] == [30, 30, 10]
+        assert [row[0] for rows in pages for row in rows[1:]] == [str(_) for _ in range(70)]
+
+    def test_fits_on_one_slide(self, main_df):
+        p = GridPresentation()
+        first = p.add_slide(design=Row(12, table.Table(df=main_df, paginate=True)))
+        assert (first.n_pages, first.continuations, len(p.prs.slides)) == (1, [], 1)
+
+    def test_page_rows(self):
+        t = table.Table(df=pd.DataFrame({'a': range(5)}), fontsize=10)
+        row = Pt(12) + Inches(0.1)
+        header = Pt(18 * 1.2) + Inches(0.1)
+        assert t.page_rows(header + 20 * row) == 20
+        assert t.page_rows(header + 20 * row - 1) == 19
+        assert t.page_rows(0) == 1
+        assert table.Table(df=t.df, fontsize=10, header=False).page_rows(20 * row) == 20
+
+    def test_invalid_rows_per_page(self):
+        df = pd.DataFrame({'a': range(5)})
+        for rows_per_page in [0, -3, 2.5, True]:
+            with pytest.raises(ValueError):
+                table.Table(df=df, paginate=True, rows_per_page=rows_per_page)
+        assert table.Table(df=df, rows_per_page=np.int64(2)).page_rows(0) == 2
+
+    def test_rows_per_page_from_panel_height(self):
+        df = pd.DataFrame({'a': range(200)})
+        p = GridPresentation()
+        first = p.add_slide(design=Row(12, table.Table(df=df, paginate=True)))
+        rows_per_page = [len(self.table_texts(_.slide)[0]) - 1 for _ in [first, *first.continuations]]
+        assert sum(rows_per_page) == 200
+        assert len(set(rows_per_page[:-1])) == 1
+
+    def test_shorter_table_ends_early(self):
+        long, short = pd.DataFrame({'a': range(25)}), pd.DataFrame({'b': range(5)})
+        design = Row(12, Column(6, table.Table(df=long, paginate=True, rows_per_page=10)),
+                     Column(6, table.Table(df=short, paginate=True, rows_per_page=10)))
+        p = GridPresentation()
+        first = p.add_slide(design=design)
+        assert [len(self.table_texts(_.slide)) for _ in [first, *first.continuations]] == [2, 1, 1]
+
+    def test_add_slides_workers(self):
+        designs = [Row(12, table.Table(df=pd.DataFrame({'a': range(n)}), paginate=True, rows_per_page=10))
+                   for n in [5, 25, 12]]
+        serial, parallel = GridPresentation(), GridPresentation()
+        serial.add_slides(designs)
+        gridslides = parallel.add_slides(designs, workers=2)
+
+        assert [len(_.continuations) for _ in gridslides] == [0, 2, 1]
+        assert [self.table_texts(_) for _ in serial.prs.slides] == [self.table_texts(_) for _ in parallel.prs.slides]
+        assert [_.slide for _ in gridslides[1].continuations] == list(parallel.prs.slides)[2:4]
+
+    def test_stream(self, tmp_path):
+        df = pd.DataFrame({'a': range(50)})
+        p = GridPresentation(stream=tmp_path / 'deck.pptx')
+        p.add_slide(design=Row(12, table.Table(df=df, paginate=True, rows_per_page=10)))
+        p.save()
+        assert len(Presentation(tmp_path / 'deck.pptx').slides) == 5
+
+
+class TestFormats:
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({'name': ['a', 'b'], 'revenue': [1234.5, -20.0], 'share': [0.25, np.nan]})
+
+    def test_formatted_cells(self, df):
+        formats = {'revenue': table.ColumnFormat(precision=2, thousands=True, prefix='$', negative_parentheses=True),
+                   'share': '.1%'}
+        t = table.Table(df=df, formats=formats)
+        p = GridPresentation()
+        p.add_slide(design=Row(12, t))
+        rows = [[c.text for c in r.cells] for r in p.prs.slides[0].shapes[1].table.rows]
+        assert rows == [['name', 'revenue', 'share'], ['a', '$1,234.50', '25.0%'], ['b', '($20.00)', '']]
+
+    def test_formatted_once(self, df, monkeypatch):
+        calls = []
+        format_column = table.format_column
+        monkeypatch.setattr(table, 'format_column', lambda *args: calls.append(args) or format_column(*args))
+
+        t = table.Table(df=pd.concat([df] * 10, ignore_index=True), formats={'revenue': ',.0f'}, paginate=True,
+                        rows_per_page=4)
+        p = GridPresentation()
+        first = p.add_slide(design=Row(12, t))
+        p.add_slide(design=Row(12, t))
+        assert len(first.continuations) == 4
+        assert len(calls) == 1
+
+        t.df = df
+        assert 'cell_text' not in vars(t)
+
+    def test_unknown_column(self, df):
+        with pytest.raises(ValueError):
+            GridPresentation().add_slide(design=Row(12, table.Table(df=df, formats={'missing': ',d'})))
+
+
+class TestConditionalFill:
+    def test_matches_python_pptx_fill(self):
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', '', 'multi\nline']})
+        t = table.Table(df=df, conditional_fill=table.ConditionalFill(colors=('#000000', '#FFFFFF')))
+        tbl = TestBulkRows.tbl(t)
+
+        expected = per_cell_tbl(df)
+        for tr, color in zip(expected.tr_lst[1:], ['000000', '808080', 'FFFFFF']):
+            cell = _Cell(tr.tc_lst[0], None)
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = RGBColor.from_string(color)
+        assert TestBulkRows.rows_xml(tbl) == TestBulkRows.rows_xml(expected)
+
+    def test_pages_share_scale(self):
+        df = pd.DataFrame({'a': range(10)})
+        t = table.Table(df=df, paginate=True, rows_per_page=5, header=False,
+                        conditional_fill=table.ConditionalFill(colors=('#000000', '#FFFFFF')))
+        p = GridPresentation()
+        first = p.add_slide(design=Row(12, t))
+        last = first.continuations[0].slide.shapes[1].table
+        assert last.cell(4, 0)._tc.tcPr.xpath('./a:solidFill/a:srgbClr/@val') == ['FFFFFF']
+
+    def test_fills_recomputed_for_new_df(self):
+        t = table.Table(df=pd.DataFrame({'a': [1, 2]}), conditional_fill=table.ConditionalFill())
+        GridPresentation().add_slide(design=Row(12, t))
+        assert 'cell_fills' in vars(t)
+        t.conditional_fill = table.ConditionalFill(colors=('red', 'blue'))
+        assert 'cell_fills' not in vars(t)
@@ -0,0 +1,100 @@
+import os
+import shutil
+import zipfile
+
+import pytest
+
+from pptx import Presentation
+from pptx.opc.package import XmlPart
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text
+from grid_pptx.template import TemplateCache
+
+TEMPLATE = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'examples', 'greenblue.pptx')
+
+
+@pytest.fixture
+def template(tmp_path):
+    path = tmp_path / 'template.pptx'
+    shutil.copy(TEMPLATE, path)
+    return str(path)
+
+
+class TestTemplateCache:
+    def test_parsed_once(self, template):
+        cache = TemplateCache()
+        cache.presentation(template)
+        cache.presentation(template)
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_clones_are_independent(self, template):
+        cache = TemplateCache()
+        a = cache.presentation(template)
+        b = cache.presentation(template)
+        n_slides = len(b.slides)
+        a.slides.add_slide(a.slide_layouts[0])
+        a.slide_layouts[0].name = 'renamed'
+
+        assert len(a.slides) == n_slides + 1
+        assert len(b.slides) == n_slides
+        assert len(cache.presentation(template).slides) == n_slides
+        assert b.slide_layouts[0].name != 'renamed'
+
+    def test_binary_parts_shared(self, template):
+        cache = TemplateCache()
+        a = cache.presentation(template).part.package
+        b = cache.presentation(template).part.package
+        a_parts = {_.partname: _ for _ in a.iter_parts()}
+        for part in b.iter_parts():
+            assert part.package is b
+            if isinstance(part, XmlPart):
+                assert part._element is not a_parts[part.partname]._element
+            else:
+                assert part.blob is a_parts[part.partname].blob
+
+    def test_matches_parsed_template(self, template, tmp_path):
+        cache = TemplateCache()
+        cache.presentation(template)
+        cloned, parsed = cache.presentation(template), Presentation(template)
+        for prs in [cloned, parsed]:
+            prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = 'title'
+        cloned.save(tmp_path / 'cloned.pptx')
+        parsed.save(tmp_path / 'parsed.pptx')
+
+        with zipfile.ZipFile(tmp_path / 'cloned.pptx') as a, zipfile.ZipFile(tmp_path / 'parsed.pptx') as b:
+            assert a.namelist() == b.namelist()
+            for name in a.namelist():
+                assert a.read(name) == b.read(name)
+
+    def test_reloaded_when_modified(self, template):
+        cache = TemplateCache()
+        cache.presentation(template)
+        stat = os.stat(template)
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        cache.presentation(template)
+        assert (cache.misses, cache.hits, len(cache)) == (2, 0, 1)
+
+    def test_eviction(self, template, tmp_path):
+        other = str(tmp_path / 'other.pptx')
+        shutil.copy(template, other)
+
+        cache = TemplateCache(maxsize=1)
+        cache.presentation(template)
+        cache.presentation(other)
+        cache.presentation(template)
+        assert (cache.misses, cache.hits, len(cache)) == (3, 0, 1)
+
+    def test_file_like_not_cached(self, template):
+        cache = TemplateCache()
+        with open(template, 'rb') as f:
+            cache.presentation(f)
+        assert len(cache) == 0
+
+    def test_grid_presentation(self, template, tmp_path):
+        n_slides = len(Presentation(template).slides)
+        for i in range(2):
+            p = GridPresentation(template=template)
+            p.add_slide(design=Row(12, Column(12, Text(text='text'))), layout_num=1, title=f'title {i}')
+            p.save(tmp_path / f'{i}.pptx')
+            assert len(Presentation(tmp_path / f'{i}.pptx').slides) == n_slides + 1
@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
+from lxml import etree
 
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
@@ -37,3 +38,51 @@ class TestText:
         """
         print('Missing attributes: ', *[_ for _ in self.list_of_attributes if _ not in mytext.__dict__])
         assert all(hasattr(mytext, attr) for attr in self.list_of_attributes)
+
+
+class TestBullets:
+    @staticmethod
+    def text_frame(b: text.Bullets):
+        p = GridPresentation()
+        p.add_slide(layout_num=5, design=Row(12, b), title='bullets')
+        return p.prs.slides[-1].shapes[-1].text_frame
+
+    def test_nested_list(self):
+        tf = self.text_frame(text.Bullets(items=['a', ['a.1', ['a.1.1'], 'a.2'], 'b'], fontsize=12, bold=True))
+        assert [(_.level, _.text) for _ in tf.paragraphs] == [(0, 'a'), (1, 'a.1'), (2, 'a.1.1'), (1, 'a.2'), (0, 'b')]
+        assert {(_.runs[0].font.size.pt, _.runs[0].font.bold) for _ in tf.paragraphs} == {(12, True)}
+        chars = [_._p.xpath('./a:pPr/a:buChar/@char')[0] for _ in tf.paragraphs]
+        assert chars == ['•', '–', '▪', '–', '•']
+
+    def test_levels_share_paragraph_properties(self):
+        tf = self.text_frame(text.Bullets(items=['a', ['b', 'c'], 'd'], bullet_chars=('*',), indent=0.5))
+        pPrs = [etree.tostring(_._p.pPr) for _ in tf.paragraphs]
+        assert pPrs[0] == pPrs[3] != pPrs[1] == pPrs[2]
+        assert [_._p.pPr.get('marL') for _ in tf.paragraphs] == ['457200', '914400', '914400', '457200']
+        assert text.paragraph_properties(1, '*', 457200, 'left') is text.paragraph_properties(1, '*', 457200, 'left')
+
+    def test_outline_dataframe(self):
+        df = pd.DataFrame({'level': [0, 1, 1], 'text': ['a', 'b', 3]})
+        assert text.Bullets(items=df).paragraphs == [(0, 'a'), (1, 'b'), (1, '3')]
+        assert text.Bullets(items=df[['text']]).paragraphs == [(0, 'a'), (0, 'b'), (0, '3')]
+
+    @pytest.mark.parametrize('items', [pd.DataFrame({'label': ['a']}), pd.DataFrame({'text': ['a'], 'level': [9]}),
+                                       [[[[[[[[[['too deep']]]]]]]]]]])
+    def test_invalid_outline(self, items):
+        with pytest.raises(ValueError):
+            text.Bullets(items=items).paragraphs
+
+    def test_text_lines(self):
+        assert text.Bullets(text='a\nb').paragraphs == [(0, 'a'), (0, 'b')]
+        assert text.Bullets(text='a\r\nb\rc').paragraphs == [(0, 'a'), (0, 'b'), (0, 'c')]
+        assert [_.text for _ in self.text_frame(text.Bullets(text='')).paragraphs] == ['']
+
+    def test_special_characters(self):
+        tf = self.text_frame(text.Bullets(items=['<a> & "b"', 'line\nbreak', 'bell\x07']))
+        assert [_.text for _ in tf.paragraphs] == ['<a> & "b"', 'line\vbreak', 'bell']
+        assert len(tf.paragraphs[1]._p.xpath('./a:br/a:rPr')) == 1
+
+    def test_carriage_returns(self):
+        tf = self.text_frame(text.Bullets(items=['crlf\r\nbreak', 'cr\rbreak']))
+        assert [_.text for _ in tf.paragraphs] == ['crlf\vbreak', 'cr\vbreak']
+        assert '\r' not in ''.join(tf._txBody.xpath('.//a:t/text()'))
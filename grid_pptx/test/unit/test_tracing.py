@@ -0,0 +1,112 @@
+import io
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from grid_pptx import GridPresentation, Row, tracing
+from grid_pptx.components import ColumnChart, Table
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=['x', 'y', 'z'])
+
+
+def render(df: pd.DataFrame) -> None:
+    p = GridPresentation()
+    p.add_slide(design=Row(12, Row(6, ColumnChart(df=df, title='chart title')), Row(6, Table(df=df))), title='t')
+    p.save_bytes()
+
+
+class TestSpans:
+    def test_disabled(self):
+        assert tracing.tracer is None
+        with tracing.span('phase', n=1) as s:
+            s.set(m=2)
+        assert not s
+        assert tracing.span('other') is s  # one shared no-op span
+
+    def test_nesting(self):
+        with tracing.trace(name='root', deck=1) as tracer:
+            with tracing.span('outer') as outer:
+                with tracing.span('inner', n=1) as inner:
+                    inner.set(m=2)
+            with tracing.span('sibling'):
+                pass
+        assert [_.name for _ in tracer.spans] == ['inner', 'outer', 'sibling', 'root']
+        root = tracer.spans[-1]
+        assert root.parent is None and root.attributes == {'deck': 1}
+        assert inner.parent == outer.id and outer.parent == root.id == tracer.spans[2].parent
+        assert inner.attributes == {'n': 1, 'm': 2}
+        assert root.duration >= outer.duration >= inner.duration >= 0
+        assert tracing.tracer is None
+
+    def test_restored_after_error(self):
+        with pytest.raises(KeyError):
+            with tracing.trace() as tracer:
+                with tracing.span('failing'):
+                    raise KeyError
+        assert tracing.tracer is None
+        assert [_.name for _ in tracer.spans] == ['failing', 'deck']
+
+    def test_threads(self):
+        def work():
+            with tracing.span('worker'):
+                pass
+
+        with tracing.trace() as tracer:
+            thread = threading.Thread(target=work)
+            with tracing.span('main'):
+                thread.start()
+                thread.join()
+        worker = [_ for _ in tracer.spans if _.name == 'worker'][0]
+        assert worker.parent is None and worker.thread != tracer.spans[-1].thread
+
+
+class TestRender:
+    def test_phases(self, df):
+        with tracing.trace() as tracer:
+            render(df)
+        spans = {_.name: _ for _ in tracer.spans}
+        ids = {_.id: _.name for _ in tracer.spans}
+        parents = {_.name: ids.get(_.parent) for _ in tracer.spans}
+        assert parents == {
+            'deck': None, 'add_slide': 'deck', 'slide': 'add_slide', 'layout': 'slide', 'ColumnChart': 'slide',
+            'prep_chart_data': 'ColumnChart', 'chart_xml': 'ColumnChart', 'workbook': 'ColumnChart', 'Table': 'slide',
+            'format_cells': 'Table', 'save': 'deck',
+        }
+        assert spans['ColumnChart'].attributes == {'chart_type': 'COLUMN_CLUSTERED', 'rows': 3, 'columns': 2,
+                                                   'points': 6}
+        assert spans['Table'].attributes == {'rows': 3, 'columns': 2, 'cells': 6}
+        assert spans['add_slide'].attributes == {'layout': 5, 'pages': 1}
+        assert spans['workbook'].attributes == {'policy': 'embed'}
+        assert set(tracer.totals()) == set(spans)
+
+    def test_paginated(self, df):
+        with tracing.trace() as tracer:
+            GridPresentation().add_slide(design=Row(12, Table(df=df, paginate=True, rows_per_page=1)))
+        assert [_.attributes['page'] for _ in tracer.spans if _.name == 'slide'] == [0, 1, 2]
+
+
+class TestExporters:
+    def test_json_lines(self, df, tmp_path):
+        stream = io.StringIO()
+        with tracing.trace(tracing.JsonLinesExporter(stream), tracing.JsonLinesExporter(tmp_path / 'trace.jsonl')):
+            render(df)
+        records = [json.loads(_) for _ in stream.getvalue().splitlines()]
+        assert records[-1]['name'] == 'deck' and records[-1]['parent'] is None
+        assert {_['name']: _['attributes'] for _ in records}['Table'] == {'rows': 3, 'columns': 2, 'cells': 6}
+        assert all(_['duration'] >= 0 and _['start'] >= 0 for _ in records)
+        assert (tmp_path / 'trace.jsonl').read_text().count('\n') == len(records)
+
+    def test_chrome(self, df, tmp_path):
+        with tracing.trace(tracing.ChromeExporter(tmp_path / 'trace.json')) as tracer:
+            render(df)
+        events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+        assert len(events) == len(tracer.spans)
+        assert events[0]['name'] == 'deck' and {_['ph'] for _ in events} == {'X'}
+        assert [_['ts'] for _ in events] == sorted(_['ts'] for _ in events)
+        deck = events[0]
+        assert all(deck['ts'] <= _['ts'] and _['ts'] + _['dur'] <= deck['ts'] + deck['dur'] for _ in events)
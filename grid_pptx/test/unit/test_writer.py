@@ -0,0 +1,139 @@
+import io
+import zipfile
+
+import pytest
+import pandas as pd
+
+from pptx import Presentation
+
+from grid_pptx import GridPresentation, Row, Column
+from grid_pptx.components import Text, ColumnChart
+
+
+@pytest.fixture
+def main_df():
+    return pd.DataFrame({'a': [1, 2, 3], 'b': [9, 8, 7], 'c': [7, 3, 3]})
+
+
+def build_deck(p, main_df, n_slides=3):
+    gridslides = []
+    for i in range(n_slides):
+        design = Row(12,
+                     Column(6, Text(text=f'slide {i}')),
+                     Column(6, ColumnChart(df=main_df * i, title='chart title')))
+        gridslides.append(p.add_slide(layout_num=5, design=design, title=f'title {i}'))
+    return gridslides
+
+
+class TestStreamingWriter:
+    def test_matches_regular_save(self, main_df):
+        expected = io.BytesIO()
+        p = GridPresentation()
+        build_deck(p, main_df)
+        p.prs.save(expected)  # python-pptx's own writer
+
+        streamed = io.BytesIO()
+        p = GridPresentation(stream=streamed)
+        build_deck(p, main_df)
+        p.save()
+
+        with zipfile.ZipFile(expected) as a, zipfile.ZipFile(streamed) as b:
+            assert sorted(a.namelist()) == sorted(b.namelist())
+            for name in a.namelist():
+                if name.endswith('.xml') or name.endswith('.rels'):
+                    assert a.read(name) == b.read(name), name
+
+        prs = Presentation(streamed)
+        assert [_.shapes.title.text for _ in prs.slides] == ['title 0', 'title 1', 'title 2']
+
+    def test_slide_released(self, main_df):
+        p = GridPresentation(stream=io.BytesIO())
+        gridslide, = build_deck(p, main_df, n_slides=1)
+        slide_part = gridslide.slide.part
+        assert slide_part._element is None
+        assert 'slide' not in vars(slide_part)
+        # the GridSlide still refers to the Slide proxy, which must not keep the XML alive
+        assert gridslide.slide._element is None
+        assert 'shapes' not in vars(gridslide.slide)
+        p.save()
+
+    def test_dedupe_workbook_written_once(self, main_df):
+        streamed = io.BytesIO()
+        p = GridPresentation(stream=streamed, workbook='dedupe')
+        for _ in range(3):
+            p.add_slide(layout_num=5, design=Row(12, ColumnChart(df=main_df, title='chart title')))
+        p.save()
+
+        with zipfile.ZipFile(streamed) as z:
+            names = z.namelist()
+        assert len([_ for _ in names if _.endswith('.xlsx')]) == 1
+        assert len(names) == len(set(names))
+
+
+class TestCompression:
+    def members(self, blob):
+        with zipfile.ZipFile(io.BytesIO(blob)) as z:
+            assert z.testzip() is None
+            return {_.filename: (_.compress_type, z.read(_)) for _ in z.infolist()}
+
+    @pytest.fixture
+    def deck(self, main_df):
+        p = GridPresentation()
+        build_deck(p, main_df)
+        return p
+
+    def test_save_bytes(self, deck):
+        prs = Presentation(io.BytesIO(deck.save_bytes()))
+        assert len(prs.slides) == 3
+
+    def test_stored(self, deck):
+        members = self.members(deck.save_bytes(compression='stored'))
+        assert {compress_type for compress_type, _ in members.values()} == {zipfile.ZIP_STORED}
+
+    def test_level(self, deck):
+        assert len(deck.save_bytes(compresslevel=9)) <= len(deck.save_bytes(compresslevel=1))
+
+    def test_parallel_matches_serial(self, deck):
+        serial = self.members(deck.save_bytes())
+        parallel = self.members(deck.save_bytes(workers=4))
+        assert list(parallel) == list(serial)
+        assert parallel == serial
+
+    def test_parallel_non_seekable(self, deck):
+        class Unseekable(io.RawIOBase):
+            def __init__(self):
+                self.out = io.BytesIO()
+
+            def writable(self):
+                return True
+
+            def write(self, b):
+                return self.out.write(b)
+
+        serial = self.members(deck.save_bytes())
+        out = Unseekable()
+        deck.save(out, workers=4)
+        assert self.members(out.out.getvalue()) == serial
+
+    def test_presentation_defaults(self, main_df):
+        p = GridPresentation(compression='stored')
+        build_deck(p, main_df)
+        members = self.members(p.save_bytes())
+        assert {compress_type for compress_type, _ in members.values()} == {zipfile.ZIP_STORED}
+
+    def test_invalid_options(self, deck):
+        with pytest.raises(ValueError):
+            deck.save_bytes(compression='bzip2')
+        with pytest.raises(ValueError):
+            deck.save_bytes(compresslevel=12)
+
+    def test_save_bytes_streamed(self):
+        with pytest.raises(ValueError):
+            GridPresentation(stream=io.BytesIO()).save_bytes()
+
+    def test_streamed_parallel(self, main_df):
+        out = io.BytesIO()
+        p = GridPresentation(stream=out, save_workers=4, compresslevel=1)
+        build_deck(p, main_df)
+        p.save()
+        assert len(Presentation(io.BytesIO(out.getvalue())).slides) == 3
@@ -0,0 +1,249 @@
+"""
+Timing spans for the phases of rendering a deck.
+
+Rendering code marks its phases with ``span``: adding each slide, laying out its design, adding each component
+(with attributes such as the chart type and the number of rows, columns and points), preparing chart data, writing
+the chart XML and workbook, and saving. Spans nest: a span opened while another one is open on the same thread is
+its child.
+
+Tracing is off unless a ``trace`` block is active. While it is off, ``span`` returns a shared no-op context manager,
+so an instrumented phase costs one global lookup and one call. Inside ``trace`` every finished span is kept on the
+``Tracer`` and handed to its exporters::
+
+    from grid_pptx import tracing
+
+    with tracing.trace(tracing.ChromeExporter('deck.trace.json'), tracing.JsonLinesExporter('deck.jsonl')):
+        p = GridPresentation()
+        p.add_slide(design=Row(12, chart))
+        p.save('deck.pptx')
+
+``ChromeExporter`` writes the Chrome trace-event format, which chrome://tracing and Perfetto open.
+``JsonLinesExporter`` writes one JSON object per span as it finishes. Slides built in ``add_slides`` worker
+processes are not traced, only the ``add_slides`` span around them.
+"""
+from __future__ import annotations
+from typing import IO, Union
+from contextlib import contextmanager
+from pathlib import Path
+import itertools
+import json
+import os
+import threading
+import time
+
+# the active Tracer, None while tracing is off
+tracer = None
+
+
+class Span:
+    """
+    A timed phase with attributes. Times are ``time.perf_counter_ns`` values, ``end`` is None while the span is open.
+    """
+
+    __slots__ = ('tracer', 'name', 'attributes', 'id', 'parent', 'thread', 'start', 'end')
+
+    def __init__(self, tracer: Tracer, name: str, attributes: dict) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.id = None
+        self.parent = None
+        self.thread = None
+        self.start = None
+        self.end = None
+
+    def __repr__(self) -> str:
+        return f'Span({self.name!r}, {self.attributes!r}, duration={self.duration})'
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __enter__(self) -> Span:
+        self.tracer.open(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.tracer.close(self)
+
+    @property
+    def duration(self) -> float:
+        """ Seconds from the start to the end of the span, None while it is open
+
+        :return:
+        """
+        return None if self.end is None else (self.end - self.start) / 1e9
+
+    def set(self, **attributes) -> None:
+        """ Add attributes to the span, e.g. ones only known once the phase has run
+
+        :param attributes:
+        :return:
+        """
+        self.attributes.update(attributes)
+
+
+class _NullSpan:
+    """
+    What ``span`` returns while tracing is off. It is falsy, so attributes that are costly to compute can be
+    skipped with ``if s: s.set(...)``.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def set(self, **attributes) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **attributes) -> Union[Span, _NullSpan]:
+    """ Context manager timing the phase *name* with the active Tracer, or doing nothing while tracing is off
+
+    :param name:
+    :param attributes: JSON-serializable values describing the phase
+    :return:
+    """
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, attributes)
+
+
+class Tracer:
+
+    def __init__(self, exporters: tuple = ()) -> None:
+        """ Collects finished spans and passes each one to *exporters*
+
+        :param exporters: objects with an ``export(span)`` and a ``close(tracer)`` method, such as JsonLinesExporter \
+                and ChromeExporter
+        """
+        self.exporters = tuple(exporters)
+        self.spans = []  # finished spans, in the order they ended
+        self.start = time.perf_counter_ns()
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.local = threading.local()  # stack of the open spans of each thread
+
+    def open(self, span: Span) -> None:
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        span.id = next(self.ids)
+        span.parent = stack[-1].id if stack else None
+        span.thread = threading.get_ident()
+        stack.append(span)
+        span.start = time.perf_counter_ns()
+
+    def close(self, span: Span) -> None:
+        span.end = time.perf_counter_ns()
+        self.local.stack.pop()
+        with self.lock:
+            self.spans.append(span)
+            for exporter in self.exporters:
+                exporter.export(span)
+
+    def shutdown(self) -> None:
+        """ Let the exporters write out what they have collected
+
+        :return:
+        """
+        for exporter in self.exporters:
+            exporter.close(self)
+
+    def totals(self) -> dict:
+        """ Total seconds spent in the spans of each name
+
+        :return:
+        """
+        totals = {}
+        for _ in self.spans:
+            totals[_.name] = totals.get(_.name, 0) + _.duration
+        return totals
+
+
+@contextmanager
+def trace(*exporters, name: str = 'deck', **attributes) -> Tracer:
+    """ Trace everything rendered in the block under a root span *name*
+
+    :param exporters: see Tracer
+    :param name: name of the root span
+    :param attributes: attributes of the root span
+    :return: the Tracer, whose ``spans`` hold the finished spans
+    """
+    global tracer
+    previous, tracer = tracer, Tracer(exporters)
+    current = tracer
+    try:
+        with Span(current, name, attributes):
+            yield current
+    finally:
+        tracer = previous
+        current.shutdown()
+
+
+def _open(file: Union[str, Path, IO[str]]) -> tuple:
+    """ Text stream for *file* and whether it was opened here (and so is closed by the exporter) """
+    if isinstance(file, (str, os.PathLike)):
+        return open(file, 'w', encoding='utf-8'), True
+    return file, False
+
+
+class JsonLinesExporter:
+
+    def __init__(self, file: Union[str, Path, IO[str]]) -> None:
+        """ Writes each span as a JSON object on its own line when it finishes: name, id, parent id, thread, start
+        (seconds since the trace started), duration (seconds) and attributes
+
+        :param file: path or text file-like object
+        """
+        self.file, self.owned = _open(file)
+
+    def export(self, span: Span) -> None:
+        record = {
+            'name': span.name, 'id': span.id, 'parent': span.parent, 'thread': span.thread,
+            'start': (span.start - span.tracer.start) / 1e9, 'duration': span.duration,
+            'attributes': span.attributes,
+        }
+        self.file.write(json.dumps(record, default=str) + '\n')
+
+    def close(self, tracer: Tracer) -> None:
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+class ChromeExporter:
+
+    def __init__(self, file: Union[str, Path, IO[str]]) -> None:
+        """ Writes the spans as complete ('X') events of the Chrome trace-event format when the trace ends
+
+        :param file: path or text file-like object
+        """
+        self.file = file
+
+    def export(self, span: Span) -> None:
+        pass
+
+    def close(self, tracer: Tracer) -> None:
+        pid = os.getpid()
+        events = [
+            {'name': _.name, 'ph': 'X', 'ts': (_.start - tracer.start) / 1e3, 'dur': (_.end - _.start) / 1e3,
+             'pid': pid, 'tid': _.thread, 'args': _.attributes}
+            for _ in sorted(tracer.spans, key=lambda _: _.start)
+        ]
+        file, owned = _open(self.file)
+        try:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file, default=str)
+        finally:
+            if owned:
+                file.close()
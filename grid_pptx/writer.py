@@ -0,0 +1,238 @@
+"""
+Zip writer for GridPresentation packages.
+
+python-pptx only writes a package when ``Presentation.save`` is called, so every slide, chart and workbook part of a
+deck stays in memory until the end. ``PackageWriter`` can also write a finished slide (with its charts and embedded
+workbooks) straight into the zip file and then drop the parsed XML, leaving only the part's name, content type
+and relationships behind so the rest of the package can still refer to it. The remaining parts, the package
+relationships and ``[Content_Types].xml`` are written by ``close``.
+
+Parts can be stored uncompressed or deflated at any level, and with ``workers > 1`` a batch of parts is deflated
+in a thread pool (zlib releases the GIL while compressing) before being appended to the zip file in order. That
+needs a seekable file, see ``write_deflated``; parts written to other streams are deflated one by one by
+``zipfile``.
+"""
+from __future__ import annotations
+from typing import IO, Union
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+import os
+import time
+import zipfile
+import zlib
+
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.package import OpcPackage, Part, XmlPart
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.spec import default_content_types
+from pptx.shared import PartElementProxy
+
+# relationship types whose target parts belong to a single slide and can be written along with it
+owned_reltypes = {RT.CHART, RT.PACKAGE}
+
+compression_options = {
+    'deflate': zipfile.ZIP_DEFLATED,
+    'stored': zipfile.ZIP_STORED,
+}
+
+# How the Excel workbook behind each chart is stored:
+#   'embed'  -- every chart gets its own embedded workbook (python-pptx default)
+#   'none'   -- no workbook; the chart only carries the cached values in its XML
+#   'dedupe' -- charts with identical data share one workbook part per presentation
+workbook_policies = ('embed', 'none', 'dedupe')
+
+
+class PackageWriter:
+
+    def __init__(self, file: Union[str, Path, IO[bytes]], compression: str = 'deflate', compresslevel: int = None,
+                 workers: int = 1) -> None:
+        """ Zip-format OPC package writer that accepts parts incrementally
+
+        :param file: path or binary file-like object the package is written to
+        :param compression: 'deflate' or 'stored'
+        :param compresslevel: zlib level from 0 (fastest) to 9 (smallest); None uses zlib's default. Only applies \
+                to 'deflate'.
+        :param workers: number of threads used to deflate parts; only used when *file* is a path or seekable
+        """
+        if compression not in compression_options:
+            raise ValueError(f'compression must be one of {tuple(compression_options)}, not {compression!r}.')
+        if compresslevel is not None and not 0 <= compresslevel <= 9:
+            raise ValueError('compresslevel must be between 0 and 9.')
+
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.workers = workers
+
+        self.zipf = zipfile.ZipFile(file, 'w', compression_options[compression], compresslevel=compresslevel)
+        parallel = workers > 1 and compression == 'deflate' and seekable(file)
+        self.executor = ThreadPoolExecutor(workers) if parallel else None
+        self.written = set()
+
+    def write_parts(self, parts: list) -> None:
+        """ Write the blob and relationships of each part in *parts* that has not been written yet
+
+        :param parts:
+        :return:
+        """
+        members = []
+        for part in parts:
+            if part in self.written:
+                continue
+            members.append((part.partname.membername, part.blob))
+            if len(part.rels):
+                members.append((part.partname.rels_uri.membername, part.rels.xml))
+            self.written.add(part)
+
+        if self.executor is None or len(members) < 2:
+            for name, blob in members:
+                self.zipf.writestr(name, blob)
+        else:
+            for (name, blob), (crc, data) in zip(members, self.executor.map(self.deflate, [_ for __, _ in members])):
+                self.write_deflated(name, blob, crc, data)
+
+    def write_slide(self, slide_part: Part) -> None:
+        """ Write a finished slide and the chart and workbook parts it owns, then release their XML
+
+        :param slide_part:
+        :return:
+        """
+        parts = [slide_part]
+        for part in parts:  # grows while iterating, so chart -> workbook relationships are followed too
+            parts.extend(
+                rel.target_part for rel in part.rels.values()
+                if not rel.is_external and rel.reltype in owned_reltypes and rel.target_part not in self.written
+            )
+
+        self.write_parts(parts)
+        for part in parts:
+            release(part)
+
+    def close(self, package: OpcPackage) -> None:
+        """ Write every part not written yet, the package relationships and the content types, then close the zip
+
+        :param package:
+        :return:
+        """
+        parts = list(package.iter_parts())
+        # [Content_Types].xml and the package rels conventionally come first, which is possible if nothing was
+        # streamed yet
+        header = [
+            (CONTENT_TYPES_URI.membername, content_types_xml(parts)),
+            (PACKAGE_URI.rels_uri.membername, package._rels.xml),
+        ]
+
+        if not self.written:
+            for name, blob in header:
+                self.zipf.writestr(name, blob)
+            self.write_parts(parts)
+        else:
+            self.write_parts(parts)
+            for name, blob in header:
+                self.zipf.writestr(name, blob)
+
+        self.zipf.close()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def deflate(self, blob: bytes) -> tuple:
+        """ CRC and raw deflate stream for *blob*, as ``zipfile`` would compute them
+
+        :param blob:
+        :return:
+        """
+        level = zlib.Z_DEFAULT_COMPRESSION if self.compresslevel is None else self.compresslevel
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return zlib.crc32(blob), compressor.compress(blob) + compressor.flush()
+
+    def write_deflated(self, name: str, blob: bytes, crc: int, data: bytes) -> None:
+        """ Append an already deflated member to the zip file.
+
+        ``zipfile`` can only compress data itself, so the local header is written here and the ZipInfo registered
+        with the ZipFile, which then includes it in the central directory on close. The header is written with the
+        sizes and CRC already filled in, which is only possible at the end of a seekable file.
+
+        :param name:
+        :param blob: uncompressed data
+        :param crc:
+        :param data: raw deflate stream of *blob*
+        :return:
+        """
+        zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+        zinfo.file_size = len(blob)
+        zinfo.compress_size = len(data)
+        zinfo.CRC = crc
+
+        zipf = self.zipf
+        zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64=max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT))
+        zipf.fp.write(data)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[name] = zinfo
+
+
+def seekable(file: Union[str, Path, IO[bytes]]) -> bool:
+    """ Whether *file* is a path or a file-like object that can seek
+
+    :param file:
+    :return:
+    """
+    if isinstance(file, (str, os.PathLike)):
+        return True
+    try:
+        return file.seekable()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def release(part: Part) -> None:
+    """ Drop the payload of a part that has already been written.
+
+    The partname, content type and relationships are kept because other parts (and the final [Content_Types].xml)
+    still refer to them. Cached proxies such as ``SlidePart.slide`` hold on to the XML tree as well, so python-pptx's
+    lazyproperty values (stored in the instance ``__dict__`` under their public name) are discarded too, and proxies
+    are emptied in case they are referenced elsewhere.
+
+    :param part:
+    :return:
+    """
+    if isinstance(part, XmlPart):
+        part._element = None
+    else:
+        part._blob = b''
+
+    for name in [_ for _ in vars(part) if not _.startswith('_')]:
+        proxy = part.__dict__.pop(name)
+        # the caller may still hold on to the proxy (e.g. the Slide of a GridSlide), so it lets go of the XML too
+        if isinstance(proxy, PartElementProxy):
+            proxy._element = None
+            for attr in [_ for _ in vars(proxy) if not _.startswith('_')]:
+                del proxy.__dict__[attr]
+
+
+def content_types_xml(parts: list) -> bytes:
+    """ ``[Content_Types].xml`` for *parts*, using the same Default/Override split as python-pptx
+
+    :param parts:
+    :return:
+    """
+    defaults = {'rels': CT.OPC_RELATIONSHIPS, 'xml': CT.XML}
+    overrides = {}
+    for part in parts:
+        ext = part.partname.ext
+        if (ext.lower(), part.content_type) in default_content_types:
+            defaults[ext] = part.content_type
+        else:
+            overrides[part.partname] = part.content_type
+
+    return ''.join([
+        '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n',
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">',
+        *[f'<Default Extension={quoteattr(k)} ContentType={quoteattr(v)}/>' for k, v in sorted(defaults.items())],
+        *[f'<Override PartName={quoteattr(k)} ContentType={quoteattr(v)}/>' for k, v in sorted(overrides.items())],
+        '</Types>',
+    ]).encode('utf-8')